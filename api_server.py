@@ -11,17 +11,24 @@ Fixed entry point with proper prediction routing
 # ---------------------------------------------------------------------------
 CASH4_OBSERVE_ENABLED: bool = False  # TODO(June 9): flip to True
 
-from flask import Flask, request, jsonify
+from flask import Flask, Response, g, request, jsonify
 from flask_cors import CORS
 import hashlib
 import hmac
 import os
 import secrets
+import sqlite3
 import sys
 import json
 import subprocess
+import time
+from bisect import bisect_left
+from collections import OrderedDict
+from contextlib import closing
 from datetime import datetime, timedelta
-from typing import Any, Dict, List
+from functools import wraps
+from threading import Event, Lock, Thread, Timer
+from typing import Any, Dict, List, Set, Tuple
 import logging
 from dotenv import load_dotenv
 import platform
@@ -112,13 +119,249 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Init EV reranker after logger is ready
-_EV_RERANKER = _init_ev_reranker()
+# ---------------------------------------------------------------------------
+# Subsystem readiness — heavy state (EV reranker history, pick engine, due
+# signals, celestial fingerprints) is loaded lazily on first use or by a
+# background warm-up thread instead of at import, so gunicorn boots and
+# restarts workers quickly.  /ready reports per-subsystem status and timings.
+#   STARTUP_WARMUP=background (default) — load everything in a daemon thread
+#   STARTUP_WARMUP=eager                — load synchronously at import
+#   STARTUP_WARMUP=lazy                 — load only when first needed
+# ---------------------------------------------------------------------------
+_STARTUP_WARMUP = os.getenv("STARTUP_WARMUP", "background").strip().lower()
+
+_SUBSYSTEM_LOADERS: Dict[str, Any] = {}
+# name -> {"state": pending|loading|ready|failed, "seconds", "error", "loaded_at"}
+_subsystem_status: Dict[str, Dict[str, Any]] = {}
+_subsystem_values: Dict[str, Any] = {}
+_SUBSYSTEM_LOCKS: Dict[str, Any] = {}
+_SUBSYSTEM_STATUS_LOCK = Lock()
+
+
+def _register_subsystem(name: str, loader) -> None:
+    _SUBSYSTEM_LOADERS[name] = loader
+    _SUBSYSTEM_LOCKS[name] = Lock()
+    _subsystem_status[name] = {"state": "pending", "seconds": None,
+                               "error": None, "loaded_at": None}
+
+
+def _load_subsystem(name: str) -> Any:
+    """Load a registered subsystem once (thread-safe) and return its value."""
+    if _subsystem_status[name]["state"] in ("ready", "failed"):
+        return _subsystem_values.get(name)
+    with _SUBSYSTEM_LOCKS[name]:
+        if _subsystem_status[name]["state"] in ("ready", "failed"):
+            return _subsystem_values.get(name)
+        with _SUBSYSTEM_STATUS_LOCK:
+            _subsystem_status[name]["state"] = "loading"
+        t0 = time.perf_counter()
+        try:
+            value, state, error = _SUBSYSTEM_LOADERS[name](), "ready", None
+        except Exception as e:
+            logger.warning(f"[startup] {name} failed to load: {e}", exc_info=True)
+            value, state, error = None, "failed", str(e)
+        _subsystem_values[name] = value
+        with _SUBSYSTEM_STATUS_LOCK:
+            _subsystem_status[name].update({
+                "state":     state,
+                "seconds":   round(time.perf_counter() - t0, 3),
+                "error":     error,
+                "loaded_at": datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
+            })
+        logger.info(f"[startup] {name} {state} in {_subsystem_status[name]['seconds']}s")
+        return value
+
+
+def _load_all_subsystems() -> None:
+    for name in list(_SUBSYSTEM_LOADERS):
+        _load_subsystem(name)
+
+
+def _start_subsystem_warmup() -> None:
+    """Apply STARTUP_WARMUP once the loaders are registered."""
+    if _STARTUP_WARMUP == "eager":
+        _load_all_subsystems()
+    elif _STARTUP_WARMUP != "lazy":
+        Thread(target=_load_all_subsystems, name="startup-warmup", daemon=True).start()
+
+
+def _get_ev_reranker():
+    """EV reranker (OBSERVE_ONLY), built from on-disk history on first use."""
+    return _load_subsystem("ev_reranker")
+
+
+_register_subsystem("ev_reranker", _init_ev_reranker)
 
 # Initialize Flask app
 app = Flask(__name__)
 CORS(app)
 
+# ── Metrics ──────────────────────────────────────────────────────────────────
+# Request latency per route and named prediction-stage timings, kept as
+# cumulative histograms in process memory and served by /api/metrics in the
+# Prometheus text format.  Stages nest: model_build includes the engine's
+# signal_family and near_miss steps.
+# Under gunicorn a scrape lands on any worker, so each process also writes its
+# cumulative counts (at most every METRICS_FLUSH_INTERVAL seconds) to a small
+# SQLite file, one row set per process, and /api/metrics sums every process's
+# rows.  Totals therefore only grow across scrapes (a restarted worker gets a
+# new process key; its predecessor's rows stay in the sum).  If the file
+# cannot be opened the endpoint reports this process alone, labelled by pid.
+_METRIC_BUCKETS: Tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+)
+# labels tuple -> {"buckets": per-bucket counts (+Inf last), "sum", "count"}
+_route_latency: Dict[tuple, Dict[str, Any]] = {}
+_stage_latency: Dict[tuple, Dict[str, Any]] = {}
+_METRICS_LOCK = Lock()
+_METRICS_DB_PATH = os.getenv("METRICS_DB", os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "jackpot_system_v3", "data", "metrics.sqlite3"
+))
+_METRICS_FLUSH_INTERVAL = float(os.getenv("METRICS_FLUSH_INTERVAL", "5"))
+_metrics_flushed_at = 0.0
+_metrics_process: "Tuple[int, str] | None" = None
+
+
+def _init_metrics_db() -> bool:
+    try:
+        os.makedirs(os.path.dirname(_METRICS_DB_PATH), exist_ok=True)
+        with closing(sqlite3.connect(_METRICS_DB_PATH, timeout=5)) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS histograms ("
+                " process TEXT NOT NULL,"
+                " series  TEXT NOT NULL,"
+                " labels  TEXT NOT NULL,"
+                " buckets TEXT NOT NULL,"
+                " total   REAL NOT NULL,"
+                " count   INTEGER NOT NULL,"
+                " PRIMARY KEY (process, series, labels))"
+            )
+        return True
+    except (sqlite3.Error, OSError) as e:
+        logger.warning(f"[metrics] {_METRICS_DB_PATH} unavailable — per-process metrics only: {e}")
+        return False
+
+
+_METRICS_DB_OK = _init_metrics_db()
+
+
+def _observe(series: Dict[tuple, Dict[str, Any]], labels: tuple, seconds: float) -> None:
+    with _METRICS_LOCK:
+        row = series.get(labels)
+        if row is None:
+            row = series[labels] = {"buckets": [0] * (len(_METRIC_BUCKETS) + 1),
+                                    "sum": 0.0, "count": 0}
+        row["buckets"][bisect_left(_METRIC_BUCKETS, seconds)] += 1
+        row["sum"] += seconds
+        row["count"] += 1
+
+
+def _observe_stage(stage: str, seconds: float) -> None:
+    """Record one timing of a named prediction stage."""
+    _observe(_stage_latency, (stage,), seconds)
+
+
+def _metrics_process_key() -> str:
+    """Unique per process (pid + start time), recomputed after a fork."""
+    global _metrics_process
+    pid = os.getpid()
+    if _metrics_process is None or _metrics_process[0] != pid:
+        _metrics_process = (pid, f"{pid}-{time.time_ns()}")
+    return _metrics_process[1]
+
+
+def _flush_metrics(force: bool = False) -> None:
+    """Write this process's cumulative histograms to the shared metrics file."""
+    global _metrics_flushed_at
+    now = time.monotonic()
+    if not _METRICS_DB_OK or (not force and now - _metrics_flushed_at < _METRICS_FLUSH_INTERVAL):
+        return
+    _metrics_flushed_at = now
+    process = _metrics_process_key()
+    with _METRICS_LOCK:
+        rows = [
+            (process, series_name, json.dumps(list(labels)), json.dumps(row["buckets"]),
+             row["sum"], row["count"])
+            for series_name, series in (("route", _route_latency), ("stage", _stage_latency))
+            for labels, row in series.items()
+        ]
+    if not rows:
+        return
+    try:
+        with closing(sqlite3.connect(_METRICS_DB_PATH, timeout=5)) as conn, conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO histograms (process, series, labels, buckets, total, count)"
+                " VALUES (?, ?, ?, ?, ?, ?)", rows,
+            )
+    except sqlite3.Error as e:
+        logger.warning(f"[metrics] flush failed (non-fatal): {e}")
+
+
+def _collect_metrics() -> "Dict[str, Dict[tuple, Dict[str, Any]]] | None":
+    """Histograms summed over every process in the shared file; None if unavailable."""
+    if not _METRICS_DB_OK:
+        return None
+    _flush_metrics(force=True)
+    try:
+        with closing(sqlite3.connect(_METRICS_DB_PATH, timeout=5)) as conn:
+            rows = conn.execute(
+                "SELECT series, labels, buckets, total, count FROM histograms"
+            ).fetchall()
+    except sqlite3.Error as e:
+        logger.warning(f"[metrics] read failed: {e}")
+        return None
+    merged: Dict[str, Dict[tuple, Dict[str, Any]]] = {"route": {}, "stage": {}}
+    for series_name, labels, buckets, total, count in rows:
+        row = merged.setdefault(series_name, {}).setdefault(
+            tuple(json.loads(labels)),
+            {"buckets": [0] * (len(_METRIC_BUCKETS) + 1), "sum": 0.0, "count": 0},
+        )
+        row["buckets"] = [a + b for a, b in zip(row["buckets"], json.loads(buckets))]
+        row["sum"] += total
+        row["count"] += count
+    return merged
+
+
+@app.before_request
+def _start_request_timer() -> None:
+    g._metrics_started = time.perf_counter()
+
+
+@app.after_request
+def _record_request_latency(response):
+    started = g.pop("_metrics_started", None)
+    if started is not None:
+        route = request.url_rule.rule if request.url_rule is not None else "<unmatched>"
+        _observe(_route_latency, (request.method, route, str(response.status_code)),
+                 time.perf_counter() - started)
+        _flush_metrics()
+    return response
+
+
+def _escape_label(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _render_histogram(name: str, help_text: str, label_names: Tuple[str, ...],
+                      series: Dict[tuple, Dict[str, Any]],
+                      extra_labels: Tuple[Tuple[str, Any], ...] = ()) -> List[str]:
+    with _METRICS_LOCK:
+        rows = [(labels, list(row["buckets"]), row["sum"], row["count"])
+                for labels, row in series.items()]
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+    for labels, buckets, total, count in sorted(rows):
+        label_str = ",".join(f'{k}="{_escape_label(v)}"'
+                             for k, v in (*zip(label_names, labels), *extra_labels))
+        cumulative = 0
+        for le, n in zip(_METRIC_BUCKETS, buckets):
+            cumulative += n
+            lines.append(f'{name}_bucket{{{label_str},le="{le}"}} {cumulative}')
+        lines.append(f'{name}_bucket{{{label_str},le="+Inf"}} {count}')
+        lines.append(f"{name}_sum{{{label_str}}} {total:.6f}")
+        lines.append(f"{name}_count{{{label_str}}} {count}")
+    return lines
+
 # Add project root to path
 PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, PROJECT_ROOT)
@@ -155,13 +398,389 @@ _PREDICTION_GATE_DISABLED = os.getenv("DISABLE_PREDICTION_GATE", "").strip().low
     "1", "true", "yes", "on"
 }
 
-# Runtime-injected draw results (survive until next redeploy).
-# Key: e.g. "cash3_eve" — Value: list of normalized draw dicts
+# Jackpot line selection: "sample" = random candidate pool filtered by the
+# secondary optimizer; "search" = branch-and-bound top-N (bounded quality,
+# predictable time).  See jackpot_secondary_optimizer.search_top_combinations.
+_JACKPOT_SEARCH_MODE = os.getenv("JACKPOT_SEARCH_MODE", "sample").strip().lower()
+
+# Runtime-injected draw results.  Cash draws are also written to the session
+# JSON files; jackpot draws have no file and persist in the shared draw log.
+# Key: e.g. "cash3_eve" — Value: list of normalized draw dicts.  Every ingest
+# key exists up front so readers iterating it never see the dict resize.
 _ga_extra_entries: Dict[str, List] = {
     "cash3_mid": [], "cash3_eve": [], "cash3_night": [],
     "cash4_mid": [], "cash4_eve": [], "cash4_night": [],
+    "jackpot_powerball": [], "jackpot_megamillions": [],
+    "jackpot_millionaireforlife": [], "jackpot_cash4life": [],
 }
 
+# ── Data version ────────────────────────────────────────────────────────────
+# Per-process counter bumped whenever this worker's draw data changes (an
+# ingest it handled, or draws it applied from the shared log below).  Derived
+# caches (celestial fingerprints, etc.) remember the version they were built
+# against and rebuild lazily on the next read once it moves.  The last shared
+# log row applied is tracked separately in _DRAW_LOG_SEQ and never advanced
+# by a local bump; _data_version_key() combines the two for cache keys.
+_DATA_VERSION: int = 0
+_DRAW_LOG_SEQ: int = 0
+_DATA_VERSION_LOCK = Lock()
+
+
+def _data_version_key() -> Tuple[int, int]:
+    return _DRAW_LOG_SEQ, _DATA_VERSION
+
+
+def _bump_data_version() -> int:
+    """Advance the draw-data version so every derived cache is rebuilt."""
+    global _DATA_VERSION
+    with _DATA_VERSION_LOCK:
+        _DATA_VERSION += 1
+        version = _DATA_VERSION
+    _invalidate_prediction_cache()
+    try:
+        from jackpot_system_v3.core.triple_due_signal import clear_signal_cache
+        clear_signal_cache()
+    except Exception as e:
+        logger.warning(f"[data_version] due-signal cache clear failed: {e}")
+    return version
+
+
+# ── Shared draw log ─────────────────────────────────────────────────────────
+# _ga_extra_entries is per process, so under several gunicorn workers an
+# ingest used to be visible only in the worker that handled it.  Every
+# ingested draw is also appended to a small SQLite file shared by the workers
+# on the host.  A worker compares the log's AUTOINCREMENT sequence with the
+# last one it applied, pulls only the newer rows into _ga_extra_entries,
+# invalidates its derived caches and schedules a warm-up.  The check runs at
+# most once per DRAW_LOG_SYNC_INTERVAL seconds and never for the probe and
+# metrics routes; ingests sync directly.
+# Cash rows are deleted again in the same transaction once their session file
+# is written (the file is then the source of truth), so the table only holds
+# jackpot draws and cash draws whose file write failed.  The sequence still
+# advances, which is what tells the other workers to reload.  If the file
+# cannot be opened the per-process counter is used alone.
+_DRAW_LOG_PATH = os.getenv(
+    "DRAW_STATE_DB", os.path.join(JACKPOT_SYSTEM_DIR, "data", "draw_state.sqlite3")
+)
+_DRAW_SYNC_INTERVAL = float(os.getenv("DRAW_LOG_SYNC_INTERVAL", "1"))
+_DRAW_SYNC_SKIP_ENDPOINTS = {"health", "ready", "metrics"}
+_DRAW_SYNC_LOCK = Lock()
+_draw_sync_checked_at = 0.0
+
+
+def _draw_log_connect() -> sqlite3.Connection:
+    # A fresh connection per call: cheap, thread-safe and never inherited
+    # across a gunicorn fork.
+    return sqlite3.connect(_DRAW_LOG_PATH, timeout=5)
+
+
+def _init_draw_log() -> bool:
+    try:
+        os.makedirs(os.path.dirname(_DRAW_LOG_PATH), exist_ok=True)
+        with closing(_draw_log_connect()) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS draws ("
+                " seq       INTEGER PRIMARY KEY AUTOINCREMENT,"
+                " cache_key TEXT NOT NULL,"
+                " draw_date TEXT NOT NULL,"
+                " entry     TEXT NOT NULL,"
+                " UNIQUE (cache_key, draw_date))"
+            )
+        return True
+    except (sqlite3.Error, OSError) as e:
+        logger.warning(f"[draw_log] {_DRAW_LOG_PATH} unavailable — per-worker state only: {e}")
+        return False
+
+
+_DRAW_LOG_OK = _init_draw_log()
+
+
+def _append_shared_draws(rows: List[Tuple[str, Dict]],
+                         persisted: Set[str] = frozenset()) -> bool:
+    """
+    Append (cache_key, entry) rows to the shared log in one transaction,
+    dropping those whose cache_key is in persisted (already in its file).
+    """
+    if not _DRAW_LOG_OK or not rows:
+        return False
+    try:
+        with closing(_draw_log_connect()) as conn, conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO draws (cache_key, draw_date, entry) VALUES (?, ?, ?)",
+                [(key, entry["draw_date"], json.dumps(entry)) for key, entry in rows],
+            )
+            conn.executemany(
+                "DELETE FROM draws WHERE cache_key = ? AND draw_date = ?",
+                [(key, entry["draw_date"]) for key, entry in rows if key in persisted],
+            )
+        return True
+    except sqlite3.Error as e:
+        logger.warning(f"[draw_log] append failed (non-fatal): {e}")
+        return False
+
+
+def _prune_shared_draws() -> int:
+    """Delete logged cash draws that are already in their session file."""
+    if not _DRAW_LOG_OK:
+        return 0
+    ga_dir = os.path.join(JACKPOT_SYSTEM_DIR, "data", "ga_results")
+    try:
+        with closing(_draw_log_connect()) as conn, conn:
+            logged = conn.execute(
+                "SELECT cache_key, draw_date FROM draws WHERE cache_key IN (%s)"
+                % ",".join("?" * len(_INGEST_FILE_MAP)),
+                list(_INGEST_FILE_MAP),
+            ).fetchall()
+            stale = []
+            for key in {k for k, _ in logged}:
+                try:
+                    with open(os.path.join(ga_dir, _INGEST_FILE_MAP[key]), "r",
+                              encoding="utf-8") as f:
+                        on_disk = {r.get("draw_date") or r.get("date", "") for r in json.load(f)}
+                except (OSError, ValueError):
+                    continue
+                stale.extend((k, d) for k, d in logged if k == key and d in on_disk)
+            conn.executemany(
+                "DELETE FROM draws WHERE cache_key = ? AND draw_date = ?", stale
+            )
+    except sqlite3.Error as e:
+        logger.warning(f"[draw_log] prune failed (non-fatal): {e}")
+        return 0
+    if stale:
+        logger.info(f"[draw_log] pruned {len(stale)} draw(s) already in session files")
+    return len(stale)
+
+
+def _sync_shared_draws(warm: bool = True) -> int:
+    """
+    Apply draws any worker logged after _DRAW_LOG_SEQ; returns how many were
+    new to this worker.  warm=False leaves the warm-up to the caller.
+    """
+    global _DRAW_LOG_SEQ
+    if not _DRAW_LOG_OK:
+        return 0
+    try:
+        with closing(_draw_log_connect()) as conn:
+            # sqlite_sequence, not MAX(seq): pruning may delete the newest row
+            row = conn.execute(
+                "SELECT seq FROM sqlite_sequence WHERE name = 'draws'"
+            ).fetchone()
+            latest = row[0] if row else 0
+            if latest <= _DRAW_LOG_SEQ:
+                return 0
+            with _DRAW_SYNC_LOCK:
+                rows = conn.execute(
+                    "SELECT seq, cache_key, entry FROM draws WHERE seq > ? ORDER BY seq",
+                    (_DRAW_LOG_SEQ,),
+                ).fetchall()
+                applied = 0
+                for _seq, key, raw in rows:
+                    entry = json.loads(raw)
+                    bucket = _ga_extra_entries.setdefault(key, [])
+                    if entry["draw_date"] not in {e["draw_date"] for e in bucket}:
+                        bucket.append(entry)
+                        applied += 1
+                if latest <= _DRAW_LOG_SEQ:
+                    return 0
+                _DRAW_LOG_SEQ = max(latest, rows[-1][0] if rows else 0)
+    except sqlite3.Error as e:
+        logger.warning(f"[draw_log] sync failed (non-fatal): {e}")
+        return 0
+    # The sequence moved even if every new row was pruned: the session files
+    # changed, so the derived caches are stale either way.
+    version = _bump_data_version()
+    logger.info(f"[draw_log] applied {applied} draw(s) up to log seq "
+                f"{_DRAW_LOG_SEQ} → data v{version}")
+    if warm and _WARM_ON_INGEST:
+        _schedule_warm_cache("draw-log")
+    return applied
+
+
+@app.before_request
+def _sync_draws_before_request() -> None:
+    global _draw_sync_checked_at
+    if request.endpoint in _DRAW_SYNC_SKIP_ENDPOINTS:
+        return
+    now = time.monotonic()
+    if now - _draw_sync_checked_at < _DRAW_SYNC_INTERVAL:
+        return
+    _draw_sync_checked_at = now
+    _sync_shared_draws()
+
+
+def _invalidate_mmfsn_profiles(paths: "List[str] | None" = None) -> None:
+    """
+    Drop cached MMFSN profiles after a write or delete.  The pick engine
+    loads mmfsn_v3 as core.mmfsn_v3 and the routes as
+    jackpot_system_v3.core.mmfsn_v3, so both registries are cleared.
+    """
+    for mod_name in ("jackpot_system_v3.core.mmfsn_v3", "core.mmfsn_v3"):
+        mod = sys.modules.get(mod_name)
+        if mod is not None:
+            mod.invalidate_mmfsn_profiles(paths)
+
+# ── Single-flight ───────────────────────────────────────────────────────────
+# Concurrent identical requests (same cache key) wait on the first caller's
+# computation instead of each running it: a dashboard load or the first hits
+# after an ingest collapse to one engine run per key.  The leader's exception
+# is re-raised in every waiter; waiters give up after SINGLE_FLIGHT_TIMEOUT
+# seconds with TimeoutError.
+_SINGLE_FLIGHT_TIMEOUT = float(os.getenv("SINGLE_FLIGHT_TIMEOUT", "30"))
+
+
+class _Flight:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = Event()
+        self.result: Any = None
+        self.error: "BaseException | None" = None
+
+
+_inflight: Dict[tuple, _Flight] = {}
+_INFLIGHT_LOCK = Lock()
+
+
+def _single_flight(key: tuple, compute, timeout: "float | None" = None):
+    """Run compute() once per key across concurrent callers and share the result."""
+    with _INFLIGHT_LOCK:
+        flight = _inflight.get(key)
+        leader = flight is None
+        if leader:
+            flight = _inflight[key] = _Flight()
+
+    if leader:
+        try:
+            flight.result = compute()
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with _INFLIGHT_LOCK:
+                _inflight.pop(key, None)
+            flight.done.set()
+
+    if not flight.done.wait(_SINGLE_FLIGHT_TIMEOUT if timeout is None else timeout):
+        raise TimeoutError(f"timed out waiting for in-flight computation of {key[0]}")
+    if flight.error is not None:
+        raise flight.error
+    return flight.result
+
+
+def _busy_response(e: Exception):
+    """503 for a request that timed out waiting on a shared computation."""
+    logger.warning(f"[single_flight] {e}")
+    resp = jsonify({"success": False, "error": "Busy — result still computing, retry shortly"})
+    resp.status_code = 503
+    resp.headers["Retry-After"] = "1"
+    return resp
+
+
+# ── Shared response cache ───────────────────────────────────────────────────
+# Signal endpoints that depend only on the date and the draw data (not on the
+# caller) are computed at most once per (route, query, day, data version).
+# The whole store is dropped when the day or the data version moves, so an
+# ingest invalidates it without touching every entry.  Keys use only the query
+# parameters each route declares (others cannot change its response), and
+# the store evicts least-recently-used entries, so junk query strings can
+# neither multiply entries nor lock legitimate ones out.
+_SHARED_CACHE_MAX_AGE = int(os.getenv("SHARED_CACHE_MAX_AGE", "60"))
+_SHARED_CACHE_MAX     = 1024
+# {"scope": (YYYY-MM-DD, data version) | None, "entries": OrderedDict{key: (etag, body)}}
+_shared_responses: Dict[str, Any] = {"scope": None, "entries": OrderedDict()}
+_SHARED_CACHE_LOCK = Lock()
+
+
+def _etag_response(etag: str, body: bytes, cache_control: str = "private, no-cache"):
+    """JSON response with a strong ETag; 304 when the client already has it."""
+    # If-None-Match uses weak comparison (RFC 9110 §13.1.2)
+    if request.if_none_match.contains_weak(etag):
+        resp = app.response_class(status=304)
+    else:
+        resp = app.response_class(body, status=200, mimetype="application/json")
+    resp.set_etag(etag)
+    resp.headers["Cache-Control"] = cache_control
+    return resp
+
+
+def _shared_cache_scope() -> tuple:
+    return (datetime.now().strftime("%Y-%m-%d"),) + _data_version_key()
+
+
+def _shared_cache_key(params: Tuple[str, ...]) -> tuple:
+    """Cache key for the current request: path + the route's declared parameters."""
+    return (request.path,
+            tuple((name, tuple(request.args.getlist(name))) for name in params
+                  if name in request.args))
+
+
+def _shared_cache_store(entries: "OrderedDict[tuple, Tuple[str, bytes]]",
+                        key: tuple, value: Tuple[str, bytes]) -> None:
+    """Insert under _SHARED_CACHE_LOCK, evicting least-recently-used entries."""
+    entries[key] = value
+    entries.move_to_end(key)
+    while len(entries) > _SHARED_CACHE_MAX:
+        entries.popitem(last=False)
+
+
+def _shared_cache(*params: str, require_secret: bool = False):
+    """
+    Cache a subscriber-independent GET route's 200 JSON responses.
+
+    Keyed by path + the query parameters in params (the only ones the route
+    reads) and scoped to today's date and the data version.  Responses carry a strong ETag and Cache-Control (private
+    for routes behind X-Prediction-Secret).  With require_secret the check
+    runs before the lookup, so cached bodies never bypass the gate.
+    """
+    cache_control = (
+        f"{'private' if require_secret else 'public'}, max-age={_SHARED_CACHE_MAX_AGE}"
+    )
+
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            if require_secret and not _check_prediction_secret():
+                return fn(*args, **kwargs)      # route answers with its own 403
+            scope = _shared_cache_scope()
+            key = _shared_cache_key(params)
+            with _SHARED_CACHE_LOCK:
+                if _shared_responses["scope"] != scope:
+                    _shared_responses["scope"] = scope
+                    _shared_responses["entries"] = OrderedDict()
+                hit = _shared_responses["entries"].get(key)
+                if hit is not None:
+                    _shared_responses["entries"].move_to_end(key)
+            if hit is not None:
+                return _etag_response(*hit, cache_control=cache_control)
+
+            def compute() -> Tuple["str | None", bytes, int, str]:
+                resp = app.make_response(fn(*args, **kwargs))
+                body = resp.get_data()
+                if resp.status_code != 200 or not resp.is_json:
+                    return None, body, resp.status_code, resp.mimetype
+                payload = resp.get_json(silent=True)
+                if isinstance(payload, dict) and payload.get("success") is False:
+                    return None, body, resp.status_code, resp.mimetype
+                etag = hashlib.sha256(body).hexdigest()[:32]
+                with _SHARED_CACHE_LOCK:
+                    if _shared_responses["scope"] == scope:
+                        _shared_cache_store(_shared_responses["entries"], key, (etag, body))
+                return etag, body, 200, resp.mimetype
+
+            try:
+                etag, body, status, mimetype = _single_flight(("shared", scope) + key, compute)
+            except TimeoutError as e:
+                return _busy_response(e)
+            if etag is None:
+                return app.response_class(body, status=status, mimetype=mimetype)
+            return _etag_response(etag, body, cache_control=cache_control)
+        wrapper.shared_cache_params = params
+        return wrapper
+    return decorator
+
+
 # ── Ingest audit log ────────────────────────────────────────────────────────
 # Persisted to disk at data/ingest_audit.json on every successful ingest.
 # In-memory mirror for fast /api/engine/status reads without a disk round-trip.
@@ -179,8 +798,12 @@ def _load_audit_log() -> None:
         logger.warning(f"[audit] could not load ingest_audit.json: {e}")
 
 def _append_audit_log(game: str, session: str, date_str: str,
-                     winning_number: str, source: str = "ingest") -> None:
-    """Append one entry to the in-memory audit log and persist to disk (best-effort)."""
+                     winning_number: str, source: str = "ingest",
+                     persist: bool = True) -> None:
+    """
+    Append one entry to the in-memory audit log and persist to disk (best-effort).
+    Batch ingests pass persist=False and write the log once at the end.
+    """
     entry = {
         "ingested_at": datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
         "game":           game,
@@ -190,6 +813,12 @@ def _append_audit_log(game: str, session: str, date_str: str,
         "source":         source,
     }
     _ingest_audit_log.append(entry)
+    if persist:
+        _persist_audit_log()
+
+
+def _persist_audit_log() -> None:
+    """Write the in-memory audit log to disk (best-effort)."""
     audit_path = os.path.join(JACKPOT_SYSTEM_DIR, "data", "ingest_audit.json")
     try:
         os.makedirs(os.path.dirname(audit_path), exist_ok=True)
@@ -234,13 +863,31 @@ def _apply_live_strategy_filter(predictions: List[Dict[str, Any]]) -> List[Dict[
     return allowed
 
 
+# Parsed session files plus extras, keyed on the draw-data version and the
+# files' mtimes (offline backfills write them without an ingest).
+_ga_data_cache: Dict[str, Any] = {"key": None, "data": None}
+_GA_DATA_LOCK = Lock()
+
+
 def _load_ga_data_from_json() -> Dict:
     """Load GA historical draw data from JSON files in data/ga_results/"""
+    ga_dir = os.path.join(JACKPOT_SYSTEM_DIR, "data", "ga_results")
+    key = (_data_version_key(),
+           tuple(_file_stamp(os.path.join(ga_dir, name)) for name in _INGEST_FILE_MAP.values()))
+    with _GA_DATA_LOCK:
+        if _ga_data_cache["key"] != key:
+            _ga_data_cache["data"] = _read_ga_data(ga_dir)
+            _ga_data_cache["key"] = key
+        data = _ga_data_cache["data"]
+    # Callers concatenate and sometimes extend these lists; hand out copies.
+    return {k: list(v) for k, v in data.items()}
+
+
+def _read_ga_data(ga_dir: str) -> Dict:
     results = {
         "cash3_mid": [], "cash3_eve": [], "cash3_night": [],
         "cash4_mid": [], "cash4_eve": [], "cash4_night": [],
     }
-    ga_dir = os.path.join(JACKPOT_SYSTEM_DIR, "data", "ga_results")
     if not os.path.exists(ga_dir):
         logger.warning("GA results dir not found — using empty data (fallback random picks)")
         return results
@@ -272,7 +919,10 @@ def _load_ga_data_from_json() -> Dict:
             logger.warning(f"Could not load {filename}: {e}")
 
     # Merge any runtime-injected entries (from /api/results/ingest)
-    for key, extras in _ga_extra_entries.items():
+    # Jackpot draws share the buffer but are not part of the Cash3/4 history
+    for key, extras in list(_ga_extra_entries.items()):
+        if key not in results:
+            continue
         for entry in extras:
             if entry not in results[key]:
                 results[key].append(entry)
@@ -288,9 +938,10 @@ def get_predictions_for_date(date_str: str, kit: str, subscriber: dict = None) -
     Jackpot picks come from a single pooled call so they are not tripled.
     """
     try:
-        from core.pick_engine_v3 import generate_picks_v3
+        from core.pick_engine_v3 import generate_picks_v3, set_stage_observer
         from pathlib import Path
 
+        set_stage_observer(_observe_stage)
         ga_data = _load_ga_data_from_json()
         root    = Path(JACKPOT_SYSTEM_DIR)
 
@@ -301,6 +952,7 @@ def get_predictions_for_date(date_str: str, kit: str, subscriber: dict = None) -
         predictions = []
 
         # ── Session-specific Cash3 / Cash4 picks (EXP-11) ──────────────────
+        _t0 = time.perf_counter()
         for sess in ("MIDDAY", "EVENING", "NIGHT"):
             sess_picks = generate_picks_v3(subscriber, None, ga_data, root, session=sess)
 
@@ -328,6 +980,7 @@ def get_predictions_for_date(date_str: str, kit: str, subscriber: dict = None) -
                                 "session":          sess,
                                 "confidence_score": conf,
                             })
+        _observe_stage("model_build", time.perf_counter() - _t0)
 
         # ── Jackpot picks — optimizer-filtered candidate pool ──────────────
         # Delivery count and grade filter scale with the celestial overlay score.
@@ -348,6 +1001,7 @@ def get_predictions_for_date(date_str: str, kit: str, subscriber: dict = None) -
         }
 
         # Compute overlay score for this date (Night session = jackpot draw time)
+        _t0 = time.perf_counter()
         try:
             import datetime as _dt_jp
             from jackpot_system_v3.core.overlay_engine_v3_7 import compute_overlays as _jp_ov_fn
@@ -359,6 +1013,7 @@ def get_predictions_for_date(date_str: str, kit: str, subscriber: dict = None) -
             logger.warning(f"[jackpot_pool] overlay compute failed: {_jp_ov_err}")
             _jp_dow     = -1
             _jp_overlay = 0.60  # neutral fallback — allows picks but no bonus
+        _observe_stage("overlays", time.perf_counter() - _t0)
 
         # Signal-tier thresholds
         if _jp_overlay >= 0.75:
@@ -373,12 +1028,14 @@ def get_predictions_for_date(date_str: str, kit: str, subscriber: dict = None) -
 
         logger.info(f"[jackpot_pool] overlay={_jp_overlay:.3f} deliver={_JACKPOT_DELIVER_COUNT} grades={_JACKPOT_PASS_GRADES}")
 
+        _t0 = time.perf_counter()
         try:
-            from jackpot_secondary_optimizer import score_combination, resolve_game
+            from jackpot_secondary_optimizer import score_combinations, search_top_combinations
             from jackpot_system_v3.core.pick_engine_v3 import (
                 generate_megamillions_picks,
                 generate_powerball_picks,
                 generate_millionaire_for_life_picks,
+                _get_jackpot_history,
             )
             _jp_game_fns = {
                 "MegaMillions":         (generate_megamillions_picks,           "MegaMillions"),
@@ -395,17 +1052,40 @@ def get_predictions_for_date(date_str: str, kit: str, subscriber: dict = None) -
                     logger.info(f"[jackpot_pool] {jp_game}: skipped — overlay {_jp_overlay:.3f} below 0.70 threshold")
                     continue
                 _pool_size = _JACKPOT_POOL_SIZES.get(jp_game, 50)
-                _candidates = jp_fn(_pool_size, root=root)
-                _scored = []
+                # Same subscriber + day + game → same candidate pool
+                _jp_key = f"{subscriber.get('subscriber_id') or subscriber.get('initials', '')}|{date_str}|{jp_game}"
+                _jp_seed = int(hashlib.md5(_jp_key.encode()).hexdigest()[:8], 16)
+                if _JACKPOT_SEARCH_MODE == "search":
+                    _wc, _sc = _get_jackpot_history(root, jp_game)
+                    _found = search_top_combinations(
+                        jp_alias, _JACKPOT_DELIVER_COUNT,
+                        min_grade="A" if _JACKPOT_PASS_GRADES == {"A"} else "B",
+                        seed=_jp_seed, main_weights=_wc, bonus_weights=_sc,
+                    )
+                    _candidates = [
+                        f"{' '.join(f'{m:02d}' for m in _cs.main_numbers)} + {_cs.bonus:02d}"
+                        for _cs in _found
+                    ]
+                    _pool_size = len(_candidates)
+                else:
+                    _candidates = jp_fn(_pool_size, root=root, seed=_jp_seed)
+                _parsed = []
                 for _line in _candidates:
                     try:
                         _parts = _line.split("+")
                         _mains = [int(x) for x in _parts[0].split()]
                         _bonus = int(_parts[1].strip())
-                        _cs = score_combination(jp_alias, _mains, _bonus)
-                        _scored.append((_cs.grade(), _cs.composite_score, _line))
                     except Exception:
                         continue
+                    if _mains:
+                        _parsed.append((_line, _mains, _bonus))
+                _scored = [
+                    (_cs.grade(), _cs.composite_score, _line)
+                    for (_line, _, _), _cs in zip(
+                        _parsed,
+                        score_combinations([(m, b) for _, m, b in _parsed], jp_alias),
+                    )
+                ]
                 # Sort: A before B before C/D, then by score descending within grade
                 _grade_order = {"A": 0, "B": 1, "C": 2, "D": 3}
                 _scored.sort(key=lambda x: (_grade_order.get(x[0], 9), -x[1]))
@@ -440,6 +1120,7 @@ def get_predictions_for_date(date_str: str, kit: str, subscriber: dict = None) -
                                 "kit":              kit,
                                 "confidence_score": None,
                             })
+        _observe_stage("jackpot_pool", time.perf_counter() - _t0)
 
         return predictions
 
@@ -464,6 +1145,58 @@ def health():
     }), 200
 
 
+@app.route('/ready', methods=['GET'])
+def ready():
+    """
+    Readiness probe: 200 once every heavy subsystem has finished loading
+    (a failed subsystem counts as loaded but marks the instance degraded),
+    503 while any is still pending or loading.  With STARTUP_WARMUP=lazy
+    loading is deferred to first use by design, so pending / loading
+    subsystems do not hold readiness back (pending ones are listed under
+    "deferred").  Per-subsystem state and load
+    timings are included either way.
+    """
+    with _SUBSYSTEM_STATUS_LOCK:
+        subsystems = {name: dict(st) for name, st in _subsystem_status.items()}
+    done = {"ready", "failed"} | ({"pending", "loading"} if _STARTUP_WARMUP == "lazy" else set())
+    is_ready = all(st["state"] in done for st in subsystems.values())
+    return jsonify({
+        "ready":         is_ready,
+        "degraded":      any(st["state"] == "failed" for st in subsystems.values()),
+        "deferred":      sorted(n for n, st in subsystems.items() if st["state"] == "pending"
+                                and _STARTUP_WARMUP == "lazy"),
+        "warmup_mode":   _STARTUP_WARMUP,
+        "subsystems":    subsystems,
+        "timestamp":     datetime.now().isoformat(),
+    }), 200 if is_ready else 503
+
+
+@app.route('/api/metrics', methods=['GET'])
+def metrics():
+    """
+    Prometheus text exposition: http_request_duration_seconds per
+    method / route / status and prediction_stage_duration_seconds per stage
+    (model_build, signal_family, near_miss, overlays, jackpot_pool,
+    ev_scoring, near_miss_advice).  Values are summed over every worker
+    process; without the shared metrics file they cover this process only
+    and carry a pid label.
+    """
+    merged = _collect_metrics()
+    if merged is not None:
+        route_series, stage_series, extra = merged["route"], merged["stage"], ()
+    else:
+        route_series, stage_series, extra = _route_latency, _stage_latency, (("pid", os.getpid()),)
+    lines = _render_histogram(
+        "http_request_duration_seconds", "Request latency by route.",
+        ("method", "route", "status"), route_series, extra,
+    ) + _render_histogram(
+        "prediction_stage_duration_seconds", "Prediction pipeline stage latency.",
+        ("stage",), stage_series, extra,
+    )
+    return Response("\n".join(lines) + "\n",
+                    content_type="text/plain; version=0.0.4; charset=utf-8")
+
+
 @app.route('/api/debug', methods=['GET'])
 def debug_info():
     """Debug endpoint to diagnose engine issues"""
@@ -497,12 +1230,12 @@ def debug_info():
 def predict_triples():
     """Get Cash3 (triple) predictions"""
     try:
-        from jackpot_system_v3.core.pick_engine_v3 import _recommended_play, _confidence_ui
+        from jackpot_system_v3.core.pick_engine_v3 import _recommended_play, _confidence_ui, build_play_history
         date_str = request.args.get('date', datetime.now().strftime("%Y-%m-%d"))
         predictions = get_predictions_for_date(date_str, "BOOK3")
         triple_preds = [p for p in predictions if p.get("game") in ["Cash3", "Triples"]]
         _gad = _load_ga_data_from_json()
-        c3_history = [d["winning_numbers"] for d in _gad.get("cash3_mid", []) + _gad.get("cash3_eve", []) + _gad.get("cash3_night", [])]
+        c3_history = build_play_history([d["winning_numbers"] for d in _gad.get("cash3_mid", []) + _gad.get("cash3_eve", []) + _gad.get("cash3_night", [])])
         for p in triple_preds:
             _rp = _recommended_play(p.get("confidence_score") or 0.0, p.get("number", ""), c3_history)
             p["recommended_play"] = _rp
@@ -526,12 +1259,12 @@ def predict_triples():
 def predict_quads():
     """Get Cash4 (quad) predictions"""
     try:
-        from jackpot_system_v3.core.pick_engine_v3 import _recommended_play, _confidence_ui
+        from jackpot_system_v3.core.pick_engine_v3 import _recommended_play, _confidence_ui, build_play_history
         date_str = request.args.get('date', datetime.now().strftime("%Y-%m-%d"))
         predictions = get_predictions_for_date(date_str, "BOOK")
         quad_preds = [p for p in predictions if p.get("game") in ["Cash4", "Quads"]]
         _gad = _load_ga_data_from_json()
-        c4_history = [d["winning_numbers"] for d in _gad.get("cash4_mid", []) + _gad.get("cash4_eve", []) + _gad.get("cash4_night", [])]
+        c4_history = build_play_history([d["winning_numbers"] for d in _gad.get("cash4_mid", []) + _gad.get("cash4_eve", []) + _gad.get("cash4_night", [])])
         for p in quad_preds:
             _rp = _recommended_play(p.get("confidence_score") or 0.0, p.get("number", ""), c4_history)
             p["recommended_play"] = _rp
@@ -590,6 +1323,7 @@ def cash4_straight_rank():
 
 @app.route('/api/triples/due-signal', methods=['GET'])
 @app.route('/api/triples/signal', methods=['GET'])
+@_shared_cache()
 def triples_due_signal():
     """
     Cash3 Triples & Quads Signal — predicts which same-digit numbers (000–999)
@@ -609,6 +1343,7 @@ def triples_due_signal():
 
 @app.route('/api/quads/due-signal', methods=['GET'])
 @app.route('/api/quads/signal', methods=['GET'])
+@_shared_cache()
 def quads_due_signal():
     """
     Cash4 Triples & Quads Signal — predicts which same-digit numbers (0000–9999)
@@ -684,66 +1419,150 @@ _ALIGNMENT_LABELS = {
 }
 
 
-def _celestial_fingerprint(number: str):
+# Fingerprints for every number with history, rebuilt once per data version.
+# {"version": int | None, "fps": {number: fingerprint dict}}
+_celestial_fp_cache: Dict[str, Any] = {"version": None, "fps": {}}
+_CELESTIAL_FP_LOCK = Lock()
+
+
+def _build_celestial_fingerprints() -> Dict[str, dict]:
     """
-    Build dominant celestial fingerprint for a triple/quad from all historical hits.
-    Returns dict: {dominant_moon, dominant_hour, dominant_zodiac, hit_count, game}
-    or None if no history exists.
+    Build the dominant celestial fingerprint for every Cash3/Cash4 number that
+    has at least one historical hit (plus the quad backfill for Cash4).
+    One pass over the draw history; overlays are computed once per draw slot.
     """
     from jackpot_system_v3.core.triple_due_signal import _load_draws
-    from jackpot_system_v3.core.overlay_engine_v3_7 import compute_overlays
+    from jackpot_system_v3.core.overlay_engine_v3_7 import compute_overlays, encode_overlay
     from collections import Counter
 
-    game = 'Cash3' if len(number) == 3 else 'Cash4'
-    draws = _load_draws(game)
-    hits = [d for d in draws if d['number'] == number]
+    hits_by_game: Dict[str, Dict[str, List]] = {'Cash3': {}, 'Cash4': {}}
+    for game, hits_by_num in hits_by_game.items():
+        for d in _load_draws(game):
+            hits_by_num.setdefault(d['number'], []).append((d['date_str'], d['session']))
 
     # Also include backfill for quads
-    if game == 'Cash4':
-        try:
-            bf_path = os.path.join(
-                os.path.dirname(__file__),
-                'jackpot_system_v3', 'data', 'ga_results', 'cash4_quads_historical.json'
-            )
-            with open(bf_path, 'r') as f:
-                backfill = json.load(f)
-            quad_set = {'0000','1111','2222','3333','4444','5555','6666','7777','8888','9999'}
-            for r in backfill:
-                wn = r.get('winning_number') or r.get('number', '')
-                dd = r.get('draw_date') or r.get('date_str', '')
-                sess = (r.get('session') or 'Evening').title()
-                if wn == number and wn in quad_set:
-                    hits.append({'date_str': dd, 'number': wn, 'session': sess})
-        except Exception:
-            pass
+    try:
+        bf_path = os.path.join(
+            os.path.dirname(__file__),
+            'jackpot_system_v3', 'data', 'ga_results', 'cash4_quads_historical.json'
+        )
+        with open(bf_path, 'r') as f:
+            backfill = json.load(f)
+        quad_set = {'0000','1111','2222','3333','4444','5555','6666','7777','8888','9999'}
+        for r in backfill:
+            wn = r.get('winning_number') or r.get('number', '')
+            dd = r.get('draw_date') or r.get('date_str', '')
+            sess = (r.get('session') or 'Evening').title()
+            if wn in quad_set:
+                hits_by_game['Cash4'].setdefault(wn, []).append((dd, sess))
+    except Exception:
+        pass
 
-    if not hits:
-        return None
+    slot_cache: Dict[tuple, Any] = {}
 
-    moon_c, hour_c, zodiac_c = Counter(), Counter(), Counter()
-    for h in hits:
-        try:
-            ov = compute_overlays(h['date_str'], h['session'].title())
-            if ov.get('moon_phase'):
-                moon_c[ov['moon_phase']] += 1
-            if ov.get('planetary_hour'):
-                hour_c[ov['planetary_hour']] += 1
-            if ov.get('zodiac_sign'):
-                zodiac_c[ov['zodiac_sign']] += 1
-        except Exception:
-            continue
+    def _slot(date_str, session):
+        key = (date_str, session.title())
+        if key not in slot_cache:
+            try:
+                ov = compute_overlays(key[0], key[1])
+                slot_cache[key] = (ov.get('moon_phase'), ov.get('planetary_hour'), ov.get('zodiac_sign'))
+            except Exception:
+                slot_cache[key] = None
+        return slot_cache[key]
+
+    fps: Dict[str, dict] = {}
+    for game, hits_by_num in hits_by_game.items():
+        for number, hits in hits_by_num.items():
+            # Lookups are keyed by length-derived game, as callers expect
+            if ('Cash3' if len(number) == 3 else 'Cash4') != game:
+                continue
+            moon_c, hour_c, zodiac_c = Counter(), Counter(), Counter()
+            for date_str, session in hits:
+                slot = _slot(date_str, session)
+                if slot is None:
+                    continue
+                moon, hour, zodiac = slot
+                if moon:
+                    moon_c[moon] += 1
+                if hour:
+                    hour_c[hour] += 1
+                if zodiac:
+                    zodiac_c[zodiac] += 1
+
+            dominant_moon   = moon_c.most_common(1)[0][0] if moon_c else None
+            dominant_hour   = hour_c.most_common(1)[0][0] if hour_c else None
+            dominant_zodiac = zodiac_c.most_common(1)[0][0] if zodiac_c else None
+            fps[number] = {
+                'game': game,
+                'number': number,
+                'hit_count': len(hits),
+                'dominant_moon':   dominant_moon,
+                'dominant_hour':   dominant_hour,
+                'dominant_zodiac': dominant_zodiac,
+                'moon_counts':   dict(moon_c.most_common()),
+                'hour_counts':   dict(hour_c.most_common()),
+                'zodiac_counts': dict(zodiac_c.most_common()),
+                # (moon, hour, zodiac) integer codes for matrix scans
+                'codes':         encode_overlay(dominant_moon, dominant_hour, dominant_zodiac),
+                'last_hit_date': max(date_str for date_str, _ in hits),
+            }
+    return fps
 
-    return {
-        'game': game,
-        'number': number,
-        'hit_count': len(hits),
-        'dominant_moon':   moon_c.most_common(1)[0][0] if moon_c else None,
-        'dominant_hour':   hour_c.most_common(1)[0][0] if hour_c else None,
-        'dominant_zodiac': zodiac_c.most_common(1)[0][0] if zodiac_c else None,
-        'moon_counts':   dict(moon_c.most_common()),
-        'hour_counts':   dict(hour_c.most_common()),
-        'zodiac_counts': dict(zodiac_c.most_common()),
-    }
+
+def _get_celestial_fingerprints() -> Dict[str, dict]:
+    """Return the fingerprint table for the current data version, building it if stale."""
+    version = _DATA_VERSION
+    if _celestial_fp_cache["version"] == version:
+        return _celestial_fp_cache["fps"]
+    with _CELESTIAL_FP_LOCK:
+        if _celestial_fp_cache["version"] != version:
+            fps = _build_celestial_fingerprints()
+            _celestial_fp_cache["fps"] = fps
+            _celestial_fp_cache["version"] = version
+            logger.info(f"[celestial] fingerprints built for {len(fps)} numbers (data v{version})")
+        return _celestial_fp_cache["fps"]
+
+
+def _load_pick_engine() -> Dict[str, int]:
+    """
+    Import the pick engine under both module paths and prebuild its read-only
+    tables — per-session base stats and positional frequencies, the Cash4
+    straight-ranking tables and the jackpot histories — so that under a
+    preloading gunicorn master they exist before fork and are shared.
+    """
+    from pathlib import Path
+    import core.pick_engine_v3 as engine          # path used by get_predictions_for_date
+    import jackpot_system_v3.core.pick_engine_v3 as route_engine  # path used by the routes
+    gad = _load_ga_data_from_json()
+    root = Path(JACKPOT_SYSTEM_DIR)
+    for sess in ("MIDDAY", "EVENING", "NIGHT"):
+        engine.generate_picks_v3({"initials": "MBO", "games": ["Cash3", "Cash4"]},
+                                 None, gad, root, session=sess)
+    for sess in route_engine._CASH4_SESSION_FILES:
+        route_engine._cash4_straight_table(sess)
+    for game in ("Powerball", "MegaMillions", "Millionaire For Life"):
+        route_engine._get_jackpot_history(root, game)
+    return {key: len(rows) for key, rows in gad.items()}
+
+
+def _load_due_signals() -> Dict[str, int]:
+    """Import triple_due_signal and load its persisted pool scores."""
+    from jackpot_system_v3.core.triple_due_signal import _get_pool_scores
+    return {game: len(_get_pool_scores(game)) for game in ("Cash3", "Cash4")}
+
+
+_register_subsystem("pick_engine", _load_pick_engine)
+_register_subsystem("due_signals", _load_due_signals)
+_register_subsystem("celestial_fingerprints", lambda: len(_get_celestial_fingerprints()))
+
+
+def _celestial_fingerprint(number: str):
+    """
+    Dominant celestial fingerprint for a triple/quad from all historical hits.
+    Returns dict: {dominant_moon, dominant_hour, dominant_zodiac, hit_count, game}
+    or None if no history exists.  Served from the per-data-version cache.
+    """
+    return _get_celestial_fingerprints().get(number)
 
 
 def _alignment_score(fp: dict, ov: dict) -> int:
@@ -845,6 +1664,7 @@ def celestial_alignment():
 
 
 @app.route('/api/celestial/hot-windows', methods=['GET'])
+@_shared_cache("days", "game", "min_score")
 def celestial_hot_windows():
     """
     Returns upcoming 2/3 and 3/3 celestial alignment windows for all triples/quads.
@@ -881,8 +1701,8 @@ def celestial_hot_windows():
     }
     """
     try:
-        from jackpot_system_v3.core.overlay_engine_v3_7 import compute_overlays
-        from jackpot_system_v3.core.triple_due_signal import _load_draws, check_number
+        from jackpot_system_v3.core.overlay_engine_v3_7 import overlay_codes_range
+        from jackpot_system_v3.core.triple_due_signal import check_number
 
         days_param  = min(int(request.args.get('days', 30)), 90)
         game_filter = request.args.get('game', 'both').lower()
@@ -897,43 +1717,18 @@ def celestial_hot_windows():
         if game_filter in ('cash4', 'both'):
             numbers += quads
 
-        # Build fingerprints once
+        # Fingerprints (with integer codes and last-hit dates) from the cache
         fps = {}
         for num in numbers:
             fp = _celestial_fingerprint(num)
             if fp:
                 fps[num] = fp
 
-        # Get last hit dates
-        cash3_draws = _load_draws('Cash3')
-        cash4_draws = _load_draws('Cash4')
-
-        # Backfill for quads
-        quad_backfill = []
-        try:
-            bf_path = os.path.join(
-                os.path.dirname(__file__),
-                'jackpot_system_v3', 'data', 'ga_results', 'cash4_quads_historical.json'
-            )
-            with open(bf_path, 'r') as f:
-                quad_backfill = json.load(f)
-        except Exception:
-            pass
-
-        quad_set = set(quads)
-
-        def last_hit_date(num):
-            game = 'Cash3' if len(num) == 3 else 'Cash4'
-            src = cash3_draws if game == 'Cash3' else cash4_draws
-            hits = sorted([d['date_str'] for d in src if d['number'] == num])
-            if game == 'Cash4':
-                for r in quad_backfill:
-                    wn = r.get('winning_number') or r.get('number', '')
-                    dd = r.get('draw_date') or r.get('date_str', '')
-                    if wn == num and wn in quad_set:
-                        hits.append(dd)
-                hits = sorted(hits)
-            return hits[-1] if hits else None
+        last_hit = {
+            num: (fp['last_hit_date'],
+                  datetime.strptime(fp['last_hit_date'], '%Y-%m-%d').date() if fp['last_hit_date'] else None)
+            for num, fp in fps.items()
+        }
 
         # Scan forward
         start = datetime.now().date()
@@ -951,45 +1746,42 @@ def celestial_hot_windows():
             except Exception:
                 pass
 
-        seen = set()  # deduplicate by (number, date, session)
-        for i in range(days_param):
-            d = start + timedelta(days=i)
-            ds = d.strftime('%Y-%m-%d')
-            for sess in sessions:
-                ov = compute_overlays(ds, sess)
-                for num in numbers:
-                    fp = fps.get(num)
-                    if not fp:
-                        continue
-                    score = _alignment_score(fp, ov)
-                    if score < min_score:
-                        continue
-                    key = (num, ds, sess)
-                    if key in seen:
-                        continue
-                    seen.add(key)
-
-                    lhd = last_hit_date(num)
-                    days_since = (d - datetime.strptime(lhd, '%Y-%m-%d').date()).days if lhd else None
-                    perfect_storm = (num in overdue_triples and score >= 2) or (days_since is not None and days_since > 365 and score >= 2)
-
-                    lift_table = _LIFT_CASH3 if fp['game'] == 'Cash3' else _LIFT_CASH4
-                    windows.append({
-                        "number":            num,
-                        "game":              fp['game'],
-                        "date":              ds,
-                        "day_of_week":       d.strftime('%A'),
-                        "session":           sess,
-                        "alignment_score":   score,
-                        "alignment_label":   _ALIGNMENT_LABELS[score],
-                        "lift_multiplier":   lift_table[score],
-                        "moon_phase":        ov.get('moon_phase'),
-                        "planetary_hour":    ov.get('planetary_hour'),
-                        "zodiac_sign":       ov.get('zodiac_sign'),
-                        "days_since_last_hit": days_since,
-                        "last_hit_date":     lhd,
-                        "perfect_storm":     perfect_storm,
-                    })
+        # Alignment matrix: slots × numbers, scored by code equality
+        end = start + timedelta(days=days_param - 1)
+        slots, slot_codes = overlay_codes_range(start, end, sessions)
+        fp_codes = [(num, fps[num]['codes']) for num in numbers if num in fps]
+        for ov, (moon, hour, zodiac) in zip(slots, slot_codes):
+            ds, sess = ov['date'], ov['session']
+            d = None
+            for num, (fp_moon, fp_hour, fp_zodiac) in fp_codes:
+                score = (moon == fp_moon) + (hour == fp_hour) + (zodiac == fp_zodiac)
+                if score < min_score:
+                    continue
+                if d is None:
+                    d = datetime.strptime(ds, '%Y-%m-%d').date()
+
+                fp = fps[num]
+                lhd, lhd_date = last_hit[num]
+                days_since = (d - lhd_date).days if lhd_date else None
+                perfect_storm = (num in overdue_triples and score >= 2) or (days_since is not None and days_since > 365 and score >= 2)
+
+                lift_table = _LIFT_CASH3 if fp['game'] == 'Cash3' else _LIFT_CASH4
+                windows.append({
+                    "number":            num,
+                    "game":              fp['game'],
+                    "date":              ds,
+                    "day_of_week":       d.strftime('%A'),
+                    "session":           sess,
+                    "alignment_score":   score,
+                    "alignment_label":   _ALIGNMENT_LABELS[score],
+                    "lift_multiplier":   lift_table[score],
+                    "moon_phase":        ov.get('moon_phase'),
+                    "planetary_hour":    ov.get('planetary_hour'),
+                    "zodiac_sign":       ov.get('zodiac_sign'),
+                    "days_since_last_hit": days_since,
+                    "last_hit_date":     lhd,
+                    "perfect_storm":     perfect_storm,
+                })
 
         # Sort: perfect storms first, then by alignment score desc, then date
         windows.sort(key=lambda x: (-int(x['perfect_storm']), -x['alignment_score'], x['date']))
@@ -1010,6 +1802,7 @@ def celestial_hot_windows():
 
 
 @app.route('/api/celestial/perfect-storm', methods=['GET'])
+@_shared_cache("date", "session")
 def celestial_perfect_storm():
     """
     Returns numbers that are BOTH statistically gap-due AND in a 2/3+ celestial alignment window today.
@@ -1033,7 +1826,7 @@ def celestial_perfect_storm():
     """
     try:
         from jackpot_system_v3.core.overlay_engine_v3_7 import compute_overlays
-        from jackpot_system_v3.core.triple_due_signal import _load_draws, check_number
+        from jackpot_system_v3.core.triple_due_signal import check_number
 
         date_str = request.args.get('date', datetime.now().strftime('%Y-%m-%d'))
         session  = request.args.get('session', 'Evening').title()
@@ -1044,35 +1837,6 @@ def celestial_perfect_storm():
 
         ov = compute_overlays(date_str, session)
 
-        # Backfill for quads
-        quad_backfill = []
-        try:
-            bf_path = os.path.join(
-                os.path.dirname(__file__),
-                'jackpot_system_v3', 'data', 'ga_results', 'cash4_quads_historical.json'
-            )
-            with open(bf_path, 'r') as f:
-                quad_backfill = json.load(f)
-        except Exception:
-            pass
-
-        cash3_draws = _load_draws('Cash3')
-        cash4_draws = _load_draws('Cash4')
-        quad_set = set(quads)
-
-        def last_hit(num):
-            game = 'Cash3' if len(num) == 3 else 'Cash4'
-            src = cash3_draws if game == 'Cash3' else cash4_draws
-            hits = sorted([d['date_str'] for d in src if d['number'] == num])
-            if game == 'Cash4':
-                for r in quad_backfill:
-                    wn = r.get('winning_number') or r.get('number', '')
-                    dd = r.get('draw_date') or r.get('date_str', '')
-                    if wn == num and wn in quad_set:
-                        hits.append(dd)
-                hits = sorted(hits)
-            return hits[-1] if hits else None
-
         perfect_storms = []
         near_miss = []
         aligned_only = []
@@ -1091,7 +1855,7 @@ def celestial_perfect_storm():
             lift_table = _LIFT_CASH3 if game == 'Cash3' else _LIFT_CASH4
             lift = lift_table[score]
 
-            lhd = last_hit(num)
+            lhd = fp['last_hit_date']
             days_since = (today - datetime.strptime(lhd, '%Y-%m-%d').date()).days if lhd else None
 
             # Get gap/overdue status for triples
@@ -1470,13 +2234,10 @@ def mmfsn_alerts(subscriber_id: str):
         days_param  = min(int(request.args.get('days', 7)), 30)
         sess_filter = request.args.get('session', '').strip().title() or None
 
-        # Load MMFSN profile (try UUID path first, then initials)
+        # Load MMFSN profile by subscriber UUID (in-process registry)
+        from jackpot_system_v3.core.mmfsn_v3 import load_profile_file
         mmfsn_dir = os.path.join(JACKPOT_SYSTEM_DIR, "data", "mmfsn_profiles")
-        profile_path = os.path.join(mmfsn_dir, f"{subscriber_id}_mmfsn.json")
-        profile = None
-        if os.path.exists(profile_path):
-            with open(profile_path, 'r') as f:
-                profile = json.load(f)
+        profile = load_profile_file(os.path.join(mmfsn_dir, f"{subscriber_id}_mmfsn.json"))
 
         if not profile:
             return jsonify({
@@ -1694,6 +2455,7 @@ def _enrich_jackpot_prediction(p: dict, game_key: str) -> None:
 
 
 @app.route('/api/powerball/predict', methods=['GET'])
+@_shared_cache("date", "jackpot_amount")
 def predict_powerball():
     """Get Powerball predictions with EV gate and ball-gap analysis."""
     try:
@@ -1728,6 +2490,7 @@ def predict_powerball():
 
 
 @app.route('/api/megamillions/predict', methods=['GET'])
+@_shared_cache("date", "jackpot_amount")
 def predict_megamillions():
     """Get Mega Millions predictions with EV gate and ball-gap analysis."""
     try:
@@ -1762,6 +2525,7 @@ def predict_megamillions():
 
 
 @app.route('/api/millionaire-for-life/predict', methods=['GET'])
+@_shared_cache("date", "jackpot_amount")
 def predict_millionaire():
     """Get Millionaire For Life predictions with EV gate and ball-gap analysis."""
     try:
@@ -1862,6 +2626,7 @@ def jackpot_score_combination():
 
 
 @app.route('/api/jackpot/prizes', methods=['GET'])
+@_shared_cache("game")
 def jackpot_prizes():
     """
     Return prize tier tables with exact odds and EV contributions.
@@ -2067,15 +2832,23 @@ def subscribers_sync():
                 with open(uuid_path, "w", encoding="utf-8") as f:
                     json.dump(profile_payload, f, indent=2)
                 # Secondary key: initials (backwards compat + pick engine lookup)
+                written = [uuid_path]
                 if initials:
                     init_path = os.path.join(mmfsn_dir, f"{initials}_mmfsn.json")
                     with open(init_path, "w", encoding="utf-8") as f:
                         json.dump(profile_payload, f, indent=2)
+                    written.append(init_path)
+                _invalidate_mmfsn_profiles(written)
                 logger.info(f"MMFSN profile written: uuid={subscriber_id} initials={initials or '(none)'} "
                             f"({len(mmfsn_clean['Cash3'])} Cash3, {len(mmfsn_clean['Cash4'])} Cash4)")
             except Exception as _e:
                 logger.warning(f"MMFSN profile generation failed for {subscriber_id}: {_e}")
 
+        # Record and MMFSN profiles feed generate_predictions; initials profiles
+        # are shared across subscribers, so drop every cached response here
+        # and move the stamp other workers key their caches on.
+        _touch_subscriber_sync_stamp()
+        _invalidate_prediction_cache()
         logger.info(f"Subscriber synced: {subscriber_id} tier={tier}")
         return jsonify({
             "success":       True,
@@ -2088,6 +2861,446 @@ def subscribers_sync():
         return jsonify({"success": False, "error": str(e)}), 500
 
 
+# ── Prediction response cache ───────────────────────────────────────────────
+# generate_predictions is deterministic for (subscriber, date, games, kit,
+# mmfsn payload, straight-ranking session, data version): the subscriber seed
+# is MD5-derived and the jackpot pools are seeded.  Serialized responses are
+# kept with a strong ETag so a frontend refresh costs a lookup (or a 304)
+# instead of an engine run.  _bump_data_version() and /api/subscribers/sync
+# clear the store; the data version in the key covers in-flight requests.
+# A sync only clears the worker that handled it, so the key also carries the
+# subscriber record's stat and a sync stamp file that every sync touches —
+# other workers miss on their next request instead of serving stale picks.
+_PREDICTION_CACHE: "OrderedDict[tuple, Tuple[str, bytes]]" = OrderedDict()
+_PREDICTION_CACHE_MAX = int(os.getenv("PREDICTION_CACHE_MAX", "512"))
+_PREDICTION_CACHE_LOCK = Lock()
+_SUBSCRIBER_SYNC_STAMP = os.path.join(SUBSCRIBERS_DIR, ".last_sync")
+
+
+def _file_stamp(path: str) -> "Tuple[int, int] | None":
+    try:
+        st = os.stat(path)
+        return st.st_mtime_ns, st.st_size
+    except OSError:
+        return None
+
+
+def _touch_subscriber_sync_stamp() -> None:
+    """Record that a sync / prune changed subscriber records or MMFSN profiles."""
+    try:
+        os.makedirs(SUBSCRIBERS_DIR, exist_ok=True)
+        with open(_SUBSCRIBER_SYNC_STAMP, "w", encoding="utf-8") as f:
+            f.write(f"{time.time_ns()}\n")
+    except OSError as e:
+        logger.warning(f"Could not touch subscriber sync stamp (non-fatal): {e}")
+
+
+def _subscriber_cache_stamp(subscriber_id: str) -> tuple:
+    """Prediction-cache key part that moves when the subscriber's inputs change."""
+    return (
+        _file_stamp(os.path.join(SUBSCRIBERS_DIR, f"{subscriber_id}.json")),
+        _file_stamp(_SUBSCRIBER_SYNC_STAMP),
+    )
+
+
+def _invalidate_prediction_cache() -> None:
+    """Drop every cached /api/predictions/generate response."""
+    with _PREDICTION_CACHE_LOCK:
+        _PREDICTION_CACHE.clear()
+
+
+def _prediction_cache_get(key: tuple) -> "Tuple[str, bytes] | None":
+    with _PREDICTION_CACHE_LOCK:
+        hit = _PREDICTION_CACHE.get(key)
+        if hit is not None:
+            _PREDICTION_CACHE.move_to_end(key)
+        return hit
+
+
+def _prediction_cache_put(key: tuple, etag: str, body: bytes) -> None:
+    with _PREDICTION_CACHE_LOCK:
+        _PREDICTION_CACHE[key] = (etag, body)
+        _PREDICTION_CACHE.move_to_end(key)
+        while len(_PREDICTION_CACHE) > _PREDICTION_CACHE_MAX:
+            _PREDICTION_CACHE.popitem(last=False)
+
+
+def _current_straight_session() -> str:
+    """Draw session used for Cash4 straight rankings, from the current ET hour."""
+    _et_hour = (datetime.utcnow().hour - 4) % 24  # rough ET offset
+    if _et_hour < 13:
+        return "midday"
+    elif _et_hour < 20:
+        return "evening"
+    return "night"
+
+
+def _build_predictions_body(
+    subscriber_id: str,
+    date_str: str,
+    requested_games: List[str],
+    requested_kit: "str | None",
+    mmfsn: Dict,
+    straight_session: str,
+) -> bytes:
+    """
+    Run the engine for one /api/predictions/generate request and return the
+    serialized JSON body.  Deterministic for its arguments + data version.
+    """
+    run_id = f"phase2_{date_str}_live"
+    source_system = "prod_live"
+    ev_reranker = _get_ev_reranker()
+
+    # Load persisted subscriber record (written by /api/subscribers/sync)
+    subscriber_record = {"initials": "MBO", "games": ["Cash3", "Cash4"], "tier": "book3"}
+    record_path = os.path.join(SUBSCRIBERS_DIR, f"{subscriber_id}.json")
+    if os.path.exists(record_path):
+        try:
+            with open(record_path, "r", encoding="utf-8") as _f:
+                _rec = json.load(_f)
+            birth = _rec.get("birth_profile") or {}
+            initials = (
+                birth.get("initials")
+                or birth.get("subscriber_initials")
+                or _rec.get("initials")
+                or "MBO"
+            ).upper()
+            subscriber_record = {
+                "initials":     initials,
+                "subscriber_id": subscriber_id,
+                "tier":         (_rec.get("tier") or "bosk").lower(),
+                "games":        ["Cash3", "Cash4"],
+                "birthdate":    birth.get("dob") or birth.get("birth_date") or "",
+                "birthtime":    birth.get("tob") or birth.get("birth_time") or "",
+                "birthplace":   birth.get("pob") or birth.get("birth_place") or "",
+            }
+        except Exception as _e:
+            logger.warning(f"Could not load subscriber record for {subscriber_id}: {_e}")
+
+    tier_to_kit = {"book3": "BOOK3", "book": "BOOK", "bosk": "BOSK"}
+    kit = (requested_kit or tier_to_kit.get(subscriber_record.get("tier"), "BOSK")).upper()
+
+    all_predictions = get_predictions_for_date(date_str, kit, subscriber=subscriber_record)
+
+    # Build game histories for pair-signal detection in _recommended_play
+    from jackpot_system_v3.core.pick_engine_v3 import build_play_history
+    _gad = _load_ga_data_from_json()
+    _c3_hist = build_play_history([d["winning_numbers"] for d in _gad.get("cash3_mid", []) + _gad.get("cash3_eve", []) + _gad.get("cash3_night", [])])
+    _c4_hist = build_play_history([d["winning_numbers"] for d in _gad.get("cash4_mid", []) + _gad.get("cash4_eve", []) + _gad.get("cash4_night", [])])
+
+    # Group by game (and session for Cash3/Cash4), preserving per-pick metadata.
+    # Cash3/Cash4 shape: { "Cash3": { "MIDDAY": [...], "EVENING": [...], "NIGHT": [...] } }
+    # Jackpot shape (unchanged): { "Powerball": [...] }
+    _SESSION_GAMES = {"Cash3", "Cash4", "Triples", "Quads"}
+    grouped: Dict[str, Any] = {}
+    from jackpot_system_v3.core.pick_engine_v3 import (
+        _recommended_play, _confidence_ui, _jackpot_confidence_ui,
+        _box_type,
+        _C4_BOX_PAYOUT, _C3_BOX_PAYOUT,
+        _C4_STRAIGHT_BOX_STRAIGHT_PAYOUT, _C4_STRAIGHT_BOX_BOX_PAYOUT,
+        _C3_STRAIGHT_BOX_STRAIGHT_PAYOUT, _C3_STRAIGHT_BOX_BOX_PAYOUT,
+        _C3_STRAIGHT_PAYOUT, _C4_STRAIGHT_PAYOUT,
+        _C3_PAIR_PAYOUT,
+        _C3_COMBO_PAYOUT, _C3_COMBO_TICKET_COST,
+        _C3_1OFF_STRAIGHT_MATCH_PAYOUT, _C3_1OFF_ONE_DIGIT_PAYOUT,
+        _C3_1OFF_TWO_DIGIT_PAYOUT, _C3_1OFF_THREE_DIGIT_PAYOUT,
+    )
+    _JACKPOT_GAMES = {"Powerball", "Mega Millions", "MegaMillions", "Millionaire For Life"}
+    _ev_seconds = 0.0
+    for p in all_predictions:
+        game = p.get("game", "Unknown")
+        conf = p.get("confidence_score") or 0.0
+        _lane = p.get("lane", "")
+        if game in _JACKPOT_GAMES:
+            _rp = "STRAIGHT"
+            _ui = _jackpot_confidence_ui(game)
+        else:
+            hist = _c3_hist if game in ("Cash3", "Triples") else (_c4_hist if game in ("Cash4", "Quads") else None)
+            _rp = _recommended_play(conf, p.get("number", ""), hist)
+            _ui = _confidence_ui(_rp, _lane, game=game)
+
+        # Keep confidence as likelihood signal and expose play aggression separately.
+        _risk_mode = {
+            "BOX": "conservative",
+            "FRONT_PAIR": "balanced",
+            "BACK_PAIR": "balanced",
+            "STRAIGHT_BOX": "balanced",
+            "STRAIGHT": "aggressive",
+            "STRAIGHT+1OFF": "aggressive",
+        }.get(_rp, "balanced")
+
+        pick_entry = {
+            "number":           p.get("number"),
+            "kit":              p.get("kit"),
+            "lane":             _lane,
+            "session":          p.get("session"),
+            "run_id":           run_id,
+            "source_system":    source_system,
+            "confidence_score": conf,
+            "recommended_play": _rp,
+            "risk_mode":        _risk_mode,
+            "confidence_experimental": True,
+            "confidence_label": _ui["label"],
+            "confidence_color": _ui["color"],
+            "confidence_tier":  _ui["label"],
+            "confidence_description": _ui["description"],
+        }
+
+        if not is_live_recommendation_allowed(
+            game,
+            pick_entry.get("session"),
+            pick_entry.get("confidence_tier"),
+            pick_entry.get("play_type"),
+        ):
+            continue
+
+        pick_entry["strategy_version"] = STRATEGY_VERSION
+        pick_entry["strategy_status"] = "allowed"
+        pick_entry["strategy_reason"] = strategy_reason(
+            game,
+            pick_entry.get("session"),
+            pick_entry.get("confidence_tier"),
+            pick_entry.get("play_type"),
+        )
+
+        # ── Phase 3B: EV Reranker — OBSERVE_ONLY ────────────────────────
+        # Score this pick and attach ev_* fields to the response.
+        # The production gate above still controls exposure; reranker observes only.
+        if ev_reranker is not None and game == "Cash3":
+            _t0 = time.perf_counter()
+            try:
+                from datetime import date as _date
+                _draw_date_str = date_str  # outer scope: YYYY-MM-DD
+                try:
+                    _draw_date = _date.fromisoformat(_draw_date_str)
+                except (ValueError, TypeError):
+                    _draw_date = _date.today()
+                _ev_tier = _score_to_confidence_tier(pick_entry.get("confidence_score") or 0.0)
+                _scored = ev_reranker.score_pick(
+                    game      = game,
+                    play_type = _rp,
+                    session   = (pick_entry.get("session") or "").upper(),
+                    tier      = _ev_tier,
+                    pick      = str(pick_entry.get("number", "")),
+                    draw_date = _draw_date,
+                )
+                _ev_decision, _ev_reason = ev_reranker._decide(_scored)
+                pick_entry["ev_score"]        = _scored["ev_score"]
+                pick_entry["ev_decision"]      = _ev_decision
+                pick_entry["ev_reason"]        = _ev_reason
+                pick_entry["mmfsn_tier"]       = _scored["mmfsn_tier"]
+                pick_entry["production_gate"]  = True
+                pick_entry["production_action"] = "CURRENT_V2_RULE"
+                pick_entry["reranker_mode"]    = EV_RERANKER_MODE
+                # Store component scores so the bulk log section can use real values
+                pick_entry["ev_base_score"]            = _scored.get("base_score", 0.0)
+                pick_entry["ev_overlay_bonus"]         = _scored.get("overlay_bonus", 0.0)
+                pick_entry["ev_night_bonus"]           = _scored.get("night_bonus", 0.0)
+                pick_entry["ev_mmfsn_bonus"]           = _scored.get("mmfsn_bonus", 0.0)
+                pick_entry["ev_recent_signal_bonus"]   = _scored.get("recent_signal_bonus", 0.0)
+                pick_entry["ev_pav_bonus"]             = _scored.get("pav_bonus", 0.0)
+                pick_entry["ev_instability_penalty"]   = _scored.get("instability_penalty", 0.0)
+                pick_entry["ev_overexposure_penalty"]  = _scored.get("overexposure_penalty", 0.0)
+                pick_entry["ev_cold_signal_penalty"]   = _scored.get("cold_signal_penalty", 0.0)
+            except Exception as _ev_err:
+                logger.warning(f"[ev_reranker] score failed for {pick_entry.get('number')}: {_ev_err}")
+            _ev_seconds += time.perf_counter() - _t0
+
+        # Audit transparency fields — present on every pick regardless of EV scoring.
+        # ev_sort_is_advisory=True signals to all consumers that sort order is informational
+        # only; exposure_authority confirms the v2 rule still controls what subscribers see.
+        pick_entry.setdefault("ev_sort_applied",     True)
+        pick_entry.setdefault("ev_sort_is_advisory", True)
+        pick_entry.setdefault("exposure_authority",  "CURRENT_V2_RULE")
+
+        # Inject payout details for all play types
+        _num = p.get("number", "")
+        _is_c4 = game in ("Cash4", "Quads")
+        _is_c3 = game in ("Cash3", "Triples")
+        if _rp in ("BOX", "STRAIGHT_BOX") and (_is_c3 or _is_c4):
+            _bt = _box_type(_num)
+            pick_entry["box_type"] = _bt
+            if _is_c4:
+                pick_entry["box_payout"] = _C4_BOX_PAYOUT.get(_bt)
+                if _rp == "STRAIGHT_BOX":
+                    pick_entry["straight_box_straight_payout"] = _C4_STRAIGHT_BOX_STRAIGHT_PAYOUT.get(_bt)
+                    pick_entry["straight_box_box_payout"] = _C4_STRAIGHT_BOX_BOX_PAYOUT.get(_bt)
+            elif _is_c3:
+                pick_entry["box_payout"] = _C3_BOX_PAYOUT.get(_bt)
+                if _rp == "STRAIGHT_BOX":
+                    pick_entry["straight_box_straight_payout"] = _C3_STRAIGHT_BOX_STRAIGHT_PAYOUT.get(_bt)
+                    pick_entry["straight_box_box_payout"] = _C3_STRAIGHT_BOX_BOX_PAYOUT.get(_bt)
+                # Combo is the "all permutations" upgrade from BOX — always available for Cash3 box plays
+                if _bt in _C3_COMBO_TICKET_COST:
+                    pick_entry["combo_payout"] = _C3_COMBO_PAYOUT
+                    pick_entry["combo_ticket_cost"] = _C3_COMBO_TICKET_COST[_bt]
+        elif _rp == "STRAIGHT" and (_is_c3 or _is_c4):
+            pick_entry["straight_payout"] = _C3_STRAIGHT_PAYOUT if _is_c3 else _C4_STRAIGHT_PAYOUT
+        elif _rp == "STRAIGHT+1OFF" and _is_c3:
+            # 1-Off is a GA Cash3 product; include its payout tiers for all STRAIGHT+1OFF Cash3 picks
+            pick_entry["straight_payout"] = _C3_STRAIGHT_PAYOUT
+            pick_entry["one_off_straight_match_payout"] = _C3_1OFF_STRAIGHT_MATCH_PAYOUT
+            pick_entry["one_off_one_digit_payout"]      = _C3_1OFF_ONE_DIGIT_PAYOUT
+            pick_entry["one_off_two_digit_payout"]      = _C3_1OFF_TWO_DIGIT_PAYOUT
+            pick_entry["one_off_three_digit_payout"]    = _C3_1OFF_THREE_DIGIT_PAYOUT
+        elif _rp in ("FRONT_PAIR", "BACK_PAIR") and _is_c3:
+            pick_entry["pair_payout"] = _C3_PAIR_PAYOUT
+
+        # Option 1 — inject suggested_1off + full straight_rankings for STRAIGHT+1OFF Cash4 picks
+        if _rp == "STRAIGHT+1OFF" and game in ("Cash4", "Quads"):
+            try:
+                from jackpot_system_v3.core.pick_engine_v3 import rank_cash4_straight_orderings as _rank_ord
+                # Session derived from current ET hour (approximate)
+                _sess = straight_session
+                _ord_result = _rank_ord(p.get("number", ""), _sess)
+                if _ord_result.get("valid", True) and _ord_result.get("rankings"):
+                    _rankings = _ord_result["rankings"]
+                    # suggested_1off = highest-ranked ordering that differs from the main pick
+                    _main_num = p.get("number", "")
+                    _alt = next((r for r in _rankings if r["number"] != _main_num), None)
+                    pick_entry["suggested_1off"] = _alt["number"] if _alt else None
+                    pick_entry["suggested_1off_pct"] = _alt["pct"] if _alt else None
+                    pick_entry["straight_rankings"] = _rankings
+                    pick_entry["straight_session"] = _sess
+                    pick_entry["aligned_positions"] = _ord_result.get("aligned_positions")
+            except Exception as _e1off:
+                logger.warning(f"1off ranking failed for {p.get('number')}: {_e1off}")
+
+        # ── Secondary optimizer enrichment for jackpot picks ───────────
+        if game in _JACKPOT_GAMES:
+            try:
+                from jackpot_secondary_optimizer import score_combination, resolve_game
+                _game_key = resolve_game(game)
+                _mains, _bonus = _parse_jackpot_number(p.get("number", ""))
+                if _mains and len(_mains) == 5 and _bonus is not None:
+                    _cs = score_combination(_game_key, _mains, _bonus)
+                    pick_entry["optimizer_score"]    = _cs.composite_score
+                    pick_entry["optimizer_grade"]    = _cs.grade()
+                    pick_entry["field_coverage"]     = _cs.field_coverage
+                    pick_entry["popular_avoidance"]  = _cs.popular_avoidance
+                    pick_entry["bonus_avoidance"]    = _cs.bonus_avoidance
+                    pick_entry["zones_covered"]      = _cs.zones_covered
+                    pick_entry["popular_count"]      = _cs.popular_count
+                    pick_entry["secondary_ev"]       = _cs.secondary_ev
+            except Exception as _opt_err:
+                logger.warning(f"[optimizer] enrichment failed for {p.get('number')}: {_opt_err}")
+
+        # Route into session-keyed dict for cash games, flat list for jackpots
+        if game in _SESSION_GAMES:
+            sess_key = (p.get("session") or "UNKNOWN").upper()
+            grouped.setdefault(game, {}).setdefault(sess_key, []).append(pick_entry)
+        else:
+            grouped.setdefault(game, []).append(pick_entry)
+
+    # Inject MMFSN picks sent by the edge function (BOOK3 personal-number lane)
+    if mmfsn and kit == "BOOK3":
+        _inject_mmfsn_picks(grouped, mmfsn, subscriber_id, date_str)
+
+    # Sort each session's picks by ev_score (then confidence) descending
+    # so index [0] is always the top-ranked pick in the EV reranker.
+    def _sort_key(x):
+        return (x.get("ev_score") or 0.0, x.get("confidence_score") or 0.0)
+
+    for _game, _val in grouped.items():
+        if isinstance(_val, dict):
+            for _sess in _val:
+                _val[_sess].sort(key=_sort_key, reverse=True)
+                # Stamp ev_rank based on final sort order
+                for _i, _pe in enumerate(_val[_sess], 1):
+                    _pe["ev_rank"] = _i
+        else:
+            _val.sort(key=_sort_key, reverse=True)
+            for _i, _pe in enumerate(_val, 1):
+                _pe["ev_rank"] = _i
+
+    # ── Phase 3B: bulk write EV observation log ─────────────────────────
+    if ev_reranker is not None and EV_RERANKER_MODE == "OBSERVE_ONLY":
+        _t0 = time.perf_counter()
+        try:
+            _ev_picks_to_log = []
+            _gate_map: dict[str, bool] = {}
+            for _g, _gv in grouped.items():
+                if isinstance(_gv, dict):
+                    for _s, _sp in _gv.items():
+                        for _pe in _sp:
+                            if "ev_score" in _pe:
+                                _ev_picks_to_log.append({
+                                    "date":            date_str,
+                                    "draw":            _pe.get("session", ""),
+                                    "game":            _g,
+                                    "lane":            _pe.get("recommended_play", ""),
+                                    "pick":            str(_pe.get("number", "")),
+                                    "overlay_tier":    _pe.get("confidence_tier", ""),
+                                    "mmfsn_tier":      _pe.get("mmfsn_tier", ""),
+                                    "ev_score":        _pe.get("ev_score", 0.0),
+                                    "decision":        _pe.get("ev_decision", ""),
+                                    "rank":            _pe.get("ev_rank", 0),
+                                    "base_score":          _pe.get("ev_base_score", 0.0),
+                                    "overlay_bonus":        _pe.get("ev_overlay_bonus", 0.0),
+                                    "night_bonus":          _pe.get("ev_night_bonus", 0.0),
+                                    "mmfsn_bonus":          _pe.get("ev_mmfsn_bonus", 0.0),
+                                    "recent_signal_bonus":  _pe.get("ev_recent_signal_bonus", 0.0),
+                                    "pav_bonus":            _pe.get("ev_pav_bonus", 0.0),
+                                    "instability_penalty":  _pe.get("ev_instability_penalty", 0.0),
+                                    "overexposure_penalty": _pe.get("ev_overexposure_penalty", 0.0),
+                                    "cold_signal_penalty":  _pe.get("ev_cold_signal_penalty", 0.0),
+                                })
+                                _gid = make_grain_id(
+                                    date_str,
+                                    _pe.get("session", ""),
+                                    _g,
+                                    _pe.get("recommended_play", ""),
+                                    str(_pe.get("number", "")),
+                                )
+                                _gate_map[_gid] = True
+            log_ev_request(_ev_picks_to_log, _gate_map)
+        except Exception as _log_err:
+            logger.warning(f"[ev_observe] bulk log failed (non-fatal): {_log_err}")
+        _ev_seconds += time.perf_counter() - _t0
+    if ev_reranker is not None:
+        _observe_stage("ev_scoring", _ev_seconds)
+
+    # BOSK tier — Cash3 and Cash4 only, no jackpot games
+    _BOSK_GAMES = {"Cash3", "Cash4", "Triples", "Quads"}
+    if kit == "BOSK":
+        grouped = {g: v for g, v in grouped.items() if g in _BOSK_GAMES}
+
+    # Filter if caller asked for specific games
+    if requested_games:
+        grouped = {g: v for g, v in grouped.items() if g in requested_games}
+
+    # Near-miss advice — compare current picks against recent actual draws
+    _c3_all_picks = [p["number"] for sess_picks in (grouped.get("Cash3", {}).values() if isinstance(grouped.get("Cash3"), dict) else [grouped.get("Cash3", [])]) for p in sess_picks]
+    _c4_all_picks = [p["number"] for sess_picks in (grouped.get("Cash4", {}).values() if isinstance(grouped.get("Cash4"), dict) else [grouped.get("Cash4", [])]) for p in sess_picks]
+    _t0 = time.perf_counter()
+    near_miss_advice = _compute_near_miss_advice(
+        cash3_picks=_c3_all_picks,
+        cash4_picks=_c4_all_picks,
+    )
+    _observe_stage("near_miss_advice", time.perf_counter() - _t0)
+
+    def _count_picks(g: dict) -> int:
+        total = 0
+        for v in g.values():
+            if isinstance(v, dict):
+                total += sum(len(s) for s in v.values())
+            else:
+                total += len(v)
+        return total
+
+    return jsonify({
+        "success": True,
+        "subscriber_id": subscriber_id,
+        "date": date_str,
+        "kit": kit,
+        "payload_shape": "session_keyed_v1",
+        "strategy_version": STRATEGY_VERSION,
+        "predictions": grouped,
+        "total_picks": _count_picks(grouped),
+        "near_miss_advice": near_miss_advice,
+    }).get_data()
+
+
 @app.route('/api/predictions/generate/<subscriber_id>', methods=['GET', 'POST'])
 def generate_predictions(subscriber_id: str):
     """
@@ -2118,354 +3331,35 @@ def generate_predictions(subscriber_id: str):
             or request.args.get("kit")
         )
         mmfsn = body.get("mmfsn") or {}
-        run_id = f"phase2_{date_str}_live"
-        source_system = "prod_live"
 
-        # Load persisted subscriber record (written by /api/subscribers/sync)
-        subscriber_record = {"initials": "MBO", "games": ["Cash3", "Cash4"], "tier": "book3"}
-        record_path = os.path.join(SUBSCRIBERS_DIR, f"{subscriber_id}.json")
-        if os.path.exists(record_path):
-            try:
-                with open(record_path, "r", encoding="utf-8") as _f:
-                    _rec = json.load(_f)
-                birth = _rec.get("birth_profile") or {}
-                initials = (
-                    birth.get("initials")
-                    or birth.get("subscriber_initials")
-                    or _rec.get("initials")
-                    or "MBO"
-                ).upper()
-                subscriber_record = {
-                    "initials":     initials,
-                    "subscriber_id": subscriber_id,
-                    "tier":         (_rec.get("tier") or "bosk").lower(),
-                    "games":        ["Cash3", "Cash4"],
-                    "birthdate":    birth.get("dob") or birth.get("birth_date") or "",
-                    "birthtime":    birth.get("tob") or birth.get("birth_time") or "",
-                    "birthplace":   birth.get("pob") or birth.get("birth_place") or "",
-                }
-            except Exception as _e:
-                logger.warning(f"Could not load subscriber record for {subscriber_id}: {_e}")
-
-        tier_to_kit = {"book3": "BOOK3", "book": "BOOK", "bosk": "BOSK"}
-        kit = (requested_kit or tier_to_kit.get(subscriber_record.get("tier"), "BOSK")).upper()
-
-        all_predictions = get_predictions_for_date(date_str, kit, subscriber=subscriber_record)
-
-        # Build game histories for pair-signal detection in _recommended_play
-        _gad = _load_ga_data_from_json()
-        _c3_hist = [d["winning_numbers"] for d in _gad.get("cash3_mid", []) + _gad.get("cash3_eve", []) + _gad.get("cash3_night", [])]
-        _c4_hist = [d["winning_numbers"] for d in _gad.get("cash4_mid", []) + _gad.get("cash4_eve", []) + _gad.get("cash4_night", [])]
-
-        # Group by game (and session for Cash3/Cash4), preserving per-pick metadata.
-        # Cash3/Cash4 shape: { "Cash3": { "MIDDAY": [...], "EVENING": [...], "NIGHT": [...] } }
-        # Jackpot shape (unchanged): { "Powerball": [...] }
-        _SESSION_GAMES = {"Cash3", "Cash4", "Triples", "Quads"}
-        grouped: Dict[str, Any] = {}
-        from jackpot_system_v3.core.pick_engine_v3 import (
-            _recommended_play, _confidence_ui, _jackpot_confidence_ui,
-            _box_type,
-            _C4_BOX_PAYOUT, _C3_BOX_PAYOUT,
-            _C4_STRAIGHT_BOX_STRAIGHT_PAYOUT, _C4_STRAIGHT_BOX_BOX_PAYOUT,
-            _C3_STRAIGHT_BOX_STRAIGHT_PAYOUT, _C3_STRAIGHT_BOX_BOX_PAYOUT,
-            _C3_STRAIGHT_PAYOUT, _C4_STRAIGHT_PAYOUT,
-            _C3_PAIR_PAYOUT,
-            _C3_COMBO_PAYOUT, _C3_COMBO_TICKET_COST,
-            _C3_1OFF_STRAIGHT_MATCH_PAYOUT, _C3_1OFF_ONE_DIGIT_PAYOUT,
-            _C3_1OFF_TWO_DIGIT_PAYOUT, _C3_1OFF_THREE_DIGIT_PAYOUT,
+        straight_session = _current_straight_session()
+        cache_key = (
+            subscriber_id, date_str,
+            json.dumps(requested_games, sort_keys=True),
+            (requested_kit or "").upper(),
+            json.dumps(mmfsn, sort_keys=True, default=str),
+            straight_session, _data_version_key(),
+            _subscriber_cache_stamp(subscriber_id),
         )
-        _JACKPOT_GAMES = {"Powerball", "Mega Millions", "MegaMillions", "Millionaire For Life"}
-        for p in all_predictions:
-            game = p.get("game", "Unknown")
-            conf = p.get("confidence_score") or 0.0
-            _lane = p.get("lane", "")
-            if game in _JACKPOT_GAMES:
-                _rp = "STRAIGHT"
-                _ui = _jackpot_confidence_ui(game)
-            else:
-                hist = _c3_hist if game in ("Cash3", "Triples") else (_c4_hist if game in ("Cash4", "Quads") else None)
-                _rp = _recommended_play(conf, p.get("number", ""), hist)
-                _ui = _confidence_ui(_rp, _lane, game=game)
-
-            # Keep confidence as likelihood signal and expose play aggression separately.
-            _risk_mode = {
-                "BOX": "conservative",
-                "FRONT_PAIR": "balanced",
-                "BACK_PAIR": "balanced",
-                "STRAIGHT_BOX": "balanced",
-                "STRAIGHT": "aggressive",
-                "STRAIGHT+1OFF": "aggressive",
-            }.get(_rp, "balanced")
-
-            pick_entry = {
-                "number":           p.get("number"),
-                "kit":              p.get("kit"),
-                "lane":             _lane,
-                "session":          p.get("session"),
-                "run_id":           run_id,
-                "source_system":    source_system,
-                "confidence_score": conf,
-                "recommended_play": _rp,
-                "risk_mode":        _risk_mode,
-                "confidence_experimental": True,
-                "confidence_label": _ui["label"],
-                "confidence_color": _ui["color"],
-                "confidence_tier":  _ui["label"],
-                "confidence_description": _ui["description"],
-            }
-
-            if not is_live_recommendation_allowed(
-                game,
-                pick_entry.get("session"),
-                pick_entry.get("confidence_tier"),
-                pick_entry.get("play_type"),
-            ):
-                continue
-
-            pick_entry["strategy_version"] = STRATEGY_VERSION
-            pick_entry["strategy_status"] = "allowed"
-            pick_entry["strategy_reason"] = strategy_reason(
-                game,
-                pick_entry.get("session"),
-                pick_entry.get("confidence_tier"),
-                pick_entry.get("play_type"),
+        cached = _prediction_cache_get(cache_key)
+        if cached is not None:
+            return _etag_response(*cached)
+
+        def compute() -> Tuple[str, bytes]:
+            body_bytes = _build_predictions_body(
+                subscriber_id, date_str, requested_games, requested_kit,
+                mmfsn, straight_session,
             )
+            etag = hashlib.sha256(body_bytes).hexdigest()[:32]
+            _prediction_cache_put(cache_key, etag, body_bytes)
+            return etag, body_bytes
 
-            # ── Phase 3B: EV Reranker — OBSERVE_ONLY ────────────────────────
-            # Score this pick and attach ev_* fields to the response.
-            # The production gate above still controls exposure; reranker observes only.
-            if _EV_RERANKER is not None and game == "Cash3":
-                try:
-                    from datetime import date as _date
-                    _draw_date_str = date_str  # outer scope: YYYY-MM-DD
-                    try:
-                        _draw_date = _date.fromisoformat(_draw_date_str)
-                    except (ValueError, TypeError):
-                        _draw_date = _date.today()
-                    _ev_tier = _score_to_confidence_tier(pick_entry.get("confidence_score") or 0.0)
-                    _scored = _EV_RERANKER.score_pick(
-                        game      = game,
-                        play_type = _rp,
-                        session   = (pick_entry.get("session") or "").upper(),
-                        tier      = _ev_tier,
-                        pick      = str(pick_entry.get("number", "")),
-                        draw_date = _draw_date,
-                    )
-                    _ev_decision, _ev_reason = _EV_RERANKER._decide(_scored)
-                    pick_entry["ev_score"]        = _scored["ev_score"]
-                    pick_entry["ev_decision"]      = _ev_decision
-                    pick_entry["ev_reason"]        = _ev_reason
-                    pick_entry["mmfsn_tier"]       = _scored["mmfsn_tier"]
-                    pick_entry["production_gate"]  = True
-                    pick_entry["production_action"] = "CURRENT_V2_RULE"
-                    pick_entry["reranker_mode"]    = EV_RERANKER_MODE
-                    # Store component scores so the bulk log section can use real values
-                    pick_entry["ev_base_score"]            = _scored.get("base_score", 0.0)
-                    pick_entry["ev_overlay_bonus"]         = _scored.get("overlay_bonus", 0.0)
-                    pick_entry["ev_night_bonus"]           = _scored.get("night_bonus", 0.0)
-                    pick_entry["ev_mmfsn_bonus"]           = _scored.get("mmfsn_bonus", 0.0)
-                    pick_entry["ev_recent_signal_bonus"]   = _scored.get("recent_signal_bonus", 0.0)
-                    pick_entry["ev_pav_bonus"]             = _scored.get("pav_bonus", 0.0)
-                    pick_entry["ev_instability_penalty"]   = _scored.get("instability_penalty", 0.0)
-                    pick_entry["ev_overexposure_penalty"]  = _scored.get("overexposure_penalty", 0.0)
-                    pick_entry["ev_cold_signal_penalty"]   = _scored.get("cold_signal_penalty", 0.0)
-                except Exception as _ev_err:
-                    logger.warning(f"[ev_reranker] score failed for {pick_entry.get('number')}: {_ev_err}")
-
-            # Audit transparency fields — present on every pick regardless of EV scoring.
-            # ev_sort_is_advisory=True signals to all consumers that sort order is informational
-            # only; exposure_authority confirms the v2 rule still controls what subscribers see.
-            pick_entry.setdefault("ev_sort_applied",     True)
-            pick_entry.setdefault("ev_sort_is_advisory", True)
-            pick_entry.setdefault("exposure_authority",  "CURRENT_V2_RULE")
-
-            # Inject payout details for all play types
-            _num = p.get("number", "")
-            _is_c4 = game in ("Cash4", "Quads")
-            _is_c3 = game in ("Cash3", "Triples")
-            if _rp in ("BOX", "STRAIGHT_BOX") and (_is_c3 or _is_c4):
-                _bt = _box_type(_num)
-                pick_entry["box_type"] = _bt
-                if _is_c4:
-                    pick_entry["box_payout"] = _C4_BOX_PAYOUT.get(_bt)
-                    if _rp == "STRAIGHT_BOX":
-                        pick_entry["straight_box_straight_payout"] = _C4_STRAIGHT_BOX_STRAIGHT_PAYOUT.get(_bt)
-                        pick_entry["straight_box_box_payout"] = _C4_STRAIGHT_BOX_BOX_PAYOUT.get(_bt)
-                elif _is_c3:
-                    pick_entry["box_payout"] = _C3_BOX_PAYOUT.get(_bt)
-                    if _rp == "STRAIGHT_BOX":
-                        pick_entry["straight_box_straight_payout"] = _C3_STRAIGHT_BOX_STRAIGHT_PAYOUT.get(_bt)
-                        pick_entry["straight_box_box_payout"] = _C3_STRAIGHT_BOX_BOX_PAYOUT.get(_bt)
-                    # Combo is the "all permutations" upgrade from BOX — always available for Cash3 box plays
-                    if _bt in _C3_COMBO_TICKET_COST:
-                        pick_entry["combo_payout"] = _C3_COMBO_PAYOUT
-                        pick_entry["combo_ticket_cost"] = _C3_COMBO_TICKET_COST[_bt]
-            elif _rp == "STRAIGHT" and (_is_c3 or _is_c4):
-                pick_entry["straight_payout"] = _C3_STRAIGHT_PAYOUT if _is_c3 else _C4_STRAIGHT_PAYOUT
-            elif _rp == "STRAIGHT+1OFF" and _is_c3:
-                # 1-Off is a GA Cash3 product; include its payout tiers for all STRAIGHT+1OFF Cash3 picks
-                pick_entry["straight_payout"] = _C3_STRAIGHT_PAYOUT
-                pick_entry["one_off_straight_match_payout"] = _C3_1OFF_STRAIGHT_MATCH_PAYOUT
-                pick_entry["one_off_one_digit_payout"]      = _C3_1OFF_ONE_DIGIT_PAYOUT
-                pick_entry["one_off_two_digit_payout"]      = _C3_1OFF_TWO_DIGIT_PAYOUT
-                pick_entry["one_off_three_digit_payout"]    = _C3_1OFF_THREE_DIGIT_PAYOUT
-            elif _rp in ("FRONT_PAIR", "BACK_PAIR") and _is_c3:
-                pick_entry["pair_payout"] = _C3_PAIR_PAYOUT
-
-            # Option 1 — inject suggested_1off + full straight_rankings for STRAIGHT+1OFF Cash4 picks
-            if _rp == "STRAIGHT+1OFF" and game in ("Cash4", "Quads"):
-                try:
-                    from jackpot_system_v3.core.pick_engine_v3 import rank_cash4_straight_orderings as _rank_ord
-                    from datetime import datetime as _dt_now
-                    # Derive session from current ET hour (approximate)
-                    _et_hour = (_dt_now.utcnow().hour - 4) % 24  # rough ET offset
-                    if _et_hour < 13:
-                        _sess = "midday"
-                    elif _et_hour < 20:
-                        _sess = "evening"
-                    else:
-                        _sess = "night"
-                    _ord_result = _rank_ord(p.get("number", ""), _sess)
-                    if _ord_result.get("valid", True) and _ord_result.get("rankings"):
-                        _rankings = _ord_result["rankings"]
-                        # suggested_1off = highest-ranked ordering that differs from the main pick
-                        _main_num = p.get("number", "")
-                        _alt = next((r for r in _rankings if r["number"] != _main_num), None)
-                        pick_entry["suggested_1off"] = _alt["number"] if _alt else None
-                        pick_entry["suggested_1off_pct"] = _alt["pct"] if _alt else None
-                        pick_entry["straight_rankings"] = _rankings
-                        pick_entry["straight_session"] = _sess
-                        pick_entry["aligned_positions"] = _ord_result.get("aligned_positions")
-                except Exception as _e1off:
-                    logger.warning(f"1off ranking failed for {p.get('number')}: {_e1off}")
-
-            # ── Secondary optimizer enrichment for jackpot picks ───────────
-            if game in _JACKPOT_GAMES:
-                try:
-                    from jackpot_secondary_optimizer import score_combination, resolve_game
-                    _game_key = resolve_game(game)
-                    _mains, _bonus = _parse_jackpot_number(p.get("number", ""))
-                    if _mains and len(_mains) == 5 and _bonus is not None:
-                        _cs = score_combination(_game_key, _mains, _bonus)
-                        pick_entry["optimizer_score"]    = _cs.composite_score
-                        pick_entry["optimizer_grade"]    = _cs.grade()
-                        pick_entry["field_coverage"]     = _cs.field_coverage
-                        pick_entry["popular_avoidance"]  = _cs.popular_avoidance
-                        pick_entry["bonus_avoidance"]    = _cs.bonus_avoidance
-                        pick_entry["zones_covered"]      = _cs.zones_covered
-                        pick_entry["popular_count"]      = _cs.popular_count
-                        pick_entry["secondary_ev"]       = _cs.secondary_ev
-                except Exception as _opt_err:
-                    logger.warning(f"[optimizer] enrichment failed for {p.get('number')}: {_opt_err}")
-
-            # Route into session-keyed dict for cash games, flat list for jackpots
-            if game in _SESSION_GAMES:
-                sess_key = (p.get("session") or "UNKNOWN").upper()
-                grouped.setdefault(game, {}).setdefault(sess_key, []).append(pick_entry)
-            else:
-                grouped.setdefault(game, []).append(pick_entry)
-
-        # Inject MMFSN picks sent by the edge function (BOOK3 personal-number lane)
-        if mmfsn and kit == "BOOK3":
-            _inject_mmfsn_picks(grouped, mmfsn, subscriber_id, date_str)
-
-        # Sort each session's picks by ev_score (then confidence) descending
-        # so index [0] is always the top-ranked pick in the EV reranker.
-        def _sort_key(x):
-            return (x.get("ev_score") or 0.0, x.get("confidence_score") or 0.0)
-
-        for _game, _val in grouped.items():
-            if isinstance(_val, dict):
-                for _sess in _val:
-                    _val[_sess].sort(key=_sort_key, reverse=True)
-                    # Stamp ev_rank based on final sort order
-                    for _i, _pe in enumerate(_val[_sess], 1):
-                        _pe["ev_rank"] = _i
-            else:
-                _val.sort(key=_sort_key, reverse=True)
-                for _i, _pe in enumerate(_val, 1):
-                    _pe["ev_rank"] = _i
-
-        # ── Phase 3B: bulk write EV observation log ─────────────────────────
-        if _EV_RERANKER is not None and EV_RERANKER_MODE == "OBSERVE_ONLY":
-            try:
-                _ev_picks_to_log = []
-                _gate_map: dict[str, bool] = {}
-                for _g, _gv in grouped.items():
-                    if isinstance(_gv, dict):
-                        for _s, _sp in _gv.items():
-                            for _pe in _sp:
-                                if "ev_score" in _pe:
-                                    _ev_picks_to_log.append({
-                                        "date":            date_str,
-                                        "draw":            _pe.get("session", ""),
-                                        "game":            _g,
-                                        "lane":            _pe.get("recommended_play", ""),
-                                        "pick":            str(_pe.get("number", "")),
-                                        "overlay_tier":    _pe.get("confidence_tier", ""),
-                                        "mmfsn_tier":      _pe.get("mmfsn_tier", ""),
-                                        "ev_score":        _pe.get("ev_score", 0.0),
-                                        "decision":        _pe.get("ev_decision", ""),
-                                        "rank":            _pe.get("ev_rank", 0),
-                                        "base_score":          _pe.get("ev_base_score", 0.0),
-                                        "overlay_bonus":        _pe.get("ev_overlay_bonus", 0.0),
-                                        "night_bonus":          _pe.get("ev_night_bonus", 0.0),
-                                        "mmfsn_bonus":          _pe.get("ev_mmfsn_bonus", 0.0),
-                                        "recent_signal_bonus":  _pe.get("ev_recent_signal_bonus", 0.0),
-                                        "pav_bonus":            _pe.get("ev_pav_bonus", 0.0),
-                                        "instability_penalty":  _pe.get("ev_instability_penalty", 0.0),
-                                        "overexposure_penalty": _pe.get("ev_overexposure_penalty", 0.0),
-                                        "cold_signal_penalty":  _pe.get("ev_cold_signal_penalty", 0.0),
-                                    })
-                                    _gid = make_grain_id(
-                                        date_str,
-                                        _pe.get("session", ""),
-                                        _g,
-                                        _pe.get("recommended_play", ""),
-                                        str(_pe.get("number", "")),
-                                    )
-                                    _gate_map[_gid] = True
-                log_ev_request(_ev_picks_to_log, _gate_map)
-            except Exception as _log_err:
-                logger.warning(f"[ev_observe] bulk log failed (non-fatal): {_log_err}")
-
-        # BOSK tier — Cash3 and Cash4 only, no jackpot games
-        _BOSK_GAMES = {"Cash3", "Cash4", "Triples", "Quads"}
-        if kit == "BOSK":
-            grouped = {g: v for g, v in grouped.items() if g in _BOSK_GAMES}
-
-        # Filter if caller asked for specific games
-        if requested_games:
-            grouped = {g: v for g, v in grouped.items() if g in requested_games}
-
-        # Near-miss advice — compare current picks against recent actual draws
-        _c3_all_picks = [p["number"] for sess_picks in (grouped.get("Cash3", {}).values() if isinstance(grouped.get("Cash3"), dict) else [grouped.get("Cash3", [])]) for p in sess_picks]
-        _c4_all_picks = [p["number"] for sess_picks in (grouped.get("Cash4", {}).values() if isinstance(grouped.get("Cash4"), dict) else [grouped.get("Cash4", [])]) for p in sess_picks]
-        near_miss_advice = _compute_near_miss_advice(
-            cash3_picks=_c3_all_picks,
-            cash4_picks=_c4_all_picks,
-        )
+        # Identical concurrent requests share one engine run
+        etag, body_bytes = _single_flight(("predictions",) + cache_key, compute)
+        return _etag_response(etag, body_bytes)
 
-        def _count_picks(g: dict) -> int:
-            total = 0
-            for v in g.values():
-                if isinstance(v, dict):
-                    total += sum(len(s) for s in v.values())
-                else:
-                    total += len(v)
-            return total
-
-        return jsonify({
-            "success": True,
-            "subscriber_id": subscriber_id,
-            "date": date_str,
-            "kit": kit,
-            "payload_shape": "session_keyed_v1",
-            "strategy_version": STRATEGY_VERSION,
-            "predictions": grouped,
-            "total_picks": _count_picks(grouped),
-            "near_miss_advice": near_miss_advice,
-        }), 200
+    except TimeoutError as e:
+        return _busy_response(e)
 
     except Exception as e:
         logger.error(f"generate_predictions error: {e}", exc_info=True)
@@ -2548,6 +3442,449 @@ def _compute_near_miss_advice(
         }
 
 
+# ── Results ingest ──────────────────────────────────────────────────────────
+# Shared by POST /api/results/ingest and /api/results/fetch-latest so the
+# fetcher applies draws in-process instead of looping back over HTTP.  A batch
+# is applied under one lock: each session JSON file is read and written once,
+# the audit log is persisted once and the data version is bumped once.
+_INGEST_LOCK = Lock()
+
+_INGEST_CASH_GAMES    = {"Cash3", "Cash4"}
+_INGEST_JACKPOT_GAMES = {"Powerball", "MegaMillions", "MillionaireForLife", "Cash4Life"}
+_INGEST_SESSION_MAP   = {"midday": "mid", "evening": "eve", "night": "night"}
+_INGEST_FILE_MAP      = {
+    "cash3_mid":   "cash3_midday.json",
+    "cash3_eve":   "cash3_evening.json",
+    "cash3_night": "cash3_night.json",
+    "cash4_mid":   "cash4_midday.json",
+    "cash4_eve":   "cash4_evening.json",
+    "cash4_night": "cash4_night.json",
+}
+
+
+def _apply_ingest(payload: Dict, dry_run: bool, source: str,
+                  disk_files: Dict[str, Dict],
+                  new_entries: List[Tuple[str, Dict]]) -> Tuple[Dict, int, bool]:
+    """
+    Validate one draw and apply it to the in-memory buffer.  Disk rows are
+    appended to disk_files[filepath] and flushed by ingest_draws(); entries
+    new to memory are appended to new_entries for the shared draw log.  A cash
+    draw already in its session file counts as present, since pruned log rows
+    reach the other workers only through that file.
+    Returns (response body, HTTP status, in_memory_changed).
+    """
+    game           = (payload.get("game") or "").strip()
+    session_raw    = (payload.get("session") or "").strip().lower()
+    date_str       = (payload.get("date") or "").strip()
+    winning_number = str(payload.get("winning_number") or "").strip()
+
+    # --- Validate inputs ---------------------------------------------------
+    valid_games = _INGEST_CASH_GAMES | _INGEST_JACKPOT_GAMES
+    if game not in valid_games:
+        return {"success": False,
+                "error": f"game must be one of {sorted(valid_games)}"}, 400, False
+
+    # Jackpot games: store in a separate in-memory log — no session JSON files
+    if game in _INGEST_JACKPOT_GAMES:
+        entry = {
+            "draw_date":       date_str,
+            "winning_numbers": winning_number,
+            "session":         session_raw.capitalize() if session_raw else "Evening",
+            "game":            game,
+        }
+        if dry_run:
+            return {"success": True, "dryRun": True, "would_write": True,
+                    "game": game, "date": date_str,
+                    "winning_number": winning_number}, 200, False
+        cache_key = f"jackpot_{game.lower()}"
+        already = date_str in {e["draw_date"] for e in _ga_extra_entries.get(cache_key, [])}
+        if not already:
+            _ga_extra_entries.setdefault(cache_key, []).append(entry)
+            new_entries.append((cache_key, entry))
+            logger.info(f"[ingest:jackpot] {game} {date_str} → {winning_number}")
+        return {"success": True, "game": game, "date": date_str,
+                "winning_number": winning_number}, 200, not already
+    if session_raw not in _INGEST_SESSION_MAP:
+        return {"success": False,
+                "error": f"session must be one of {sorted(_INGEST_SESSION_MAP)}"}, 400, False
+    if not date_str:
+        return {"success": False, "error": "date is required (YYYY-MM-DD)"}, 400, False
+    if not winning_number:
+        return {"success": False, "error": "winning_number is required"}, 400, False
+
+    # Validate date format
+    try:
+        datetime.strptime(date_str, "%Y-%m-%d")
+    except ValueError:
+        return {"success": False,
+                "error": "date must be in YYYY-MM-DD format"}, 400, False
+
+    # Validate winning_number is digits only
+    if not winning_number.isdigit():
+        return {"success": False,
+                "error": "winning_number must be numeric digits"}, 400, False
+
+    # Expected digit length
+    expected_len = 3 if game == "Cash3" else 4
+    if len(winning_number) != expected_len:
+        return {"success": False,
+                "error": f"{game} winning_number must be {expected_len} digits"}, 400, False
+
+    # --- Build cache key and normalized entry ------------------------------
+    sess_key  = _INGEST_SESSION_MAP[session_raw]
+    cache_key = f"{game.lower()}_{sess_key}"   # e.g. "cash3_eve"
+
+    entry = {
+        "draw_date":       date_str,
+        "winning_numbers": winning_number,
+        "session":         session_raw.capitalize(),
+    }
+
+    # --- Idempotency check (same logic used for real writes) ---------------
+    already_present = date_str in {e["draw_date"] for e in _ga_extra_entries[cache_key]}
+
+    # --- Dry-run: return what would happen without touching anything -------
+    if dry_run:
+        logger.info(f"[ingest:dryRun] {cache_key} {date_str} → {winning_number} "
+                    f"would_write={not already_present}")
+        return {
+            "success":         True,
+            "dryRun":          True,
+            "would_write":     not already_present,
+            "already_present": already_present,
+            "entry":           entry,
+            "game":            game,
+            "session":         session_raw,
+            "date":            date_str,
+            "winning_number":  winning_number,
+        }, 200, False
+
+    # --- Stage the JSON file row (flushed once per file by the caller) -----
+    ga_dir   = os.path.join(JACKPOT_SYSTEM_DIR, "data", "ga_results")
+    filename = _INGEST_FILE_MAP[cache_key]
+    filepath = os.path.join(ga_dir, filename)
+    try:
+        staged = disk_files.get(filepath)
+        if staged is None:
+            if os.path.exists(filepath):
+                with open(filepath, "r", encoding="utf-8") as f:
+                    disk_data = json.load(f)
+            else:
+                disk_data = []
+            staged = disk_files[filepath] = {
+                "rows":    disk_data,
+                "dates":   {r.get("draw_date") or r.get("date", "") for r in disk_data},
+                "pending": [],
+            }
+
+        # Idempotent: only append if this date is not already on disk
+        if date_str not in staged["dates"]:
+            # Store in the same format as the existing JSON entries
+            staged["rows"].append({
+                "date":           date_str,
+                "winning_number": winning_number,
+                "session":        session_raw.capitalize(),
+                "draw_date":      date_str,
+            })
+            staged["dates"].add(date_str)
+            staged["pending"].append((game, session_raw, date_str, winning_number))
+        else:
+            logger.info(f"[ingest] disk already has {date_str} in {filename}, skipped")
+            already_present = True
+    except Exception as disk_err:
+        # Non-fatal — the in-memory update below still applies
+        logger.warning(f"[ingest] disk read failed (non-fatal): {disk_err}")
+
+    # --- Update in-memory buffer (idempotent) ------------------------------
+    if not already_present:
+        _ga_extra_entries[cache_key].append(entry)
+        new_entries.append((cache_key, entry))
+        logger.info(f"[ingest] in-memory: {cache_key} {date_str} → {winning_number}")
+        _append_audit_log(game, session_raw, date_str, winning_number,
+                          source=source, persist=False)
+    else:
+        logger.info(f"[ingest] duplicate skipped (already in memory or on disk): {cache_key} {date_str}")
+
+    return {
+        "success":        True,
+        "game":           game,
+        "session":        session_raw,
+        "date":           date_str,
+        "winning_number": winning_number,
+    }, 200, not already_present
+
+
+def _flush_ingest_files(disk_files: Dict[str, Dict]) -> Set[str]:
+    """
+    Write each staged session file once and update pool scores.  Best-effort;
+    returns the cache keys whose file was written.
+    """
+    written: Set[str] = set()
+    file_keys = {name: key for key, name in _INGEST_FILE_MAP.items()}
+    for filepath, staged in disk_files.items():
+        if not staged["pending"]:
+            continue
+        filename = os.path.basename(filepath)
+        try:
+            os.makedirs(os.path.dirname(filepath), exist_ok=True)
+            with open(filepath, "w", encoding="utf-8") as f:
+                json.dump(staged["rows"], f, indent=2)
+        except Exception as disk_err:
+            logger.warning(f"[ingest] disk write failed (non-fatal): {disk_err}")
+            continue
+        logger.info(f"[ingest] disk write OK: {filename} (+{len(staged['pending'])})")
+        written.add(file_keys[filename])
+        try:
+            from jackpot_system_v3.core.triple_due_signal import update_pool_scores_batch
+            # Every pending row in one file belongs to the same game
+            update_pool_scores_batch(staged["pending"][0][0],
+                                     [row[1:] for row in staged["pending"]])
+        except Exception as pool_err:
+            logger.warning(f"[ingest] pool score update failed (non-fatal): {pool_err}")
+    return written
+
+
+def ingest_draws(payloads: List[Dict], dry_run: bool = False,
+                 source: str = "ingest") -> List[Tuple[Dict, int]]:
+    """
+    Apply a batch of draw results in-process as a single unit.
+
+    Each payload has the /api/results/ingest body shape (game, session, date,
+    winning_number).  Returns one (response body, HTTP status) per payload, in
+    order.  Derived caches are invalidated once if anything new landed.
+    """
+    results: List[Tuple[Dict, int]] = []
+    disk_files: Dict[str, Dict] = {}
+    new_entries: List[Tuple[str, Dict]] = []
+    changed = False
+    with _INGEST_LOCK:
+        # Start from every worker's draws so idempotency checks see them too
+        _sync_shared_draws()
+        for payload in payloads:
+            try:
+                body, status, new_row = _apply_ingest(payload, dry_run, source,
+                                                      disk_files, new_entries)
+            except Exception as e:
+                logger.error(f"ingest error: {e}", exc_info=True)
+                body, status, new_row = {"success": False, "error": str(e)}, 500, False
+            changed = changed or new_row
+            results.append((body, status))
+        if not dry_run:
+            written = _flush_ingest_files(disk_files)
+            if changed:
+                _persist_audit_log()
+            # New draw landed — log it for the other workers (advancing our
+            # log position past our own rows; rows now in their session file
+            # are dropped again) and invalidate this worker's caches.
+            if written or changed:
+                if _append_shared_draws(new_entries, persisted=written):
+                    _sync_shared_draws(warm=False)
+                _bump_data_version()
+                if _WARM_ON_INGEST:
+                    _schedule_warm_cache(source)
+    return results
+
+
+# ── Warm cache ──────────────────────────────────────────────────────────────
+# After an ingest lands new draws, a background job rebuilds what the first
+# requests would otherwise pay for: the per-session pick models for today and
+# tomorrow, the celestial fingerprints, and today's shared signal responses
+# (due signals, convergence / environment scans, jackpot routes).  Responses
+# are rendered into a staging dict and swapped into the shared cache in one
+# step, and only if the data version has not moved meanwhile.  A run requested
+# while one is in progress is queued and runs once afterwards.
+# Shared responses are warmed for today only: the routes read the clock, so
+# tomorrow's cannot be rendered ahead of time.  Instead each run arms a timer
+# that re-warms just after local midnight, when tomorrow's scope begins.
+_WARM_ON_INGEST = os.getenv("WARM_CACHE_ON_INGEST", "true").strip().lower() not in {
+    "0", "false", "no", "off"
+}
+_WARM_KITS = ("BOOK3", "BOOK")
+_WARM_SESSIONS = ({}, {"session": "Midday"}, {"session": "Evening"}, {"session": "Night"})
+_WARM_SHARED_REQUESTS: List[Tuple[str, Dict[str, str]]] = [
+    ("/api/triples/due-signal", {}),
+    ("/api/quads/due-signal", {}),
+    ("/api/celestial/hot-windows", {}),
+    *[("/api/celestial/perfect-storm", q) for q in _WARM_SESSIONS],
+    *[("/api/convergence-alerts/today", q) for q in _WARM_SESSIONS],
+    *[("/api/triple-environment/today", q) for q in _WARM_SESSIONS],
+    *[("/api/quad-environment/today", q) for q in _WARM_SESSIONS],
+    ("/api/jackpot/prizes", {}),
+    ("/api/powerball/predict", {}),
+    ("/api/megamillions/predict", {}),
+    ("/api/millionaire-for-life/predict", {}),
+]
+
+_WARM_ROLLOVER_DELAY_S = 5
+_WARM_LOCK = Lock()
+_rollover_timer: "Timer | None" = None
+_warm_status: Dict[str, Any] = {
+    "state":        "idle",       # idle | running | ready | failed
+    "data_version": None,
+    "days":         [],
+    "reason":       None,
+    "started_at":   None,
+    "finished_at":  None,
+    "duration_s":   None,
+    "steps":        [],
+    "runs":         0,
+    "pending":      False,
+}
+
+
+def _render_shared_response(path: str, query: Dict[str, str]) -> "Tuple[tuple, Tuple[str, bytes]] | None":
+    """Render one _shared_cache route outside a live request; None if not cacheable."""
+    headers = {"X-Prediction-Secret": _PREDICTION_SECRET} if _PREDICTION_SECRET else {}
+    with app.test_request_context(path, query_string=query, headers=headers):
+        wrapper = app.view_functions[request.url_rule.endpoint]
+        params = getattr(wrapper, "shared_cache_params", ())
+        view = getattr(wrapper, "__wrapped__", wrapper)
+        resp = app.make_response(view(**(request.view_args or {})))
+        if resp.status_code != 200 or not resp.is_json:
+            return None
+        payload = resp.get_json(silent=True)
+        if isinstance(payload, dict) and payload.get("success") is False:
+            return None
+        body = resp.get_data()
+        return _shared_cache_key(params), (hashlib.sha256(body).hexdigest()[:32], body)
+
+
+def _swap_shared_responses(scope: tuple, staged: Dict[tuple, Tuple[str, bytes]]) -> bool:
+    """Install staged responses for scope in one step; False if scope is stale."""
+    if scope != _shared_cache_scope():
+        return False
+    with _SHARED_CACHE_LOCK:
+        entries = OrderedDict(_shared_responses["entries"]
+                              if _shared_responses["scope"] == scope else ())
+        for key, value in staged.items():
+            _shared_cache_store(entries, key, value)
+        _shared_responses["entries"] = entries
+        _shared_responses["scope"] = scope
+    return True
+
+
+def _run_warm_steps() -> Tuple[List[Dict], List[str]]:
+    steps: List[Dict] = []
+
+    def step(name: str, fn) -> None:
+        t0 = time.perf_counter()
+        try:
+            fn()
+            steps.append({"name": name, "ok": True,
+                          "seconds": round(time.perf_counter() - t0, 3)})
+        except Exception as e:
+            logger.warning(f"[warm] {name} failed: {e}")
+            steps.append({"name": name, "ok": False, "error": str(e),
+                          "seconds": round(time.perf_counter() - t0, 3)})
+
+    today = datetime.now().date()
+    days = [today.isoformat(), (today + timedelta(days=1)).isoformat()]
+    scope = _shared_cache_scope()
+
+    for day in days:
+        for kit in _WARM_KITS:
+            step(f"models:{day}:{kit}", lambda d=day, k=kit: get_predictions_for_date(d, k))
+    step("celestial_fingerprints", _get_celestial_fingerprints)
+
+    staged: Dict[tuple, Tuple[str, bytes]] = {}
+
+    def render(path: str, query: Dict[str, str]) -> None:
+        rendered = _render_shared_response(path, query)
+        if rendered is None:
+            raise RuntimeError("response not cacheable")
+        staged[rendered[0]] = rendered[1]
+
+    for path, query in _WARM_SHARED_REQUESTS:
+        label = path + ("?" + "&".join(f"{k}={v}" for k, v in query.items()) if query else "")
+        step(f"response:{label}", lambda p=path, q=query: render(p, q))
+
+    def swap() -> None:
+        if not _swap_shared_responses(scope, staged):
+            raise RuntimeError("data version moved during warm-up; staged set discarded")
+    step("swap", swap)
+    return steps, days
+
+
+def _warm_cache_worker(reason: str) -> None:
+    while True:
+        version = _DATA_VERSION
+        started = time.perf_counter()
+        with _WARM_LOCK:
+            _warm_status.update({
+                "state": "running", "reason": reason, "data_version": version,
+                "started_at": datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "finished_at": None, "duration_s": None, "steps": [],
+            })
+        try:
+            steps, days = _run_warm_steps()
+            state = "ready" if all(s["ok"] for s in steps) else "failed"
+        except Exception as e:
+            logger.error(f"[warm] run failed: {e}", exc_info=True)
+            steps, days, state = [{"name": "run", "ok": False, "error": str(e)}], [], "failed"
+        with _WARM_LOCK:
+            _warm_status.update({
+                "state": state, "days": days, "steps": steps,
+                "finished_at": datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "duration_s": round(time.perf_counter() - started, 3),
+                "runs": _warm_status["runs"] + 1,
+            })
+            logger.info(f"[warm] {state} for data v{version} in {_warm_status['duration_s']}s")
+            if not _warm_status["pending"]:
+                break
+            _warm_status["pending"] = False
+            reason = "queued"
+    if _WARM_ON_INGEST:
+        _arm_rollover_warm()
+
+
+def _arm_rollover_warm() -> None:
+    """(Re)arm the run that warms the new day's shared responses after midnight."""
+    global _rollover_timer
+    now = datetime.now()
+    midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+    delay = (midnight - now).total_seconds() + _WARM_ROLLOVER_DELAY_S
+    with _WARM_LOCK:
+        if _rollover_timer is not None:
+            _rollover_timer.cancel()
+        _rollover_timer = Timer(delay, _schedule_warm_cache, args=("day-rollover",))
+        _rollover_timer.daemon = True
+        _rollover_timer.start()
+
+
+def _schedule_warm_cache(reason: str) -> bool:
+    """Start the warm-cache job in the background; queue one rerun if busy."""
+    with _WARM_LOCK:
+        if _warm_status["state"] == "running":
+            _warm_status["pending"] = True
+            return False
+        _warm_status["state"] = "running"
+    Thread(target=_warm_cache_worker, args=(reason,), name="warm-cache", daemon=True).start()
+    return True
+
+
+@app.route('/api/warm-cache/status', methods=['GET', 'POST'])
+def warm_cache_status():
+    """
+    GET  /api/warm-cache/status — progress of the post-ingest warm-cache job.
+    POST /api/warm-cache/status — start a run now (X-Prediction-Secret required).
+
+    "ready" is true once a run finished without errors for the current data
+    version; per-step timings show what was rebuilt.
+    """
+    if request.method == "POST":
+        if not _check_prediction_secret():
+            return jsonify({"success": False, "error": "Unauthorized"}), 403
+        started = _schedule_warm_cache("manual")
+        return jsonify({"success": True, "started": started, "queued": not started}), 202
+
+    with _WARM_LOCK:
+        status = dict(_warm_status)
+    status["current_data_version"] = _DATA_VERSION
+    status["ready"] = (status["state"] == "ready"
+                       and status["data_version"] == _DATA_VERSION)
+    return jsonify({"success": True, **status}), 200
+
+
 @app.route('/api/results/ingest', methods=['POST'])
 def results_ingest():
     """
@@ -2582,153 +3919,9 @@ def results_ingest():
 
     try:
         body = request.get_json(silent=True) or {}
-        dry_run        = bool(body.get("dryRun") or request.args.get("dryRun") == "true")
-        game           = (body.get("game") or "").strip()
-        session_raw    = (body.get("session") or "").strip().lower()
-        date_str       = (body.get("date") or "").strip()
-        winning_number = str(body.get("winning_number") or "").strip()
-
-        # --- Validate inputs ---------------------------------------------------
-        valid_cash_games   = {"Cash3", "Cash4"}
-        valid_jackpot_games = {"Powerball", "MegaMillions", "MillionaireForLife", "Cash4Life"}
-        valid_games        = valid_cash_games | valid_jackpot_games
-        session_map    = {"midday": "mid", "evening": "eve", "night": "night"}
-        file_map_rev   = {
-            "cash3_mid":   "cash3_midday.json",
-            "cash3_eve":   "cash3_evening.json",
-            "cash3_night": "cash3_night.json",
-            "cash4_mid":   "cash4_midday.json",
-            "cash4_eve":   "cash4_evening.json",
-            "cash4_night": "cash4_night.json",
-        }
-
-        if game not in valid_games:
-            return jsonify({"success": False,
-                            "error": f"game must be one of {sorted(valid_games)}"}), 400
-
-        # Jackpot games: store in a separate in-memory log — no session JSON files
-        if game in valid_jackpot_games:
-            entry = {
-                "draw_date":       date_str,
-                "winning_numbers": winning_number,
-                "session":         session_raw.capitalize() if session_raw else "Evening",
-                "game":            game,
-            }
-            if dry_run:
-                return jsonify({"success": True, "dryRun": True, "would_write": True,
-                                "game": game, "date": date_str,
-                                "winning_number": winning_number}), 200
-            cache_key = f"jackpot_{game.lower()}"
-            already = date_str in {e["draw_date"] for e in _ga_extra_entries.get(cache_key, [])}
-            if not already:
-                _ga_extra_entries.setdefault(cache_key, []).append(entry)
-                logger.info(f"[ingest:jackpot] {game} {date_str} → {winning_number}")
-            return jsonify({"success": True, "game": game, "date": date_str,
-                            "winning_number": winning_number}), 200
-        if session_raw not in session_map:
-            return jsonify({"success": False,
-                            "error": f"session must be one of {sorted(session_map)}"}), 400
-        if not date_str:
-            return jsonify({"success": False, "error": "date is required (YYYY-MM-DD)"}), 400
-        if not winning_number:
-            return jsonify({"success": False, "error": "winning_number is required"}), 400
-
-        # Validate date format
-        try:
-            datetime.strptime(date_str, "%Y-%m-%d")
-        except ValueError:
-            return jsonify({"success": False,
-                            "error": "date must be in YYYY-MM-DD format"}), 400
-
-        # Validate winning_number is digits only
-        if not winning_number.isdigit():
-            return jsonify({"success": False,
-                            "error": "winning_number must be numeric digits"}), 400
-
-        # Expected digit length
-        expected_len = 3 if game == "Cash3" else 4
-        if len(winning_number) != expected_len:
-            return jsonify({"success": False,
-                            "error": f"{game} winning_number must be {expected_len} digits"}), 400
-
-        # --- Build cache key and normalized entry ------------------------------
-        sess_key  = session_map[session_raw]
-        cache_key = f"{game.lower()}_{sess_key}"   # e.g. "cash3_eve"
-
-        entry = {
-            "draw_date":       date_str,
-            "winning_numbers": winning_number,
-            "session":         session_raw.capitalize(),
-        }
-
-        # --- Idempotency check (same logic used for real writes) ---------------
-        already_present = date_str in {e["draw_date"] for e in _ga_extra_entries[cache_key]}
-
-        # --- Dry-run: return what would happen without touching anything -------
-        if dry_run:
-            logger.info(f"[ingest:dryRun] {cache_key} {date_str} → {winning_number} "
-                        f"would_write={not already_present}")
-            return jsonify({
-                "success":         True,
-                "dryRun":          True,
-                "would_write":     not already_present,
-                "already_present": already_present,
-                "entry":           entry,
-                "game":            game,
-                "session":         session_raw,
-                "date":            date_str,
-                "winning_number":  winning_number,
-            }), 200
-
-        # --- Update in-memory buffer (idempotent) ------------------------------
-        if not already_present:
-            _ga_extra_entries[cache_key].append(entry)
-            logger.info(f"[ingest] in-memory: {cache_key} {date_str} → {winning_number}")
-            _append_audit_log(game, session_raw, date_str, winning_number, source="ingest")
-        else:
-            logger.info(f"[ingest] duplicate skipped (already in memory): {cache_key} {date_str}")
-
-        # --- Persist to JSON file (best-effort) --------------------------------
-        ga_dir   = os.path.join(JACKPOT_SYSTEM_DIR, "data", "ga_results")
-        filename = file_map_rev[cache_key]
-        filepath = os.path.join(ga_dir, filename)
-        try:
-            if os.path.exists(filepath):
-                with open(filepath, "r", encoding="utf-8") as f:
-                    disk_data = json.load(f)
-            else:
-                disk_data = []
-
-            # Idempotent: only append if this date is not already on disk
-            disk_dates = {
-                r.get("draw_date") or r.get("date", "") for r in disk_data
-            }
-            if date_str not in disk_dates:
-                # Store in the same format as the existing JSON entries
-                disk_entry = {
-                    "date":           date_str,
-                    "winning_number": winning_number,
-                    "session":        session_raw.capitalize(),
-                    "draw_date":      date_str,
-                }
-                disk_data.append(disk_entry)
-                os.makedirs(ga_dir, exist_ok=True)
-                with open(filepath, "w", encoding="utf-8") as f:
-                    json.dump(disk_data, f, indent=2)
-                logger.info(f"[ingest] disk write OK: {filename}")
-            else:
-                logger.info(f"[ingest] disk already has {date_str} in {filename}, skipped")
-        except Exception as disk_err:
-            # Non-fatal — in-memory update already succeeded
-            logger.warning(f"[ingest] disk write failed (non-fatal): {disk_err}")
-
-        return jsonify({
-            "success":        True,
-            "game":           game,
-            "session":        session_raw,
-            "date":           date_str,
-            "winning_number": winning_number,
-        }), 200
+        dry_run = bool(body.get("dryRun") or request.args.get("dryRun") == "true")
+        resp, status = ingest_draws([body], dry_run=dry_run)[0]
+        return jsonify(resp), status
 
     except Exception as e:
         logger.error(f"results_ingest error: {e}", exc_info=True)
@@ -2905,9 +4098,11 @@ def fetch_latest_results():
 
     try:
         from fetch_ga_results import fetch_and_ingest
-        secret    = os.environ.get("PREDICTIONS_API_SECRET", "")
-        self_url  = request.host_url.rstrip("/") + "/api/results/ingest"
-        result    = fetch_and_ingest(self_url, secret, dry_run=dry_run)
+        result = fetch_and_ingest(
+            dry_run=dry_run,
+            ingest_fn=lambda payloads, dry_run: ingest_draws(
+                payloads, dry_run=dry_run, source="fetch-latest"),
+        )
         result["success"] = True
         return jsonify(result), 200
     except Exception as e:
@@ -2926,27 +4121,31 @@ def admin_prune_mmfsn():
     if not _check_prediction_secret():
         return jsonify({"success": False, "error": "Unauthorized"}), 403
 
-    mmfsn_dir = os.path.join(JACKPOT_SYSTEM_DIR, "data", "mmfsn_profiles")
-    if not os.path.exists(mmfsn_dir):
-        return jsonify({"success": True, "deleted": 0, "kept": 0}), 200
+    from pathlib import Path
+    from jackpot_system_v3.core.mmfsn_v3 import iter_mmfsn_profiles
 
     deleted, kept = 0, 0
-    for fname in os.listdir(mmfsn_dir):
-        if not fname.endswith("_mmfsn.json"):
-            continue
-        fpath = os.path.join(mmfsn_dir, fname)
+    removed = []
+    for fpath, data in iter_mmfsn_profiles(Path(JACKPOT_SYSTEM_DIR)):
         try:
-            with open(fpath, encoding="utf-8") as f:
-                data = json.load(f)
+            if data is None:
+                raise ValueError("unreadable profile")
             nums = data.get("mmfsn_numbers", {})
             has_data = bool(nums.get("Cash3") or nums.get("Cash4"))
             if not has_data:
                 os.remove(fpath)
+                removed.append(str(fpath))
                 deleted += 1
             else:
                 kept += 1
         except Exception:
             kept += 1  # don't delete files we can't parse
+    if removed:
+        _invalidate_mmfsn_profiles(removed)
+        # Subscribers may now resolve to a different profile: drop cached
+        # predictions here and move the stamp the other workers key on.
+        _touch_subscriber_sync_stamp()
+        _invalidate_prediction_cache()
 
     logger.info(f"MMFSN prune: deleted={deleted} kept={kept}")
     return jsonify({"success": True, "deleted": deleted, "kept": kept}), 200
@@ -2979,7 +4178,8 @@ def predictions_probe():
         _c3_hist = [d["winning_numbers"] for d in _gad.get("cash3_mid", []) + _gad.get("cash3_eve", []) + _gad.get("cash3_night", [])]
 
         try:
-            from jackpot_system_v3.core.pick_engine_v3 import _recommended_play as _rp_fn, _confidence_ui as _cui_fn
+            from jackpot_system_v3.core.pick_engine_v3 import _recommended_play as _rp_fn, _confidence_ui as _cui_fn, build_play_history
+            _c3_hist = build_play_history(_c3_hist)
             _import_ok = True
         except Exception as _ie:
             _import_ok = False
@@ -3009,7 +4209,7 @@ def predictions_probe():
 
         game_counts = Counter(p.get("game") for p in raw)
         session_counts = Counter(f"{p.get('game')}/{p.get('session')}" for p in raw if p.get("game") in ("Cash3","Cash4"))
-        ev_available = _EV_RERANKER is not None
+        ev_available = _get_ev_reranker() is not None
         return jsonify({
             "success":        True,
             "date":           date_str,
@@ -3054,6 +4254,7 @@ def ev_observe_cron():
         return jsonify({"success": False, "error": "Unauthorized"}), 403
     if not _CASH3_EV_AVAILABLE:
         return jsonify({"success": False, "error": "EV modules not available"}), 503
+    ev_reranker = _get_ev_reranker()
 
     date_str = (
         request.args.get("date")
@@ -3068,7 +4269,7 @@ def ev_observe_cron():
     ).upper()
 
     try:
-        from jackpot_system_v3.core.pick_engine_v3 import _recommended_play, _confidence_ui
+        from jackpot_system_v3.core.pick_engine_v3 import _recommended_play, _confidence_ui, build_play_history
         from datetime import date as _date_cls
         import glob as _glob
 
@@ -3111,10 +4312,10 @@ def ev_observe_cron():
         _multi_picks: list = []
 
         _gad    = _load_ga_data_from_json()
-        _c3_hist = [
+        _c3_hist = build_play_history([
             d["winning_numbers"]
             for d in _gad.get("cash3_mid", []) + _gad.get("cash3_eve", []) + _gad.get("cash3_night", [])
-        ]
+        ])
 
         # Single-profile picks (existing behaviour — MBO default)
         all_predictions = get_predictions_for_date(date_str, "BOOK3")
@@ -3149,7 +4350,7 @@ def ev_observe_cron():
             # If caller scoped to a specific session, skip others
             if session_filter and sess != session_filter:
                 continue
-            if _EV_RERANKER is None:
+            if ev_reranker is None:
                 continue
             conf    = p.get("confidence_score") or 0.0
             _lane   = p.get("lane", "")
@@ -3172,12 +4373,12 @@ def ev_observe_cron():
                 if _gid in gate_map:
                     continue  # skip duplicates within this run
 
-                _scored = _EV_RERANKER.score_pick(
+                _scored = ev_reranker.score_pick(
                     game=game, play_type=_play_type,
                     session=sess,
                     tier=_ev_tier, pick=_num, draw_date=_draw_date,
                 )
-                _ev_decision, _ = _EV_RERANKER._decide(_scored)
+                _ev_decision, _ = ev_reranker._decide(_scored)
 
                 gate_map[_gid] = True
                 ev_picks_to_log.append({
@@ -3221,7 +4422,7 @@ def ev_observe_cron():
                 sess = (p.get("session") or "").upper()
                 if session_filter and sess != session_filter:
                     continue
-                if _EV_RERANKER is None:
+                if ev_reranker is None:
                     continue
                 conf    = p.get("confidence_score") or 0.0
                 _lane   = p.get("lane", "")
@@ -3237,12 +4438,12 @@ def ev_observe_cron():
                     _gid = make_grain_id(date_str, sess, game, _play_type, _num)
                     if _gid in gate_map:
                         continue
-                    _scored = _EV_RERANKER.score_pick(
+                    _scored = ev_reranker.score_pick(
                         game=game, play_type=_play_type,
                         session=sess,
                         tier=_ev_tier, pick=_num, draw_date=_draw_date,
                     )
-                    _ev_decision, _ = _EV_RERANKER._decide(_scored)
+                    _ev_decision, _ = ev_reranker._decide(_scored)
                     gate_map[_gid] = True
                     ev_picks_to_log.append({
                         "date":                date_str,
@@ -3294,7 +4495,7 @@ def ev_observe_cron():
                 _sess = (_sp.get("session") or "").upper()
                 if session_filter and _sess != session_filter:
                     continue
-                if _EV_RERANKER is None:
+                if ev_reranker is None:
                     continue
                 _conf  = _sp.get("confidence_score") or 0.0
                 _num   = str(_sp.get("number", ""))
@@ -3307,12 +4508,12 @@ def ev_observe_cron():
                     _mgid = f"{date_str}|{_sub_id}|{_sess}|cash3|{_pt.lower()}|{_num}"
                     if _mgid in _multi_logged_grains:
                         continue
-                    _mscored = _EV_RERANKER.score_pick(
+                    _mscored = ev_reranker.score_pick(
                         game="Cash3", play_type=_pt,
                         session=_sess, tier=_ev_tier,
                         pick=_num, draw_date=_draw_date,
                     )
-                    _mev_decision, _ = _EV_RERANKER._decide(_mscored)
+                    _mev_decision, _ = ev_reranker._decide(_mscored)
                     _multi_logged_grains.add(_mgid)
                     _multi_picks.append({
                         "grain_id":      _mgid,
@@ -3510,6 +4711,7 @@ def soul_compass_write():
 # ---------------------------------------------------------------------------
 
 @app.route("/api/convergence-alerts/today", methods=["GET"])
+@_shared_cache("game", "require_alignment", "session", require_secret=True)
 def convergence_alerts_today():
     """
     Run the pre-draw convergence scanner and return all active alerts.
@@ -3623,6 +4825,7 @@ def convergence_alerts_today():
 
 
 @app.route("/api/triple-environment/today", methods=["GET"])
+@_shared_cache("session", require_secret=True)
 def triple_environment_today():
     """
     Check whether today's date-level celestial conditions activate the
@@ -3756,6 +4959,7 @@ def triple_environment_today():
 # GET /api/quad-environment/today
 # ---------------------------------------------------------------------------
 @app.route("/api/quad-environment/today", methods=["GET"])
+@_shared_cache("session", require_secret=True)
 def quad_environment_today():
     """
     Check whether today's date-level conditions activate the Cash4 quad
@@ -3837,6 +5041,13 @@ def quad_environment_today():
         return jsonify({"success": False, "error": str(e)}), 500
 
 
+# Pick up draws other workers (or earlier runs) ingested before warming up;
+# no warm-cache thread here, this may be the gunicorn master about to fork
+_prune_shared_draws()
+_sync_shared_draws(warm=False)
+_start_subsystem_warmup()
+
+
 if __name__ == "__main__":
     port = int(os.getenv("PORT", 5000))
     app.run(host="0.0.0.0", port=port, debug=False)
@@ -18,24 +18,17 @@ import argparse
 import os
 import re
 import sys
+from functools import partial
 from typing import Dict, List, Optional
 
 import requests
 
+from fetch_ga_results import fetch_pages
+
 # ── Config ─────────────────────────────────────────────────────────────────────
 
 INGEST_URL = "https://mybestodds-flask-api-production.up.railway.app/api/results/ingest"
 
-_BROWSER_HEADERS = {
-    "User-Agent": (
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-        "AppleWebKit/537.36 (KHTML, like Gecko) "
-        "Chrome/124.0.0.0 Safari/537.36"
-    ),
-    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-    "Accept-Language": "en-US,en;q=0.9",
-}
-
 # lotterypost.com past results URLs
 _PAST_URLS = {
     "Cash3": "https://www.lotterypost.com/results/ga/cash3/past",
@@ -50,19 +43,6 @@ _SESSION_MAP = {
 }
 
 
-# ── Fetch ──────────────────────────────────────────────────────────────────────
-
-def _fetch(url: str) -> Optional[str]:
-    try:
-        resp = requests.get(url, headers=_BROWSER_HEADERS, timeout=20, allow_redirects=True)
-        if resp.status_code == 200:
-            return resp.text
-        print(f"[fetch] HTTP {resp.status_code} for {url}", file=sys.stderr)
-    except requests.RequestException as e:
-        print(f"[fetch] {e}", file=sys.stderr)
-    return None
-
-
 # ── Parser ─────────────────────────────────────────────────────────────────────
 
 def _parse_past_results(html: str, game: str) -> List[Dict]:
@@ -169,14 +149,18 @@ def run(secret: str, dry_run: bool = False) -> None:
     total_skip = 0
     total_err = 0
 
+    # Both past-results pages are fetched concurrently over the shared pooled
+    # session; unchanged pages come back from the conditional-request cache.
+    print(f"\n[backfill] Fetching {', '.join(_PAST_URLS)} past results …")
+    pages = fetch_pages({url: partial(_parse_past_results, game=game)
+                         for game, url in _PAST_URLS.items()})
+
     for game, url in _PAST_URLS.items():
-        print(f"\n[backfill] Fetching {game} past results …")
-        html = _fetch(url)
-        if not html:
+        rows = pages.get(url)
+        if rows is None:
             print(f"[backfill] SKIP {game} — no HTML")
             continue
 
-        rows = _parse_past_results(html, game)
         print(f"[backfill] Parsed {len(rows)} {game} draws")
         total_fetched += len(rows)
 
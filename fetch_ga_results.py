@@ -12,7 +12,10 @@ Usage (standalone):
     python fetch_ga_results.py [--dry-run] [--ingest-url URL]
 
 Usage (called from Flask endpoint /api/results/fetch-latest):
-    results = fetch_and_ingest(ingest_url, secret, dry_run=False)
+    results = fetch_and_ingest(dry_run=False, ingest_fn=ingest_draws)
+
+The endpoint passes the server's in-process ingest function, so draws are
+applied directly as one batch; the HTTP ingest URL is only used by the CLI.
 
 Draw schedule (Eastern Time):
     Midday : 12:29 PM  → fetch at 12:45 PM
@@ -25,10 +28,14 @@ Cron trigger (cron-job.org, free):
 """
 
 import argparse
+import json
+import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
-from typing import Dict, List, Optional
+from threading import Lock
+from typing import Callable, Dict, List, Optional, Tuple
 
 import requests
 
@@ -48,7 +55,8 @@ _BROWSER_HEADERS = {
     "Pragma": "no-cache",
 }
 
-_LP_URL = "https://www.lotterypost.com/results/ga"
+# GA_RESULTS_URL points the fetcher at a local stub server for offline tests.
+_LP_URL = os.getenv("GA_RESULTS_URL", "https://www.lotterypost.com/results/ga")
 
 # lotterypost.com assigns stable data-id values to each GA draw session.
 # Confirmed 2026-04-28 by parsing /results/ga HTML.
@@ -66,18 +74,139 @@ _ET = timezone(timedelta(hours=-5))
 
 
 # ── Fetcher ───────────────────────────────────────────────────────────────────
+# One pooled Session is shared by every fetch so cron runs and backfills reuse
+# connections.  Pages are fetched with If-None-Match / If-Modified-Since; on a
+# 304 the parsed rows from the previous 200 are reused, so unchanged pages are
+# neither downloaded nor re-parsed.  The parsed-results cache is persisted to
+# _CACHE_PATH (best-effort) and survives restarts of the CLI.
+
+_MAX_WORKERS = int(os.getenv("GA_FETCH_WORKERS", "4"))
+_CACHE_PATH  = os.getenv(
+    "GA_FETCH_CACHE",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                 "jackpot_system_v3", "data", "lotterypost_cache.json"),
+)
+
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = Lock()
+
+# url -> {"etag": str, "last_modified": str, "rows": [...], "fetched_at": iso}
+_PAGE_CACHE: Dict[str, Dict] = {}
+_PAGE_CACHE_LOCK = Lock()
+_PAGE_CACHE_LOADED = False
+
+
+def _get_session() -> requests.Session:
+    """Return the shared, connection-pooled Session (created on first use)."""
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=_MAX_WORKERS, pool_maxsize=_MAX_WORKERS)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers.update(_BROWSER_HEADERS)
+            _SESSION = session
+        return _SESSION
+
+
+def _load_page_cache() -> None:
+    global _PAGE_CACHE_LOADED
+    with _PAGE_CACHE_LOCK:
+        if _PAGE_CACHE_LOADED:
+            return
+        _PAGE_CACHE_LOADED = True
+        if not _CACHE_PATH or not os.path.exists(_CACHE_PATH):
+            return
+        try:
+            with open(_CACHE_PATH, "r", encoding="utf-8") as f:
+                _PAGE_CACHE.update(json.load(f))
+        except Exception as e:
+            print(f"[cache] could not load {_CACHE_PATH}: {e}", file=sys.stderr)
+
+
+def _save_page_cache() -> None:
+    if not _CACHE_PATH:
+        return
+    with _PAGE_CACHE_LOCK:
+        snapshot = dict(_PAGE_CACHE)
+    try:
+        os.makedirs(os.path.dirname(_CACHE_PATH), exist_ok=True)
+        with open(_CACHE_PATH, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f, indent=2)
+    except Exception as e:
+        print(f"[cache] could not write {_CACHE_PATH}: {e}", file=sys.stderr)
+
+
+def _fetch_parsed(
+    url: str,
+    parse: Callable[[str], List[Dict]],
+    timeout: int = 15,
+) -> Tuple[Optional[List[Dict]], bool]:
+    """
+    Conditionally fetch url and parse it.
+    Returns (rows, changed); rows is None when the fetch failed.
+    """
+    with _PAGE_CACHE_LOCK:
+        cached = _PAGE_CACHE.get(url)
+    headers = {}
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
 
-def _fetch_page(url: str, timeout: int = 15) -> Optional[str]:
-    """Fetch a page with browser headers. Returns HTML or None on failure."""
     try:
-        resp = requests.get(url, headers=_BROWSER_HEADERS, timeout=timeout, allow_redirects=True)
-        if resp.status_code == 200:
-            return resp.text
-        print(f"[fetch] HTTP {resp.status_code} for {url}", file=sys.stderr)
-        return None
+        resp = _get_session().get(url, headers=headers, timeout=timeout, allow_redirects=True)
     except requests.RequestException as e:
         print(f"[fetch] Request failed: {e}", file=sys.stderr)
-        return None
+        return None, False
+
+    if resp.status_code == 304 and cached:
+        print(f"[fetch] {url} not modified — reusing {len(cached['rows'])} cached rows")
+        return [dict(r) for r in cached["rows"]], False
+    if resp.status_code != 200:
+        print(f"[fetch] HTTP {resp.status_code} for {url}", file=sys.stderr)
+        return None, False
+
+    rows = parse(resp.text)
+    with _PAGE_CACHE_LOCK:
+        _PAGE_CACHE[url] = {
+            "etag":          resp.headers.get("ETag", ""),
+            "last_modified": resp.headers.get("Last-Modified", ""),
+            "rows":          rows,
+            "fetched_at":    datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        }
+    return [dict(r) for r in rows], True
+
+
+def fetch_pages(
+    pages: Dict[str, Callable[[str], List[Dict]]],
+    max_workers: Optional[int] = None,
+) -> Dict[str, Optional[List[Dict]]]:
+    """
+    Fetch and parse several pages concurrently.
+
+    pages maps url -> parser(html) -> rows.  At most max_workers (default
+    GA_FETCH_WORKERS, 4) requests are in flight.  Returns url -> rows, or
+    None for pages that could not be fetched.
+    """
+    _load_page_cache()
+    if not pages:
+        return {}
+    workers = max(1, min(max_workers or _MAX_WORKERS, len(pages)))
+    out: Dict[str, Optional[List[Dict]]] = {}
+    changed = False
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {url: pool.submit(_fetch_parsed, url, parse) for url, parse in pages.items()}
+        for url, fut in futures.items():
+            rows, page_changed = fut.result()
+            out[url] = rows
+            changed = changed or page_changed
+    if changed:
+        _save_page_cache()
+    return out
 
 
 # ── Parser ────────────────────────────────────────────────────────────────────
@@ -150,13 +279,11 @@ def fetch_latest_results() -> Dict[str, List[Dict]]:
     Returns {"cash3": [...], "cash4": [...]}
     """
     print(f"[fetch] Fetching {_LP_URL}")
-    html = _fetch_page(_LP_URL)
-    if not html:
+    all_rows = fetch_pages({_LP_URL: _parse_lotterypost})[_LP_URL]
+    if all_rows is None:
         print("[fetch] No HTML returned", file=sys.stderr)
         return {"cash3": [], "cash4": []}
 
-    all_rows = _parse_lotterypost(html)
-
     cash3 = [r for r in all_rows if r["game"] == "Cash3"]
     cash4 = [r for r in all_rows if r["game"] == "Cash4"]
     print(f"[fetch] Parsed {len(cash3)} Cash3, {len(cash4)} Cash4 results")
@@ -165,60 +292,93 @@ def fetch_latest_results() -> Dict[str, List[Dict]]:
 
 # ── Ingest ────────────────────────────────────────────────────────────────────
 
+def _ingest_payloads(results: Dict[str, List[Dict]], dry_run: bool) -> List[Dict]:
+    """Flatten fetched rows into /api/results/ingest request bodies."""
+    payloads = []
+    for game_key, rows in results.items():
+        game_name = "Cash3" if game_key == "cash3" else "Cash4"
+        for row in rows:
+            payloads.append({
+                "game":           game_name,
+                "session":        row.get("session", ""),
+                "date":           row.get("date", ""),
+                "winning_number": row.get("winning_number", ""),
+                "dryRun":         dry_run,
+            })
+    return payloads
+
+
+def _log_ingest(payload: Dict, status_code: int, dry_run: bool) -> None:
+    status = "DRY-RUN" if dry_run else ("OK" if status_code == 200 else "FAIL")
+    print(f"[ingest] {status} {payload['game']} {payload['session']} "
+          f"{payload['date']} -> {payload['winning_number']}")
+
+
 def ingest_results(
     results: Dict[str, List[Dict]],
-    ingest_url: str,
-    secret: str,
+    ingest_url: Optional[str] = None,
+    secret: str = "",
     dry_run: bool = False,
+    ingest_fn: Optional[Callable[[List[Dict], bool], List[Tuple[Dict, int]]]] = None,
 ) -> List[Dict]:
     """
-    POST each result row to /api/results/ingest.
+    Ingest each result row.
+
+    With ingest_fn (the API server's in-process ingest_draws) the whole batch
+    is applied in one call — no HTTP round-trip.  Otherwise each row is POSTed
+    to ingest_url (CLI / remote use).
     Returns list of ingest response dicts.
     """
+    payloads  = _ingest_payloads(results, dry_run)
     responses = []
+
+    if ingest_fn is not None:
+        for payload, (data, status_code) in zip(payloads, ingest_fn(payloads, dry_run)):
+            data = dict(data)
+            data["_status_code"] = status_code
+            data["_payload"] = payload
+            responses.append(data)
+            _log_ingest(payload, status_code, dry_run)
+        return responses
+
+    if not ingest_url:
+        raise ValueError("ingest_url or ingest_fn is required")
+
     headers = {
         "Content-Type": "application/json",
         "X-Prediction-Secret": secret,
     }
-
-    for game_key, rows in results.items():
-        for row in rows:
-            game_name = "Cash3" if game_key == "cash3" else "Cash4"
-            payload = {
-                "game":           game_name,
-                "session":        row.get("session", ""),
-                "date":           row.get("date", ""),
-                "winning_number": row.get("winning_number", ""),
-                "dryRun":         dry_run,
-            }
-            try:
-                resp = requests.post(ingest_url, json=payload, headers=headers, timeout=10)
-                data = resp.json() if resp.headers.get("content-type", "").startswith("application/json") else {"raw": resp.text}
-                data["_status_code"] = resp.status_code
-                data["_payload"] = payload
-                responses.append(data)
-                status = "DRY-RUN" if dry_run else ("OK" if resp.status_code == 200 else "FAIL")
-                print(f"[ingest] {status} {game_name} {row.get('session')} {row.get('date')} -> {row.get('winning_number')}")
-            except requests.RequestException as e:
-                err = {"error": str(e), "_payload": payload}
-                responses.append(err)
-                print(f"[ingest] ERROR {game_name}: {e}", file=sys.stderr)
+    for payload in payloads:
+        try:
+            resp = requests.post(ingest_url, json=payload, headers=headers, timeout=10)
+            data = resp.json() if resp.headers.get("content-type", "").startswith("application/json") else {"raw": resp.text}
+            data["_status_code"] = resp.status_code
+            data["_payload"] = payload
+            responses.append(data)
+            _log_ingest(payload, resp.status_code, dry_run)
+        except requests.RequestException as e:
+            err = {"error": str(e), "_payload": payload}
+            responses.append(err)
+            print(f"[ingest] ERROR {payload['game']}: {e}", file=sys.stderr)
 
     return responses
 
 
 def fetch_and_ingest(
-    ingest_url: str,
-    secret: str,
+    ingest_url: Optional[str] = None,
+    secret: str = "",
     dry_run: bool = False,
+    ingest_fn: Optional[Callable[[List[Dict], bool], List[Tuple[Dict, int]]]] = None,
 ) -> Dict:
     """
     Full pipeline: fetch galottery.com → parse → ingest.
-    Called from the Flask /api/results/fetch-latest endpoint.
+    Called from the Flask /api/results/fetch-latest endpoint with ingest_fn
+    set, so draws are applied in-process as one batch.
     """
     results   = fetch_latest_results()
     total     = sum(len(v) for v in results.values())
-    responses = ingest_results(results, ingest_url, secret, dry_run=dry_run)
+    responses = ingest_results(results, ingest_url, secret, dry_run=dry_run,
+                               ingest_fn=ingest_fn)
     successes = sum(1 for r in responses if r.get("success") or r.get("dryRun"))
 
     return {
@@ -0,0 +1,53 @@
+"""
+gunicorn.conf.py
+================
+Gunicorn settings for the web process (Procfile: gunicorn -c gunicorn.conf.py api_server:app).
+
+With preload (the default), api_server is imported once in the master and its
+read-only state is built there before workers fork (STARTUP_WARMUP is forced
+to eager): the EV reranker history; the pick engine's per-session base stats,
+positional frequencies, Cash4 straight-ranking tables and jackpot histories;
+the due-signal pool scores; and the celestial fingerprints.  Workers then
+share those pages copy-on-write instead of each building its own copy.  Per-request caches
+(prediction / shared responses, single-flight) start empty in every worker
+and are only ever mutated there; each worker applies draws ingested by the
+others from the shared draw log (DRAW_STATE_DB) and rebuilds its own caches.
+
+The garbage collector follows the CPython guidance for fork-without-exec:
+disabled in the master while the app loads, gc.freeze() right before each
+fork so collections in the children never touch (and un-share) the
+inherited objects, re-enabled in each worker.
+
+Env:
+    GUNICORN_PRELOAD=false   — import the app in each worker instead
+                               (background warm-up, see /ready)
+    WEB_CONCURRENCY, PORT    — read by gunicorn itself
+"""
+
+import gc
+import os
+import sys
+
+preload_app = os.getenv("GUNICORN_PRELOAD", "true").strip().lower() not in {
+    "0", "false", "no", "off"
+}
+
+if preload_app:
+    # No warm-up thread in the master: threads do not survive fork, and a
+    # subsystem lock held by one would be inherited locked by every worker.
+    # Load every subsystem synchronously while the app is imported.
+    if os.environ.get("STARTUP_WARMUP", "eager").strip().lower() != "eager":
+        print(f"gunicorn.conf: STARTUP_WARMUP={os.environ['STARTUP_WARMUP']} ignored "
+              "with preload; using eager", file=sys.stderr)
+    os.environ["STARTUP_WARMUP"] = "eager"
+    gc.disable()
+
+
+def pre_fork(server, worker):
+    if preload_app:
+        gc.freeze()
+
+
+def post_fork(server, worker):
+    if preload_app:
+        gc.enable()
@@ -45,7 +45,9 @@ from __future__ import annotations
 
 import argparse
 import csv
+import heapq
 import math
+import random
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
@@ -285,6 +287,10 @@ def bonus_avoidance_score(bonus: int, bonus_min: int, bonus_max: int) -> float:
     return 0.0 if bonus in popular_bonus else 1.0
 
 
+# Minimum composite score per grade, best grade first
+GRADE_THRESHOLDS: Dict[str, float] = {"A": 0.75, "B": 0.60, "C": 0.45, "D": 0.0}
+
+
 @dataclass
 class ComboScore:
     game: str
@@ -305,12 +311,9 @@ class ComboScore:
         return f"{nums} | B {self.bonus:02d}"
 
     def grade(self) -> str:
-        if self.composite_score >= 0.75:
-            return "A"
-        if self.composite_score >= 0.60:
-            return "B"
-        if self.composite_score >= 0.45:
-            return "C"
+        for grade, threshold in GRADE_THRESHOLDS.items():
+            if self.composite_score >= threshold:
+                return grade
         return "D"
 
 
@@ -357,6 +360,236 @@ def score_combination(
     )
 
 
+@dataclass(frozen=True)
+class _ScoreTables:
+    """Per-game lookups shared by every line in a score_combinations() batch."""
+    zone_of: Dict[int, int]       # main ball -> field zone 0..4
+    popular: frozenset
+    bonus_score: Dict[int, float]
+    secondary_ev: float
+
+
+_SCORE_TABLES: Dict[str, _ScoreTables] = {}
+
+
+def _score_tables(game: str) -> _ScoreTables:
+    tables = _SCORE_TABLES.get(game)
+    if tables is None:
+        cfg = GAME_CONFIGS[game]
+        zone_size = (cfg.main_max - cfg.main_min + 1) / 5
+        tables = _ScoreTables(
+            zone_of={
+                n: min(int((n - cfg.main_min) / zone_size), 4)
+                for n in range(cfg.main_min, cfg.main_max + 1)
+            },
+            popular=_popular_main_set(cfg.main_max),
+            bonus_score={
+                b: bonus_avoidance_score(b, cfg.bonus_min, cfg.bonus_max)
+                for b in range(cfg.bonus_min, cfg.bonus_max + 1)
+            },
+            secondary_ev=secondary_prize_ev(cfg),
+        )
+        _SCORE_TABLES[game] = tables
+    return tables
+
+
+def score_combinations(
+    lines: List[Tuple[List[int], int]],
+    game: str,
+) -> List[ComboScore]:
+    """
+    Score many combinations at once — same results as calling
+    score_combination() per line, in input order.
+
+    lines: sequence of (main_numbers, bonus) pairs.
+    Zone, popular-cluster, bonus-avoidance and secondary-EV values come
+    from per-game lookup tables built once, not per line.
+    """
+    cfg = GAME_CONFIGS[game]
+    t = _score_tables(game)
+    zone_of, popular, bonus_score = t.zone_of, t.popular, t.bonus_score
+    zone_size = (cfg.main_max - cfg.main_min + 1) / 5
+
+    results: List[ComboScore] = []
+    for main_numbers, bonus in lines:
+        nums = sorted(main_numbers)
+
+        zones: set = set()
+        for n in nums:
+            z = zone_of.get(n)
+            if z is None:  # out-of-range ball — same arithmetic as the scalar path
+                z = min(int((n - cfg.main_min) / zone_size), 4)
+            zones.add(z)
+        consecutive_pairs = sum(
+            1 for i in range(len(nums) - 1) if nums[i + 1] - nums[i] <= 2
+        )
+        fc = max(0.0, round(len(zones) / 5 - consecutive_pairs * 0.04, 4))
+
+        popular_in_combo = [n for n in nums if n in popular]
+        pa = round((len(nums) - len(popular_in_combo)) / len(nums), 4)
+
+        ba = bonus_score.get(bonus)
+        if ba is None:
+            ba = bonus_avoidance_score(bonus, cfg.bonus_min, cfg.bonus_max)
+
+        results.append(ComboScore(
+            game=game,
+            main_numbers=nums,
+            bonus=bonus,
+            field_coverage=fc,
+            popular_avoidance=pa,
+            bonus_avoidance=ba,
+            composite_score=round(0.40 * fc + 0.45 * pa + 0.15 * ba, 4),
+            secondary_ev=t.secondary_ev,
+            ticket_price=cfg.ticket_price,
+            zones_covered=len(zones),
+            popular_count=len(popular_in_combo),
+            popular_numbers=popular_in_combo,
+        ))
+    return results
+
+
+# ---------------------------------------------------------------------------
+# Bounded search — top-N lines without random pooling
+# ---------------------------------------------------------------------------
+
+def _suffix_gain_table(
+    zones: List[int], nonpop: List[bool], count: int,
+) -> List[List[List[float]]]:
+    """
+    best[i][k][lz + 1] = max of 0.40·new_zones/5 + 0.45·non_popular/5 over
+    k ascending balls taken from index ≥ i, given the previous ball sat in
+    zone lz (-1 = none yet).  Ignores the adjacency penalty, so it is an
+    upper bound on what the remaining slots can add.
+    """
+    n = len(zones)
+    neg = float("-inf")
+    best = [[[neg] * 6 for _ in range(count + 1)] for _ in range(n + 1)]
+    for i in range(n + 1):
+        for lz in range(6):
+            best[i][0][lz] = 0.0
+    for i in range(n - 1, -1, -1):
+        zi = zones[i]
+        take_gain = 0.45 / 5 * nonpop[i]
+        for k in range(1, count + 1):
+            for lz in range(6):
+                skip = best[i + 1][k][lz]
+                rest = best[i + 1][k - 1][zi + 1]
+                take = neg if rest == neg else (
+                    rest + take_gain + (0.40 / 5 if zi > lz - 1 else 0.0)
+                )
+                best[i][k][lz] = skip if skip >= take else take
+    return best
+
+
+def search_top_combinations(
+    game: str,
+    n: int,
+    *,
+    min_grade: str = "A",
+    seed: Optional[int] = None,
+    main_weights: Optional[Dict[int, float]] = None,
+    bonus_weights: Optional[Dict[int, float]] = None,
+    max_overlap: int = 2,
+    max_expansions: int = 200_000,
+) -> List[ComboScore]:
+    """
+    Best-first branch-and-bound over ascending main-ball prefixes.
+
+    Each partial line carries an admissible upper bound on its composite
+    score (current components + best achievable from the remaining slots
+    + best bonus), so lines come off the queue in decreasing score order
+    and every branch that cannot reach min_grade is pruned.  Stops once n
+    lines at or above the grade threshold are found.
+
+    Ties are broken by a seeded key (frequency-weighted when weights are
+    given) so each subscriber gets a different slice of the equal-score
+    frontier; accepted lines share at most max_overlap main balls.
+    Returns fewer than n only if the grade is unreachable or the
+    expansion cap is hit.
+    """
+    cfg = GAME_CONFIGS[game]
+    t = _score_tables(game)
+    rng = random.Random(seed)
+    threshold = GRADE_THRESHOLDS[min_grade] - 1e-4  # composite is rounded to 4 dp
+    k = cfg.main_count
+
+    balls = list(range(cfg.main_min, cfg.main_max + 1))
+    zones = [t.zone_of[b] for b in balls]
+    nonpop = [b not in t.popular for b in balls]
+    suffix = _suffix_gain_table(zones, nonpop, k)
+    bonuses = list(range(cfg.bonus_min, cfg.bonus_max + 1))
+    best_bonus = 0.15 * max(t.bonus_score[b] for b in bonuses)
+
+    def _tiebreak(weights: Optional[Dict[int, float]], ball: int) -> float:
+        if weights:
+            return rng.expovariate(weights.get(ball, 0) + 1)
+        return rng.random()
+
+    # heap entry: (-bound, -depth, tiebreak, counter, state)
+    # state: (next_index, chosen, zone_count, last_zone, pairs, nonpop_count)
+    heap: list = []
+    counter = 0
+    root_bound = suffix[0][k][0] + best_bonus
+    heapq.heappush(heap, (-round(root_bound, 9), 0, 0.0, counter, (0, (), 0, -1, 0, 0)))
+
+    accepted: List[ComboScore] = []
+    expansions = 0
+    while heap and len(accepted) < n and expansions < max_expansions:
+        _, _, _, _, state = heapq.heappop(heap)
+        expansions += 1
+        nxt, chosen, zone_count, last_zone, pairs, npop = state
+
+        main_set = set(chosen[:k])
+        if any(len(main_set & set(a.main_numbers)) > max_overlap for a in accepted):
+            continue
+
+        if len(chosen) == k + 1:  # mains + bonus — a complete line
+            cs = score_combinations([(list(chosen[:k]), chosen[k])], game)[0]
+            if cs.composite_score >= GRADE_THRESHOLDS[min_grade]:
+                accepted.append(cs)
+            continue
+
+        partial = 0.40 * (zone_count / 5 - pairs * 0.04) + 0.45 * npop / 5
+
+        if len(chosen) == k:  # choose the bonus ball
+            for b in bonuses:
+                bound = partial + 0.15 * t.bonus_score[b]
+                if bound < threshold:
+                    continue
+                counter += 1
+                heapq.heappush(heap, (
+                    -round(bound, 9), -(k + 1), _tiebreak(bonus_weights, b), counter,
+                    (nxt, chosen + (b,), zone_count, last_zone, pairs, npop),
+                ))
+            continue
+
+        remaining = k - len(chosen) - 1
+        for i in range(nxt, len(balls) - remaining):
+            ball = balls[i]
+            zi = zones[i]
+            new_zone = zi > last_zone
+            new_pairs = pairs + (1 if chosen and ball - chosen[-1] <= 2 else 0)
+            new_npop = npop + nonpop[i]
+            new_zc = zone_count + new_zone
+            rest = suffix[i + 1][remaining][zi + 1]
+            if rest == float("-inf"):
+                continue
+            bound = (
+                0.40 * (new_zc / 5 - new_pairs * 0.04) + 0.45 * new_npop / 5
+                + rest + best_bonus
+            )
+            if bound < threshold:
+                continue
+            counter += 1
+            heapq.heappush(heap, (
+                -round(bound, 9), -(len(chosen) + 1), _tiebreak(main_weights, ball), counter,
+                (i + 1, chosen + (ball,), new_zc, zi, new_pairs, new_npop),
+            ))
+
+    return accepted
+
+
 # ---------------------------------------------------------------------------
 # Historical data audit
 # ---------------------------------------------------------------------------
@@ -406,7 +639,7 @@ def audit_historical(game: str) -> GameAudit:
 
     popular_pcts = [sum(1 for n in d if n in popular) / 5 for d in draws]
     spread_scores = [
-        field_coverage_score(d, cfg.main_min, cfg.main_max) for d in draws
+        cs.field_coverage for cs in score_combinations(list(zip(draws, bonuses)), game)
     ]
     high_spread = sum(1 for s in spread_scores if s >= 0.80)
 
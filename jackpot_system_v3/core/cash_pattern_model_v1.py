@@ -9,10 +9,12 @@ Recalibrated Cash3 / Cash4 prediction engine for My Best Odds V3.
 - Exposes a simple API that pick_engine_v3 can call:
     - build_cash_history(...)
     - score_cash_combo(...)
+    - build_cash_day_tables(...)   (feature tables for batch scoring)
     - pick_top_cash_combos_for_day(...)
 """
 
 from __future__ import annotations
+import heapq
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
 from typing import Dict, Tuple, List, Optional, Iterable
@@ -258,6 +260,125 @@ def score_cash_combo(
     )
 
 
+@dataclass
+class CashDayTables:
+    """
+    Feature tables for scoring every combo of one game on one day.
+
+    Everything score_cash_combo() re-derives per call — normalized
+    position / digit / sum distributions and the recency curve — is
+    computed once here and then only indexed.
+    """
+    history: CashHistory
+    today: date
+    pos_probs: List[List[float]]                    # [position][digit]
+    digit_probs: List[float]                        # [digit]
+    sum_probs: Dict[int, float]                     # digit-sum -> probability
+    recency: Dict[Digits, Tuple[int, float]]        # seen combo -> (days_since, score)
+
+
+def build_cash_day_tables(history: CashHistory, today: Optional[date] = None) -> CashDayTables:
+    """Precompute the per-day feature tables used by batch scoring."""
+    if today is None:
+        today = history.max_date
+
+    pos_probs = []
+    for idx in range(history.num_digits):
+        pf = _normalize_freq(history.pos_freq.get(idx, Counter()))
+        pos_probs.append([pf.get(d, 0.0) for d in range(10)])
+    dp = _normalize_freq(history.digit_freq)
+
+    recency: Dict[Digits, Tuple[int, float]] = {}
+    for combo, last_seen_date in history.last_seen.items():
+        if last_seen_date:
+            days_since = (today - last_seen_date).days
+            recency[combo] = (days_since, 1.0 - (1.0 / (1.0 + days_since / 30.0)))
+
+    return CashDayTables(
+        history=history,
+        today=today,
+        pos_probs=pos_probs,
+        digit_probs=[dp.get(d, 0.0) for d in range(10)],
+        sum_probs=_normalize_sum_freq(history.sum_freq),
+        recency=recency,
+    )
+
+
+def _score_from_tables(
+    tables: CashDayTables,
+    combo: Digits,
+    overlay_boost: float = 0.0,
+    w_pos: float = 0.35,
+    w_digit: float = 0.25,
+    w_sum: float = 0.20,
+    w_recency: float = 0.20,
+) -> CashComboScore:
+    """score_cash_combo() for an in-range combo, reading precomputed tables."""
+    n = len(combo)
+    pos_score = sum(tables.pos_probs[idx][d] for idx, d in enumerate(combo)) / n
+    digit_score = sum(tables.digit_probs[d] for d in combo) / n
+    sum_score = tables.sum_probs.get(sum(combo), 0.0)
+    days_since, recency_score = tables.recency.get(combo, (None, 0.5))
+    total_score = (
+        w_pos * pos_score +
+        w_digit * digit_score +
+        w_sum * sum_score +
+        w_recency * recency_score
+    ) + overlay_boost
+    return CashComboScore(
+        combo=combo,
+        pos_score=pos_score,
+        digit_score=digit_score,
+        sum_score=sum_score,
+        recency_score=recency_score,
+        overlay_score=overlay_boost,
+        total_score=total_score,
+        days_since_seen=days_since,
+    )
+
+
+def score_all_cash_combo_totals(
+    tables: CashDayTables,
+    overlay_boosts: Optional[List[float]] = None,
+    w_pos: float = 0.35,
+    w_digit: float = 0.25,
+    w_sum: float = 0.20,
+    w_recency: float = 0.20,
+) -> List[float]:
+    """
+    total_score for every combo in generate_all_cash_combos() order, as one
+    pass over the tables.  Values are identical to score_cash_combo().
+    """
+    n = tables.history.num_digits
+    combos = _all_combos(n)
+    pp = tables.pos_probs
+    dp = tables.digit_probs
+    sp = tables.sum_probs
+    rec = tables.recency
+
+    totals = [
+        w_pos * (sum(pp[i][d] for i, d in enumerate(c)) / n) +
+        w_digit * (sum(dp[d] for d in c) / n) +
+        w_sum * sp.get(sum(c), 0.0) +
+        w_recency * rec.get(c, (None, 0.5))[1]
+        for c in combos
+    ]
+    if overlay_boosts is not None:
+        totals = [t + b for t, b in zip(totals, overlay_boosts)]
+    return totals
+
+
+# num_digits -> all combos, enumerated once per process
+_ALL_COMBOS: Dict[int, List[Digits]] = {}
+
+
+def _all_combos(num_digits: int) -> List[Digits]:
+    combos = _ALL_COMBOS.get(num_digits)
+    if combos is None:
+        combos = _ALL_COMBOS[num_digits] = list(generate_all_cash_combos(num_digits))
+    return combos
+
+
 def generate_all_cash_combos(num_digits: int) -> Iterable[Digits]:
     """
     Generate all possible combos for Cash3 / Cash4.
@@ -293,17 +414,22 @@ def pick_top_cash_combos_for_day(
     if today is None:
         today = history.max_date
 
-    scores: List[CashComboScore] = []
-    for combo in generate_all_cash_combos(history.num_digits):
-        boost = 0.0
-        if overlay_boost_fn is not None:
+    tables = build_cash_day_tables(history, today)
+    combos = _all_combos(history.num_digits)
+
+    boosts = None
+    if overlay_boost_fn is not None:
+        boosts = []
+        for combo in combos:
             try:
-                boost = float(overlay_boost_fn(combo, history.game, today))
+                boosts.append(float(overlay_boost_fn(combo, history.game, today)))
             except Exception:
-                boost = 0.0
-        sc = score_cash_combo(combo, history, today=today, overlay_boost=boost)
-        scores.append(sc)
-
-    # Sort by total_score descending
-    scores.sort(key=lambda s: s.total_score, reverse=True)
-    return scores[:k]
+                boosts.append(0.0)
+    totals = score_all_cash_combo_totals(tables, overlay_boosts=boosts)
+
+    # Top k by total_score descending; ties keep enumeration order (stable)
+    top = heapq.nlargest(k, range(len(combos)), key=totals.__getitem__)
+    return [
+        _score_from_tables(tables, combos[i], overlay_boost=boosts[i] if boosts else 0.0)
+        for i in top
+    ]
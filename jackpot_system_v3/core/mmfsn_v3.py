@@ -1,10 +1,13 @@
 # core/mmfsn_v3.py
 
+import copy
 import json
+import os
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Tuple, Optional
+from threading import Lock
+from typing import Dict, Any, Iterable, Iterator, List, Tuple, Optional
 
 
 @dataclass
@@ -23,22 +26,111 @@ def _get_root() -> Path:
     return Path(__file__).resolve().parents[1]
 
 
+def _profile_dir(root: Optional[Path] = None) -> Path:
+    if root is None:
+        root = _get_root()
+    return root / "data" / "mmfsn_profiles"
+
+
+# ----------------------------------------------------------------
+# Profile registry
+#
+# Parsed profiles keyed by file path, tagged with the file's
+# (mtime_ns, size).  A lookup is one stat(); the file is only re-read
+# when it changed on disk or was explicitly invalidated (subscribers_sync
+# writes, admin prune).  Callers always get their own copy.
+# ----------------------------------------------------------------
+_PROFILE_CACHE: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+_PROFILE_LOCK = Lock()
+
+
+def load_profile_file(path: Path) -> Optional[Dict[str, Any]]:
+    """
+    Parsed MMFSN profile at `path`, or None if the file does not exist.
+    Raises like json.load() on a corrupt file (nothing is cached then).
+    """
+    key = os.path.abspath(path)
+    try:
+        st = Path(path).stat()
+    except FileNotFoundError:
+        with _PROFILE_LOCK:
+            _PROFILE_CACHE.pop(key, None)
+        return None
+    sig = (st.st_mtime_ns, st.st_size)
+
+    with _PROFILE_LOCK:
+        cached = _PROFILE_CACHE.get(key)
+    if cached is None or cached[0] != sig:
+        with Path(path).open("r", encoding="utf-8") as f:
+            profile = json.load(f)
+        cached = (sig, profile)
+        with _PROFILE_LOCK:
+            _PROFILE_CACHE[key] = cached
+    return copy.deepcopy(cached[1])
+
+
+def invalidate_mmfsn_profiles(paths: Optional[Iterable[Path]] = None) -> None:
+    """Drop cached profiles for `paths` (all profiles when None)."""
+    with _PROFILE_LOCK:
+        if paths is None:
+            _PROFILE_CACHE.clear()
+            return
+        for path in paths:
+            _PROFILE_CACHE.pop(os.path.abspath(path), None)
+
+
 def load_mmfsn_profile(initials: str, root: Optional[Path] = None) -> Optional[Dict[str, Any]]:
     """
     Load MMFSN profile for a given subscriber initials.
     Looks for: data/mmfsn_profiles/<INITIALS>_mmfsn.json
     """
-    if root is None:
-        root = _get_root()
+    return load_profile_file(_profile_dir(root) / f"{initials.upper()}_mmfsn.json")
 
-    mmfsn_dir = root / "data" / "mmfsn_profiles"
-    profile_path = mmfsn_dir / f"{initials.upper()}_mmfsn.json"
 
-    if not profile_path.exists():
-        return None
-
-    with profile_path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+def resolve_subscriber_profile(
+    subscriber_id: str,
+    initials: str,
+    root: Optional[Path] = None,
+) -> Tuple[Path, Optional[Dict[str, Any]]]:
+    """
+    Subscriber UUID profile first (collision-proof), initials profile second.
+    Returns (path used, profile or None).
+    """
+    mmfsn_dir = _profile_dir(root)
+    if subscriber_id:
+        path = mmfsn_dir / f"{subscriber_id}_mmfsn.json"
+        profile = load_profile_file(path)
+        if profile is not None:
+            return path, profile
+    path = mmfsn_dir / f"{initials}_mmfsn.json"
+    return path, load_profile_file(path)
+
+
+def load_mmfsn_profiles(
+    keys: Iterable[str],
+    root: Optional[Path] = None,
+) -> Dict[str, Optional[Dict[str, Any]]]:
+    """Batch lookup: {key: profile or None} for UUID / initials keys."""
+    mmfsn_dir = _profile_dir(root)
+    return {key: load_profile_file(mmfsn_dir / f"{key}_mmfsn.json") for key in keys}
+
+
+def iter_mmfsn_profiles(
+    root: Optional[Path] = None,
+) -> Iterator[Tuple[Path, Optional[Dict[str, Any]]]]:
+    """
+    Yield (path, profile) for every *_mmfsn.json on disk.
+    profile is None when the file cannot be parsed.
+    """
+    mmfsn_dir = _profile_dir(root)
+    if not mmfsn_dir.exists():
+        return
+    paths: List[Path] = sorted(mmfsn_dir.glob("*_mmfsn.json"))
+    for path in paths:
+        try:
+            yield path, load_profile_file(path)
+        except Exception:
+            yield path, None
 
 
 def compute_mmfsn_score_for_day(
@@ -130,20 +130,44 @@ def combined_overlay_score(m, z, n, p):
 
 
 # ================================================================
-# 6. PUBLIC API
+# 6. CALENDAR TABLE
 # ================================================================
-def compute_overlays(draw_date, draw_time):
-    """
-    draw_date = 'YYYY-MM-DD'
-    draw_time = 'Midday' | 'Morning' | 'Evening' | 'Night'
-    Returns dict with all overlay fields.
-    """
+# Date-only overlay fields (moon, zodiac, numerology) precomputed once
+# for every day in the span; the session-dependent planetary hour is
+# joined at lookup time.  Dates outside the span fall back to the
+# direct calculation.
+CALENDAR_START = datetime.date(1990, 1, 1)
+CALENDAR_END = datetime.date(2035, 12, 31)
 
-    date_obj = datetime.datetime.strptime(draw_date, "%Y-%m-%d").date()
+DEFAULT_SESSIONS = ("Midday", "Evening", "Night")
 
+# 'YYYY-MM-DD' -> (moon_phase, moon_w, zodiac_sign, zodiac_w, num_code, num_w)
+_calendar_table = None
+
+
+def _day_row(date_obj):
     moon_phase, moon_w = moon_phase_from_date(date_obj)
     zodiac_sign, zodiac_w = zodiac_sign_from_date(date_obj)
     num_code, num_w = numerology_code_from_date(date_obj)
+    return (moon_phase, moon_w, zodiac_sign, zodiac_w, num_code, num_w)
+
+
+def _get_calendar_table():
+    """Build the calendar table on first use and return it."""
+    global _calendar_table
+    if _calendar_table is None:
+        table = {}
+        one_day = datetime.timedelta(days=1)
+        d = CALENDAR_START
+        while d <= CALENDAR_END:
+            table[d.isoformat()] = _day_row(d)
+            d += one_day
+        _calendar_table = table
+    return _calendar_table
+
+
+def _overlay_record(row, draw_time):
+    moon_phase, moon_w, zodiac_sign, zodiac_w, num_code, num_w = row
     planet_hour, planet_w = planetary_hour_from_time(draw_time)
 
     overlay = combined_overlay_score(moon_w, zodiac_w, num_w, planet_w)
@@ -159,3 +183,106 @@ def compute_overlays(draw_date, draw_time):
         "planetary_weight": str(planet_w),
         "overlay_score": str(overlay)
     }
+
+
+# Label vocabularies: the index is the integer code used by scans that
+# compare fingerprints against many slots at once.
+MOON_PHASES = (
+    "New Moon", "Waxing Crescent", "First Quarter", "Waxing Gibbous",
+    "Full Moon", "Waning Gibbous", "Last Quarter", "Waning Crescent",
+)
+ZODIAC_SIGNS = (
+    "Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo", "Libra",
+    "Scorpio", "Sagittarius", "Capricorn", "Aquarius", "Pisces",
+)
+PLANETARY_HOURS = (
+    "Sun Hour", "Mercury Hour", "Venus Hour", "Mars Hour", "Unknown",
+)
+
+_MOON_CODES = {label: i for i, label in enumerate(MOON_PHASES)}
+_ZODIAC_CODES = {label: i for i, label in enumerate(ZODIAC_SIGNS)}
+_HOUR_CODES = {label: i for i, label in enumerate(PLANETARY_HOURS)}
+
+
+def encode_overlay(moon_phase, planetary_hour, zodiac_sign):
+    """
+    (moon, hour, zodiac) labels -> small integer codes.
+    Missing or unrecognised labels encode as -1, which never equals a
+    real slot code.
+    """
+    return (
+        _MOON_CODES.get(moon_phase, -1),
+        _HOUR_CODES.get(planetary_hour, -1),
+        _ZODIAC_CODES.get(zodiac_sign, -1),
+    )
+
+
+def _as_date(value):
+    if isinstance(value, datetime.date):
+        return value
+    return datetime.datetime.strptime(value, "%Y-%m-%d").date()
+
+
+# ================================================================
+# 7. PUBLIC API
+# ================================================================
+def compute_overlays(draw_date, draw_time):
+    """
+    draw_date = 'YYYY-MM-DD'
+    draw_time = 'Midday' | 'Morning' | 'Evening' | 'Night'
+    Returns dict with all overlay fields.
+    """
+
+    row = _get_calendar_table().get(draw_date)
+    if row is None:
+        date_obj = datetime.datetime.strptime(draw_date, "%Y-%m-%d").date()
+        row = _day_row(date_obj)
+
+    return _overlay_record(row, draw_time)
+
+
+def compute_overlays_range(start, end, sessions=DEFAULT_SESSIONS):
+    """
+    Overlay records for every (date, session) slot from start to end
+    inclusive, ordered by date then session.
+
+    start / end = 'YYYY-MM-DD' or date objects
+    Returns list of dicts: compute_overlays() fields plus "date" and "session".
+    """
+
+    table = _get_calendar_table()
+    d = _as_date(start)
+    end_date = _as_date(end)
+    one_day = datetime.timedelta(days=1)
+
+    records = []
+    while d <= end_date:
+        ds = d.isoformat()
+        row = table.get(ds)
+        if row is None:
+            row = _day_row(d)
+        for sess in sessions:
+            rec = _overlay_record(row, sess)
+            rec["date"] = ds
+            rec["session"] = sess
+            records.append(rec)
+        d += one_day
+
+    return records
+
+
+def overlay_codes_range(start, end, sessions=DEFAULT_SESSIONS):
+    """
+    Integer-coded (moon, hour, zodiac) for every slot from start to end
+    inclusive, in the same order as compute_overlays_range().
+
+    Returns (records, codes): the overlay records and a parallel list of
+    encode_overlay() tuples.
+    """
+
+    records = compute_overlays_range(start, end, sessions)
+    codes = [
+        encode_overlay(r["moon_phase"], r["planetary_hour"], r["zodiac_sign"])
+        for r in records
+    ]
+    return records, codes
@@ -1,10 +1,13 @@
 # core/pick_engine_v3.py
 
 import hashlib
+import heapq
 import json
 import random
 import csv
-from itertools import permutations as _iterperms
+import time
+from functools import lru_cache
+from itertools import accumulate, permutations as _iterperms
 from typing import Dict, Any, List
 from pathlib import Path
 from datetime import datetime
@@ -308,7 +311,6 @@ def _extract_combo_history_dated(
     backfill_history.py, falling back to the 'date' field (M/D/YYYY format).
     Rows without a parseable date get iso_date=''.
     """
-    from datetime import datetime as _dt
     items: "List[tuple[str, str]]" = []
     for row in results:
         raw = (
@@ -333,12 +335,7 @@ def _extract_combo_history_dated(
             raw_date = str(row.get(field, "")).strip()
             if not raw_date:
                 continue
-            for fmt in ("%Y-%m-%d", "%m/%d/%Y", "%m/%d/%y"):
-                try:
-                    iso = _dt.strptime(raw_date, fmt).strftime("%Y-%m-%d")
-                    break
-                except ValueError:
-                    continue
+            iso = _normalize_iso_date(raw_date)
             if iso:
                 break
 
@@ -346,6 +343,30 @@ def _extract_combo_history_dated(
     return items
 
 
+@lru_cache(maxsize=32768)
+def _normalize_iso_date(raw_date: str) -> str:
+    """YYYY-MM-DD for a draw date in any accepted format, '' if unparseable.
+
+    History files repeat the same few thousand dates across every session
+    and every request, so the strptime work is memoized.
+    """
+    for fmt in ("%Y-%m-%d", "%m/%d/%Y", "%m/%d/%y"):
+        try:
+            return datetime.strptime(raw_date, fmt).strftime("%Y-%m-%d")
+        except ValueError:
+            continue
+    return ""
+
+
+@lru_cache(maxsize=32768)
+def _iso_ordinal(iso: str) -> "int | None":
+    """Proleptic ordinal of an ISO date string, None if it does not parse."""
+    try:
+        return datetime.strptime(iso, "%Y-%m-%d").toordinal()
+    except ValueError:
+        return None
+
+
 def _build_combo_stats(
     combos: List[str],
     *,
@@ -387,19 +408,17 @@ def _build_combo_stats(
         # Reference = most recent ISO date in the dataset
         iso_dates = [iso for _, iso in combo_dates if iso]
         if iso_dates:
-            ref_dt = _dt.strptime(max(iso_dates), "%Y-%m-%d")
+            ref_ord = _dt.strptime(max(iso_dates), "%Y-%m-%d").toordinal()
         else:
-            ref_dt = _dt.now()
+            ref_ord = _dt.now().toordinal()
 
         weighted_freq: dict = {}
         for combo, iso in combo_dates:
             if not iso:
                 w = w_older
             else:
-                try:
-                    age_days = (ref_dt - _dt.strptime(iso, "%Y-%m-%d")).days
-                except ValueError:
-                    age_days = 9999
+                iso_ord = _iso_ordinal(iso)
+                age_days = ref_ord - iso_ord if iso_ord is not None else 9999
                 if age_days <= DECAY_DAYS_RECENT:
                     w = w_90d
                 elif age_days <= DECAY_DAYS_MID:
@@ -458,6 +477,75 @@ def _build_combo_stats(
     return stats
 
 
+# Base (un-boosted) stats per session history.  Keyed by the extracted
+# (combo, date) sequence itself, so an ingested draw is a new key and the
+# next call rebuilds once; every other subscriber/session call is a lookup.
+_BASE_STATS_CACHE: Dict[tuple, Dict[str, Dict[str, float]]] = {}
+_BASE_STATS_CACHE_MAX = 32
+
+
+def _cached_base_stats(
+    combos: List[str],
+    combo_dates: "List[tuple[str, str]]",
+    decay_weights: tuple,
+) -> Dict[str, Dict[str, float]]:
+    """_build_combo_stats(combos, combo_dates=..., decay_weights=...), memoized.
+
+    The returned dict is shared — treat it as read-only.
+    """
+    key = (tuple(combos), tuple(combo_dates), tuple(decay_weights))
+    stats = _BASE_STATS_CACHE.get(key)
+    if stats is None:
+        stats = _build_combo_stats(
+            combos, combo_dates=combo_dates, decay_weights=decay_weights
+        )
+        if len(_BASE_STATS_CACHE) >= _BASE_STATS_CACHE_MAX:
+            _BASE_STATS_CACHE.clear()
+        _BASE_STATS_CACHE[key] = stats
+    return stats
+
+
+def _apply_near_miss_boost(
+    base_stats: Dict[str, Dict[str, float]],
+    near_miss_neighbors: "set | None",
+    boost_scale: float,
+    total: int,
+) -> Dict[str, Dict[str, float]]:
+    """
+    Option B pass without re-scanning history.
+
+    Returns exactly what _build_combo_stats() would with the same
+    near_miss_neighbors/boost_scale: base scores plus boost_scale on every
+    neighbor already in base_stats, then unseen neighbors appended with
+    freq=0, gap=total, score=boost_scale.  Only the ≤ 2·n·lookback neighbor
+    entries are touched; everything else is a copy of the base row.
+    """
+    if total == 0:
+        return _build_combo_stats(
+            [], near_miss_neighbors=near_miss_neighbors, boost_scale=boost_scale
+        )
+
+    stats = {combo: dict(row) for combo, row in base_stats.items()}
+    if not near_miss_neighbors:
+        return stats
+
+    for neighbor in near_miss_neighbors:
+        row = stats.get(neighbor)
+        if row is not None:
+            row["score"] += boost_scale
+
+    if boost_scale > 0:
+        for neighbor in near_miss_neighbors:
+            if neighbor not in stats:
+                stats[neighbor] = {
+                    "freq": 0.0,
+                    "gap": float(total),
+                    "score": boost_scale,
+                }
+
+    return stats
+
+
 def _extract_near_miss_neighbors(
     history: List[Dict[str, Any]],
     combo_len: int,
@@ -544,6 +632,90 @@ def _build_positional_freq(
     return pos_freq
 
 
+# Cash4 positional tables keyed by the active EXP-08/EXP-09 knobs and the
+# history they were built from — shared by every subscriber until the
+# history changes (a new draw is a new key).
+_POS_FREQ_CACHE: Dict[tuple, List[List[float]]] = {}
+_POS_FREQ_CACHE_MAX = 32
+
+
+def _cash4_positional_freq(
+    ga_data: Dict[str, List[Dict[str, Any]]],
+    c4_combos: List[str],
+    c4_dated: "List[tuple[str, str]]",
+    decay_weights: tuple,
+) -> List[List[float]]:
+    """
+    Cash4 pos_freq for generate_picks_v3: EXP-08 session blend, EXP-09
+    recency-weighted counts, or the plain table, per the module knobs.
+    Memoized; callers get their own copy.
+    """
+    if CASH4_SESSION_SPLIT_POS:
+        _c4h_mid   = ga_data.get("cash4_mid", [])
+        _c4h_eve   = ga_data.get("cash4_eve", [])
+        _c4h_night = ga_data.get("cash4_night", [])
+        sessions = [
+            (_extract_combo_history(h, 4), len(h))
+            for h in (_c4h_mid, _c4h_eve, _c4h_night)
+        ]
+        key = ("exp08",) + tuple((tuple(c), n) for c, n in sessions)
+    elif CASH4_RECENCY_POS_WEIGHT and c4_dated:
+        key = ("exp09", tuple(c4_combos), tuple(c4_dated), tuple(decay_weights))
+    else:
+        key = ("base", tuple(c4_combos))
+
+    pos_freq = _POS_FREQ_CACHE.get(key)
+    if pos_freq is None:
+        if key[0] == "exp08":
+            # EXP-08: blend per-session positional freqs weighted by session size
+            (c_mid, n_mid), (c_eve, n_eve), (c_night, n_night) = sessions
+            _c4_pf_mid   = _build_positional_freq(c_mid,   4)
+            _c4_pf_eve   = _build_positional_freq(c_eve,   4)
+            _c4_pf_night = _build_positional_freq(c_night, 4)
+            _w_mid   = n_mid   or 1
+            _w_eve   = n_eve   or 1
+            _w_night = n_night or 1
+            _w_total = _w_mid + _w_eve + _w_night
+            # Weighted average per position
+            pos_freq = [
+                [
+                    (_c4_pf_mid[pos][d]   * _w_mid
+                     + _c4_pf_eve[pos][d]   * _w_eve
+                     + _c4_pf_night[pos][d] * _w_night) / _w_total
+                    for d in range(10)
+                ]
+                for pos in range(4)
+            ]
+        elif key[0] == "exp09":
+            # EXP-09: per-draw age weights using the same decay bands
+            # as _build_combo_stats so positional freq favours recent patterns.
+            _iso09 = [iso for _, iso in c4_dated if iso]
+            _ref09 = (
+                datetime.strptime(max(_iso09), "%Y-%m-%d") if _iso09 else datetime.now()
+            ).toordinal()
+            _w09d, _w09m, _w09o = decay_weights
+            _c4_pf_weights: List[float] = []
+            for _combo09, _iso09d in c4_dated:
+                if not _iso09d:
+                    _c4_pf_weights.append(_w09o)
+                    continue
+                _ord09 = _iso_ordinal(_iso09d)
+                _age09 = _ref09 - _ord09 if _ord09 is not None else 9999
+                if _age09 <= DECAY_DAYS_RECENT:
+                    _c4_pf_weights.append(_w09d)
+                elif _age09 <= DECAY_DAYS_MID:
+                    _c4_pf_weights.append(_w09m)
+                else:
+                    _c4_pf_weights.append(_w09o)
+            pos_freq = _build_positional_freq(c4_combos, 4, weights=_c4_pf_weights)
+        else:
+            pos_freq = _build_positional_freq(c4_combos, 4)
+        if len(_POS_FREQ_CACHE) >= _POS_FREQ_CACHE_MAX:
+            _POS_FREQ_CACHE.clear()
+        _POS_FREQ_CACHE[key] = pos_freq
+    return [row[:] for row in pos_freq]
+
+
 def _positional_score(combo: str, pos_freq: List[List[float]]) -> float:
     """Score a combo string by how well its digit order matches historical
     positional frequencies.
@@ -571,61 +743,21 @@ def _positional_score(combo: str, pos_freq: List[List[float]]) -> float:
     return log_score
 
 
-def rank_cash4_straight_orderings(digits: str, session: str) -> dict:
-    """
-    Given 4 Cash4 box digits and a session, rank all unique straight orderings
-    by session-specific positional frequency.  Percentages are normalized so
-    all orderings sum to 100% — giving subscribers a clear probability view
-    of which straight arrangement is most historically aligned for that session.
-
-    Args:
-        digits  : str — 4-digit string, e.g. '3618' or '1188' (repeats OK).
-        session : str — 'midday', 'evening', or 'night' (case-insensitive).
-
-    Returns dict with:
-        rankings        — list of {rank, number, pct, label (top only)}
-        session_context — top digit per position + its historical % for session
-        total_orderings — unique permutations (≤24; fewer when digits repeat)
-    """
-    from itertools import permutations as _perms
-
-    digits = digits.strip().replace(' ', '')
-    if len(digits) != 4 or not digits.isdigit():
-        return {'valid': False, 'error': 'digits must be exactly 4 numeric characters'}
-
-    session_lower = session.strip().lower()
-    _sess_files = {
-        'midday':  'cash4_midday.json',
-        'evening': 'cash4_evening.json',
-        'night':   'cash4_night.json',
-    }
-    if session_lower not in _sess_files:
-        return {'valid': False, 'error': 'session must be midday, evening, or night'}
-
-    # Load session-specific history
-    _data_dir = Path(__file__).parent.parent / 'data' / 'ga_results'
-    _fpath = _data_dir / _sess_files[session_lower]
-    try:
-        with open(_fpath) as _f:
-            _data = json.load(_f)
-    except FileNotFoundError:
-        return {'valid': False, 'error': f'History file not found: {_fpath.name}'}
-
-    combos_sess = []
-    for row in _data:
-        raw = row.get('winning_number') or row.get('winning_numbers', '')
-        s = str(raw).strip().replace(' ', '')
-        if len(s) == 4 and s.isdigit():
-            combos_sess.append(s)
+_CASH4_SESSION_FILES = {
+    'midday':  'cash4_midday.json',
+    'evening': 'cash4_evening.json',
+    'night':   'cash4_night.json',
+}
 
-    if not combos_sess:
-        return {'valid': False, 'error': f'No history data for {session_lower}'}
+# session → {"sig": (mtime_ns, size), "pos_freq": ..., "rankings": {multiset: [...]}}
+# Rebuilt when the session file changes on disk (ingest / backfill).
+_STRAIGHT_TABLES: Dict[str, Dict[str, Any]] = {}
 
-    # Build session-specific positional frequency (already normalized 0-1)
-    pos_freq = _build_positional_freq(combos_sess, 4)
 
+def _rank_multiset(digits: str, pos_freq: List[List[float]]) -> List[Dict[str, Any]]:
+    """Ranked unique straight orderings of one 4-digit box."""
     # Generate all unique orderings (handles repeated digits — e.g. 1188 → 12 perms not 24)
-    unique_perms = list({''.join(p) for p in _perms(digits)})
+    unique_perms = list({''.join(p) for p in _iterperms(digits)})
 
     # Score each ordering: product of positional probabilities (no log — we need raw prob for normalization)
     def _prob_score(combo: str) -> float:
@@ -646,6 +778,92 @@ def rank_cash4_straight_orderings(digits: str, session: str) -> dict:
         item['rank'] = i + 1
         del item['_raw']
     ranked[0]['label'] = 'System top pick'
+    return ranked
+
+
+def _cash4_straight_table(session_lower: str) -> Dict[str, Any]:
+    """
+    Positional freq + ranked orderings for all 715 Cash4 digit multisets
+    of one session, built once per version of the session file.
+
+    Returns {'error': ...} when the file is missing or holds no Cash4 draws.
+    """
+    from itertools import combinations_with_replacement as _cwr
+
+    _data_dir = Path(__file__).parent.parent / 'data' / 'ga_results'
+    _fpath = _data_dir / _CASH4_SESSION_FILES[session_lower]
+    try:
+        st = _fpath.stat()
+    except FileNotFoundError:
+        return {'error': f'History file not found: {_fpath.name}'}
+    sig = (st.st_mtime_ns, st.st_size)
+
+    cached = _STRAIGHT_TABLES.get(session_lower)
+    if cached is not None and cached['sig'] == sig:
+        return cached
+
+    try:
+        with open(_fpath) as _f:
+            _data = json.load(_f)
+    except FileNotFoundError:
+        return {'error': f'History file not found: {_fpath.name}'}
+
+    combos_sess = []
+    for row in _data:
+        raw = row.get('winning_number') or row.get('winning_numbers', '')
+        s = str(raw).strip().replace(' ', '')
+        if len(s) == 4 and s.isdigit():
+            combos_sess.append(s)
+
+    if not combos_sess:
+        table = {'sig': sig, 'error': f'No history data for {session_lower}'}
+    else:
+        # Build session-specific positional frequency (already normalized 0-1)
+        pos_freq = _build_positional_freq(combos_sess, 4)
+        table = {
+            'sig': sig,
+            'pos_freq': pos_freq,
+            'rankings': {
+                ''.join(ms): _rank_multiset(''.join(ms), pos_freq)
+                for ms in _cwr('0123456789', 4)
+            },
+        }
+    _STRAIGHT_TABLES[session_lower] = table
+    return table
+
+
+def rank_cash4_straight_orderings(digits: str, session: str) -> dict:
+    """
+    Given 4 Cash4 box digits and a session, rank all unique straight orderings
+    by session-specific positional frequency.  Percentages are normalized so
+    all orderings sum to 100% — giving subscribers a clear probability view
+    of which straight arrangement is most historically aligned for that session.
+
+    Rankings come from a per-session table covering every digit multiset,
+    rebuilt only when the session history file changes.
+
+    Args:
+        digits  : str — 4-digit string, e.g. '3618' or '1188' (repeats OK).
+        session : str — 'midday', 'evening', or 'night' (case-insensitive).
+
+    Returns dict with:
+        rankings        — list of {rank, number, pct, label (top only)}
+        session_context — top digit per position + its historical % for session
+        total_orderings — unique permutations (≤24; fewer when digits repeat)
+    """
+    digits = digits.strip().replace(' ', '')
+    if len(digits) != 4 or not digits.isdigit():
+        return {'valid': False, 'error': 'digits must be exactly 4 numeric characters'}
+
+    session_lower = session.strip().lower()
+    if session_lower not in _CASH4_SESSION_FILES:
+        return {'valid': False, 'error': 'session must be midday, evening, or night'}
+
+    table = _cash4_straight_table(session_lower)
+    if 'error' in table:
+        return {'valid': False, 'error': table['error']}
+    pos_freq = table['pos_freq']
+    ranked = [dict(item) for item in table['rankings'][''.join(sorted(digits))]]
 
     # Session context — which digit dominates each position and by how much
     session_context = []
@@ -676,6 +894,23 @@ def rank_cash4_straight_orderings(digits: str, session: str) -> dict:
     }
 
 
+# Optional stage-timing hook, called as observer(stage, seconds) after the
+# signal-family and near-miss steps.  api_server installs its metrics
+# recorder here; with no observer the cost is one global lookup.
+_stage_observer = None
+
+
+def set_stage_observer(observer) -> None:
+    """Install (or clear, with None) the stage-timing observer."""
+    global _stage_observer
+    _stage_observer = observer
+
+
+def _observe_stage(stage: str, started: float) -> None:
+    if _stage_observer is not None:
+        _stage_observer(stage, time.perf_counter() - started)
+
+
 def _generate_signal_family(
     primary: str,
     stats: Dict[str, Dict[str, float]],
@@ -699,13 +934,17 @@ def _generate_signal_family(
     Result is deduplicated and ordered: stats-ranked combos first, then extras.
     This gives ~30-50 valid variants so 999 subscribers spread across them
     (≈ 20-33 subscribers per pick instead of 999 on one pick).
+
+    Phase 1 uses a top-k heap rather than a full sort.  heapq.nlargest() is
+    defined as sorted(..., reverse=True)[:n], so equal scores keep stats
+    insertion order exactly as the full sort did.
     """
-    ranked = sorted(stats.items(), key=lambda x: x[1]["score"], reverse=True)
+    ranked = heapq.nlargest(top_pool, stats.items(), key=lambda x: x[1]["score"])
     family: List[str] = []
     seen: set = set()
 
     # Phase 1: top stats combos
-    for combo, _ in ranked[:top_pool]:
+    for combo, _ in ranked:
         if combo not in seen:
             family.append(combo)
             seen.add(combo)
@@ -755,28 +994,33 @@ def _pick_top_combos(
                             permutations inside the signal family are ranked by
                             positional frequency so straight signal is improved.
                             Pass for Cash4 (and Cash3) system-lane picks.
+
+    Tie-breaking: among equal scores the combo inserted into stats first wins,
+    matching a stable descending sort.  The seeded path only needs the top
+    combo and the top max_family_pool, so it never sorts the full table.
     """
     if not stats:
         return []
 
-    ranked = sorted(stats.items(), key=lambda x: x[1]["score"], reverse=True)
-    if not ranked:
-        return []
-
     # ── Diversified path (subscriber seed provided) ───────────────────────────
     if subscriber_seed is not None:
-        primary = ranked[0][0]  # strongest signal this session/day
+        # max() returns the first maximal item, i.e. the stable-sort head
+        _t0 = time.perf_counter()
+        primary = max(stats.items(), key=lambda x: x[1]["score"])[0]  # strongest signal this session/day
         family = _generate_signal_family(
             primary, stats,
             top_pool=max_family_pool,
             pos_freq=pos_freq,
         )
+        _observe_stage("signal_family", _t0)
         pool_size = min(len(family), max_family_pool + len(primary) * 2)  # reasonable cap
         pool = family[:max(pool_size, max_family_pool)]
         rng = random.Random(subscriber_seed)
         return rng.sample(pool, min(k, len(pool)))
 
     # ── Legacy path (no seed — used outside simulation context) ──────────────
+    # Noise is drawn in ranked order, so this path keeps the full sort.
+    ranked = sorted(stats.items(), key=lambda x: x[1]["score"], reverse=True)
     max_score = ranked[0][1]["score"]
     noise_factor = 0.15
     noisy_combos = [
@@ -929,7 +1173,50 @@ _C3_1OFF_TWO_DIGIT_PAYOUT      = 4     # exactly 2 digits are ±1 off
 _C3_1OFF_THREE_DIGIT_PAYOUT    = 8     # all 3 digits are ±1 off
 
 
-def _recommended_play(confidence_score: float, number: str = "", history: "List[str] | None" = None) -> str:
+class PlayHistory:
+    """
+    Lookup tables over a combo history for _recommended_play().
+
+    Built once per history list (O(n)) so each play recommendation is a few
+    dict/set lookups instead of a scan of the full history:
+      front_counts / back_counts — count of each leading / trailing digit pair
+                                   (≤100 entries for digit histories)
+      one_off                    — every digit string exactly 1 position away
+                                   from one of the 14 most-recent-listed draws
+    """
+
+    __slots__ = ("size", "front_counts", "back_counts", "one_off")
+
+    def __init__(self, history: "List[str] | None"):
+        history = history or []
+        self.size = len(history)
+        self.front_counts: Dict[str, int] = {}
+        self.back_counts: Dict[str, int] = {}
+        for h in history:
+            if len(h) >= 2:
+                self.front_counts[h[:2]] = self.front_counts.get(h[:2], 0) + 1
+                self.back_counts[h[-2:]] = self.back_counts.get(h[-2:], 0) + 1
+
+        self.one_off: set = set()
+        for draw in history[:14]:  # check roughly the last 7 draw-days
+            draw = str(draw).strip()
+            if len(draw) not in (3, 4) or not draw.isdigit():
+                continue
+            for pos, ch in enumerate(draw):
+                for d in "0123456789":
+                    if d != ch:
+                        self.one_off.add(draw[:pos] + d + draw[pos + 1:])
+
+    def __len__(self) -> int:
+        return self.size
+
+
+def build_play_history(history: "List[str] | None") -> PlayHistory:
+    """Precompute _recommended_play() lookups for a session/game history."""
+    return PlayHistory(history)
+
+
+def _recommended_play(confidence_score: float, number: str = "", history: "List[str] | PlayHistory | None" = None) -> str:
     """Map a normalised confidence score (0.0–1.0) to a play type recommendation.
 
         Tiers align with the PLAY_TYPE_* thresholds defined in constants above:
@@ -944,6 +1231,9 @@ def _recommended_play(confidence_score: float, number: str = "", history: "List[
         When confidence is below BOX threshold and history is provided, digit-position
         frequency is used to detect front/back pair dominance and surface FRONT_PAIR
         or BACK_PAIR instead of plain BOX.
+
+        history may be the raw combo list or a PlayHistory from build_play_history();
+        callers scoring many picks against one history should pass the latter.
     """
     _score_for_play = min(confidence_score, CONFIDENCE_PLAY_CAP_MAX) if CONFIDENCE_PLAY_CAP_ENABLED else confidence_score
 
@@ -959,22 +1249,19 @@ def _recommended_play(confidence_score: float, number: str = "", history: "List[
     # for a repeat alignment hit.  BOX does NOT pay on 1-off results; this
     # closes the product integrity gap where the engine surfaces a near-miss
     # candidate but the play type leaves the subscriber unprotected.
+    if number and history and not isinstance(history, PlayHistory):
+        history = PlayHistory(history)
+
     if number and history and len(number) in (3, 4):
-        recent = history[:14]  # check roughly the last 7 draw-days
-        for draw in recent:
-            draw = str(draw).strip()
-            if len(draw) != len(number) or not draw.isdigit() or not number.isdigit():
-                continue
-            diffs = sum(1 for a, b in zip(number, draw) if a != b)
-            if diffs == 1:
-                return "STRAIGHT+1OFF"
+        if number in history.one_off:
+            return "STRAIGHT+1OFF"
 
     # Below BOX threshold — check for pair signal if we have number + history
     if number and history and len(number) >= 3:
         front = number[:2]
         back  = number[-2:]
-        front_count = sum(1 for h in history if len(h) >= 2 and h[:2] == front)
-        back_count  = sum(1 for h in history if len(h) >= 2 and h[-2:] == back)
+        front_count = history.front_counts.get(front, 0)
+        back_count  = history.back_counts.get(back, 0)
         n = max(len(history), 1)
         front_rate = front_count / n
         back_rate  = back_count  / n
@@ -1259,108 +1546,95 @@ def _load_jackpot_history(root: Path, game: str) -> tuple:
     return white, special
 
 
-def _frequency_pick_line(white_counts, white_range, white_n,
-                         special_counts, special_range) -> str:
-    """
-    Pick a jackpot line using frequency-weighted sampling.
-    - Builds a weighted pool from the top 60% most-drawn numbers
-    - Uses random.choices (with weights) so picks vary per call
-    """
-    # ── White balls ──
-    all_whites = list(range(white_range[0], white_range[1] + 1))
-    if white_counts:
-        weights = [white_counts.get(n, 0) + 1 for n in all_whites]  # +1 floor
-        # Sample 2× needed, deduplicate, take first white_n
-        pool_size = min(len(all_whites), white_n * 4)
-        pool = []
-        seen = set()
-        attempts = 0
-        while len(pool) < white_n and attempts < 200:
-            pick = random.choices(all_whites, weights=weights, k=1)[0]
-            if pick not in seen:
-                seen.add(pick)
-                pool.append(pick)
-            attempts += 1
-        # Pad with random if needed
-        remaining = [n for n in all_whites if n not in seen]
-        while len(pool) < white_n:
-            pool.append(remaining.pop(random.randrange(len(remaining))))
-    else:
-        pool = random.sample(all_whites, white_n)
-
-    pool.sort()
-
-    # ── Special ball ──
-    all_specials = list(range(special_range[0], special_range[1] + 1))
-    if special_counts:
-        sp_weights = [special_counts.get(n, 0) + 1 for n in all_specials]
-        sp = random.choices(all_specials, weights=sp_weights, k=1)[0]
-    else:
-        sp = random.choice(all_specials)
-
-    return f"{' '.join(f'{m:02d}' for m in pool)} + {sp:02d}"
-
-
-def _zone_stratified_pick_line(white_counts, white_range, white_n,
-                                special_counts, special_range,
-                                popular_set=None) -> str:
-    """
-    Zone-stratified jackpot pick — guarantees exactly one ball per field zone.
-
-    Divides the white ball range into white_n equal zones and selects one ball
-    per zone using frequency-weighted sampling, with a 2× weight bonus for
-    non-popular numbers within each zone.
+# ================================================================
+#  BATCHED JACKPOT SAMPLER
+# ================================================================
+#  Weighted sampling without replacement for a whole candidate pool at
+#  once: one random.choices() call per zone for every line, or one
+#  pre-accumulated stream of weighted draws with duplicates rejected.
+#  Stdlib only, so a seed yields the same lines on every install.
+# ================================================================
 
-    This guarantees field_coverage = 1.0 (all zones covered), which makes
-    Grade A achievable for games where the popular cluster spans early zones
-    (e.g. MegaMillions zones 0–1 are 100% popular; random sampling can never
-    reliably reach Grade A without this stratified approach).
-    """
-    lo, hi = white_range
-    field_size = hi - lo + 1
-    zone_size = field_size / white_n
-
-    pool = []
-    seen: set = set()
 
+def _zone_bounds(lo: int, hi: int, white_n: int) -> "List[tuple[int, int]]":
+    """Index bounds [start, end) into range(lo, hi+1) for white_n equal zones."""
+    zone_size = (hi - lo + 1) / white_n
+    bounds = []
     for z in range(white_n):
         z_lo = int(lo + z * zone_size)
         z_hi = int(lo + (z + 1) * zone_size) - 1
         if z == white_n - 1:
             z_hi = hi  # last zone includes the maximum
+        bounds.append((z_lo - lo, z_hi - lo + 1))
+    return bounds
 
-        zone_balls = [b for b in range(z_lo, z_hi + 1) if b not in seen]
-        if not zone_balls:
-            continue
 
-        # Frequency weight with +1 floor; 2× bonus for non-popular numbers
-        weights = []
-        for b in zone_balls:
-            freq_w = (white_counts.get(b, 0) + 1) if white_counts else 1
-            pop_mult = 1.0 if (popular_set is None or b not in popular_set) else 0.5
-            weights.append(freq_w * pop_mult)
-
-        pick = random.choices(zone_balls, weights=weights, k=1)[0]
-        pool.append(pick)
-        seen.add(pick)
-
-    # Safety pad (should not trigger under normal conditions)
-    remaining = [b for b in range(lo, hi + 1) if b not in seen]
-    while len(pool) < white_n and remaining:
-        extra = remaining.pop(random.randrange(len(remaining)))
-        pool.append(extra)
-
-    pool.sort()
-
-    # Special ball — frequency-weighted
-    all_specials = list(range(special_range[0], special_range[1] + 1))
-    if special_counts:
-        sp_weights = [special_counts.get(n, 0) + 1 for n in all_specials]
-        sp = random.choices(all_specials, weights=sp_weights, k=1)[0]
+def sample_jackpot_lines(
+    n: int,
+    white_counts,
+    white_range,
+    white_n: int,
+    special_counts,
+    special_range,
+    *,
+    stratified: bool = False,
+    popular_set=None,
+    seed: "int | None" = None,
+) -> List[str]:
+    """
+    Draw n jackpot lines ("01 02 03 04 05 + 06") in one batch.
+
+    White balls are frequency-weighted (+1 floor) and drawn without
+    replacement.  stratified=True picks exactly one ball per field zone
+    (field_coverage = 1.0) with non-popular numbers weighted 2× over
+    popular_set members — the MegaMillions Grade A path.
+    The special ball is frequency-weighted (+1 floor).
+
+    seed makes the pool deterministic (per subscriber/day); None draws
+    fresh entropy.
+    """
+    if n <= 0:
+        return []
+    lo, hi = white_range
+    balls = list(range(lo, hi + 1))
+    white_n = min(white_n, len(balls))
+    weights = [(white_counts.get(b, 0) + 1) if white_counts else 1 for b in balls]
+    if stratified and popular_set is not None:
+        weights = [w * (0.5 if b in popular_set else 1.0) for b, w in zip(balls, weights)]
+    zones = _zone_bounds(lo, hi, white_n) if stratified else None
+    if zones and any(start >= end for start, end in zones):
+        zones = None  # field narrower than white_n — plain weighted draw
+
+    specials = list(range(special_range[0], special_range[1] + 1))
+    sp_weights = [(special_counts.get(b, 0) + 1) if special_counts else 1 for b in specials]
+
+    rng = random.Random(seed)
+    if zones:
+        columns = [
+            rng.choices(balls[start:end], cum_weights=list(accumulate(weights[start:end])), k=n)
+            for start, end in zones
+        ]
+        white_rows = [sorted(row) for row in zip(*columns)]
     else:
-        sp = random.choice(all_specials)
+        cum = list(accumulate(weights))
+        stream: List[int] = []
+        pos = 0
+        white_rows = []
+        for line in range(n):
+            row: set = set()
+            while len(row) < white_n:
+                if pos == len(stream):
+                    stream = rng.choices(balls, cum_weights=cum, k=2 * white_n * (n - line))
+                    pos = 0
+                row.add(stream[pos])
+                pos += 1
+            white_rows.append(sorted(row))
+    sp_col = rng.choices(specials, weights=sp_weights, k=n)
 
-    return f"{' '.join(f'{m:02d}' for m in pool)} + {sp:02d}"
+    return [
+        f"{' '.join(f'{m:02d}' for m in whites)} + {sp:02d}"
+        for whites, sp in zip(white_rows, sp_col)
+    ]
 
 
 # Cache loaded history so we don't re-read CSVs on every call
@@ -1372,7 +1646,7 @@ def _get_jackpot_history(root: Path, game: str):
     return _jackpot_history_cache[game]
 
 
-def generate_megamillions_picks(lines=2, root: Path = None):
+def generate_megamillions_picks(lines=2, root: Path = None, seed: "int | None" = None):
     """Generate Mega Millions picks using zone-stratified sampling.
 
     MegaMillions zones 0–1 (numbers 1–28) are 100% popular numbers, so pure
@@ -1390,22 +1664,22 @@ def generate_megamillions_picks(lines=2, root: Path = None):
     _mm_popular = frozenset(
         list(range(1, 32)) + list(range(5, 71, 5))
     )
-    return [
-        _zone_stratified_pick_line(wc, (1, 70), 5, sc, (1, 25), _mm_popular)
-        for _ in range(lines)
-    ]
+    return sample_jackpot_lines(
+        lines, wc, (1, 70), 5, sc, (1, 25),
+        stratified=True, popular_set=_mm_popular, seed=seed,
+    )
 
 
-def generate_powerball_picks(lines=2, root: Path = None):
+def generate_powerball_picks(lines=2, root: Path = None, seed: "int | None" = None):
     if root:
         wc, sc = _get_jackpot_history(root, "Powerball")
     else:
         from collections import Counter
         wc, sc = Counter(), Counter()
-    return [_frequency_pick_line(wc, (1, 69), 5, sc, (1, 26)) for _ in range(lines)]
+    return sample_jackpot_lines(lines, wc, (1, 69), 5, sc, (1, 26), seed=seed)
 
 
-def generate_millionaire_for_life_picks(lines=2, root: Path = None):
+def generate_millionaire_for_life_picks(lines=2, root: Path = None, seed: "int | None" = None):
     """Generate Millionaire For Life picks with frequency-weighted selection.
     White balls: 1-58, pick 5 | Millionaire Ball: 1-5"""
     if root:
@@ -1413,7 +1687,7 @@ def generate_millionaire_for_life_picks(lines=2, root: Path = None):
     else:
         from collections import Counter
         wc, sc = Counter(), Counter()
-    return [_frequency_pick_line(wc, (1, 58), 5, sc, (1, 5)) for _ in range(lines)]
+    return sample_jackpot_lines(lines, wc, (1, 58), 5, sc, (1, 5), seed=seed)
 
 
 
@@ -1443,13 +1717,11 @@ def generate_picks_v3(subscriber: Dict[str, Any], score_result: Any, ga_data: Di
 
     # ------------------ MMFSN ------------------
     # Look up by subscriber UUID first (collision-proof), fall back to initials
+    # (served from the in-process profile registry; re-read only on change)
+    from core.mmfsn_v3 import resolve_subscriber_profile
     _sub_id = subscriber.get("subscriber_id", "")
-    _mmfsn_dir = root / "data" / "mmfsn_profiles"
-    mmfsn_path = _mmfsn_dir / f"{_sub_id}_mmfsn.json" if _sub_id else None
-    if not mmfsn_path or not mmfsn_path.exists():
-        mmfsn_path = _mmfsn_dir / f"{initials}_mmfsn.json"
-    if mmfsn_path.exists():
-        mm = json.loads(mmfsn_path.read_text(encoding="utf-8"))
+    _, mm = resolve_subscriber_profile(_sub_id, initials, root=root)
+    if mm is not None:
         mmfsn_cash3 = mm.get("mmfsn_numbers", {}).get("Cash3", []) or []
         mmfsn_cash4 = mm.get("mmfsn_numbers", {}).get("Cash4", []) or []
     else:
@@ -1480,7 +1752,7 @@ def generate_picks_v3(subscriber: Dict[str, Any], score_result: Any, ga_data: Di
             subscriber.get("birthdate") or subscriber.get("birth_date")
             or subscriber.get("dob") or ""
         )
-        if birthdate or mmfsn_path.exists():
+        if birthdate or mm is not None:
             try:
                 from core.mmfsn_v3 import compute_mmfsn_score_for_day
                 _score, _ = compute_mmfsn_score_for_day(
@@ -1516,22 +1788,20 @@ def generate_picks_v3(subscriber: Dict[str, Any], score_result: Any, ga_data: Di
 
     # --- Option A + B: two-pass stats build for Cash3 ---
     # Pass 1: base stats with decay (no boost) — used as confidence gate for Option A
-    _stats3_base = _build_combo_stats(c3_combos, combo_dates=c3_dated, decay_weights=_decay)
+    _stats3_base = _cached_base_stats(c3_combos, c3_dated, _decay)
     # Derive ±1 neighbors of last NEAR_MISS_LOOKBACK high-confidence draws
+    _t0 = time.perf_counter()
     _c3_neighbors = _extract_near_miss_neighbors(
         cash3_history, 3,
         lookback=NEAR_MISS_LOOKBACK,
         base_stats=_stats3_base,
         min_score=MIN_SCORE_FOR_CORRECTION,
     )
-    # Pass 2: rebuild stats with correction candidates boosted (Option B)
-    stats3 = _build_combo_stats(
-        c3_combos,
-        combo_dates=c3_dated,
-        decay_weights=_decay,
-        near_miss_neighbors=_c3_neighbors,
-        boost_scale=NEAR_MISS_BOOST_SCALE,
+    # Pass 2: boost correction candidates on top of the base stats (Option B)
+    stats3 = _apply_near_miss_boost(
+        _stats3_base, _c3_neighbors, NEAR_MISS_BOOST_SCALE, len(c3_combos)
     )
+    _observe_stage("near_miss", _t0)
 
     cash3_k = CASH3_VARIANT_DEPTH + _alignment_extra_variants(
         alignment_score,
@@ -1573,9 +1843,10 @@ def generate_picks_v3(subscriber: Dict[str, Any], score_result: Any, ga_data: Di
 
     # --- Option A + B: two-pass stats build for Cash4 ---
     # Pass 1: base stats with decay (no boost)
-    _stats4_base = _build_combo_stats(c4_combos, combo_dates=c4_dated, decay_weights=_decay)
+    _stats4_base = _cached_base_stats(c4_combos, c4_dated, _decay)
     # Derive ±1 neighbors of last NEAR_MISS_LOOKBACK high-confidence draws
     # EXP-10: skip neighbor generation for Cash4 when CASH4_NEAR_MISS=False
+    _t0 = time.perf_counter()
     if CASH4_NEAR_MISS:
         _c4_neighbors = _extract_near_miss_neighbors(
             cash4_history, 4,
@@ -1585,67 +1856,17 @@ def generate_picks_v3(subscriber: Dict[str, Any], score_result: Any, ga_data: Di
         )
     else:
         _c4_neighbors = None
-    # Pass 2: rebuild stats with correction candidates boosted (Option B)
-    stats4 = _build_combo_stats(
-        c4_combos,
-        combo_dates=c4_dated,
-        decay_weights=_decay,
-        near_miss_neighbors=_c4_neighbors,
-        boost_scale=NEAR_MISS_BOOST_SCALE,
+    # Pass 2: boost correction candidates on top of the base stats (Option B)
+    stats4 = _apply_near_miss_boost(
+        _stats4_base, _c4_neighbors, NEAR_MISS_BOOST_SCALE, len(c4_combos)
     )
+    _observe_stage("near_miss", _t0)
 
     cash4_k = CASH4_VARIANT_DEPTH + _alignment_extra_variants(
         alignment_score,
         ALIGNMENT_UNLOCK_CASH4_EXTRA_MAX,
     )
-    if CASH4_SESSION_SPLIT_POS:
-        # EXP-08: blend per-session positional freqs weighted by session size
-        _c4h_mid   = ga_data.get("cash4_mid", [])
-        _c4h_eve   = ga_data.get("cash4_eve", [])
-        _c4h_night = ga_data.get("cash4_night", [])
-        _c4_pf_mid   = _build_positional_freq(_extract_combo_history(_c4h_mid,   4), 4)
-        _c4_pf_eve   = _build_positional_freq(_extract_combo_history(_c4h_eve,   4), 4)
-        _c4_pf_night = _build_positional_freq(_extract_combo_history(_c4h_night, 4), 4)
-        _w_mid   = len(_c4h_mid)   or 1
-        _w_eve   = len(_c4h_eve)   or 1
-        _w_night = len(_c4h_night) or 1
-        _w_total = _w_mid + _w_eve + _w_night
-        # Weighted average per position
-        _c4_pos_freq = [
-            [
-                (_c4_pf_mid[pos][d]   * _w_mid
-                 + _c4_pf_eve[pos][d]   * _w_eve
-                 + _c4_pf_night[pos][d] * _w_night) / _w_total
-                for d in range(10)
-            ]
-            for pos in range(4)
-        ]
-    else:
-        if CASH4_RECENCY_POS_WEIGHT and c4_dated:
-            # EXP-09: compute per-draw age weights using the same decay bands
-            # as _build_combo_stats so positional freq favours recent patterns.
-            from datetime import datetime as _dt09
-            _iso09 = [iso for _, iso in c4_dated if iso]
-            _ref09 = _dt09.strptime(max(_iso09), "%Y-%m-%d") if _iso09 else _dt09.now()
-            _w09d, _w09m, _w09o = _decay
-            _c4_pf_weights: List[float] = []
-            for _combo09, _iso09d in c4_dated:
-                if not _iso09d:
-                    _c4_pf_weights.append(_w09o)
-                    continue
-                try:
-                    _age09 = (_ref09 - _dt09.strptime(_iso09d, "%Y-%m-%d")).days
-                except ValueError:
-                    _age09 = 9999
-                if _age09 <= DECAY_DAYS_RECENT:
-                    _c4_pf_weights.append(_w09d)
-                elif _age09 <= DECAY_DAYS_MID:
-                    _c4_pf_weights.append(_w09m)
-                else:
-                    _c4_pf_weights.append(_w09o)
-            _c4_pos_freq = _build_positional_freq(c4_combos, 4, weights=_c4_pf_weights)
-        else:
-            _c4_pos_freq = _build_positional_freq(c4_combos, 4)
+    _c4_pos_freq = _cash4_positional_freq(ga_data, c4_combos, c4_dated, _decay)
     if stats4:
         system_cash4 = _pick_top_combos(
             stats4,
@@ -19,13 +19,18 @@ Caps:
 Ranked signal labels (compute_due_signal): EXTREME | STRONG | MODERATE | WATCH | COLD
 """
 
+import copy
+import hashlib
 import json
+import logging
 import math
 import os
 import sys
 from collections import defaultdict
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
+
 DATA_DIR = os.path.join(os.path.dirname(__file__), '..', 'data', 'ga_results')
 
 # Overlay engine is in the same core package
@@ -53,59 +58,223 @@ try:
         _extract_combo_history, _build_combo_stats,
         _extract_combo_history_dated, DECAY_WEIGHT_90D,
         DECAY_WEIGHT_12MO, DECAY_WEIGHT_OLDER, CASH3_EVENING_WEIGHT,
+        DECAY_DAYS_RECENT, DECAY_DAYS_MID,
     )
     _POOL_ENGINE_AVAILABLE = True
 except ImportError:
     _POOL_ENGINE_AVAILABLE = False
 
 
-def _build_pool_scores(game: str) -> tuple:
-    """Decay-weighted pool scores for all triples (Cash3) or quads (Cash4)."""
-    if not _POOL_ENGINE_AVAILABLE:
-        return {}, 1.0
+# ─────────────────────────────────────────────
+# Pool scores — lazy, persisted, incremental
+# ─────────────────────────────────────────────
+# Nothing is computed at import.  The first _get_pool_scores(game) call
+# builds a compact per-file state (row count, latest date, and the
+# position/date of every triple/quad hit) and persists it next to the data
+# keyed by a content hash of the input files.  Scores are derived from that
+# state with the same arithmetic as _build_combo_stats() over the full
+# concatenated history.  Ingest appends the new rows to the state via
+# update_pool_scores_batch() instead of rebuilding, one re-hash and cache
+# write per session file written.
+
+_POOL_CACHE_PATH = os.path.join(DATA_DIR, '..', 'pool_scores_cache.json')
+
+# game -> {'stat': signature, 'state': {...}, 'scores': {...}, 'max': float}
+_POOL_STATE: dict = {}
+
+
+def _pool_inputs(game: str) -> list:
+    """(filename, repeat multiplier) in pool concatenation order."""
+    if game == 'Cash3':
+        return [('cash3_midday.json', 1), ('cash3_evening.json', CASH3_EVENING_WEIGHT),
+                ('cash3_night.json', 1)]
+    return [('cash4_midday.json', 1), ('cash4_evening.json', 1), ('cash4_night.json', 1),
+            ('cash4_quads_historical.json', 1)]
+
+
+def _pool_stat_signature(game: str) -> list:
+    sig = []
+    for fname, _ in _pool_inputs(game):
+        try:
+            st = os.stat(os.path.join(DATA_DIR, fname))
+            sig.append([fname, st.st_mtime_ns, st.st_size])
+        except OSError:
+            sig.append([fname, None, None])
+    return sig
+
+
+def _pool_content_hash(game: str) -> str:
+    h = hashlib.sha1(game.encode())
+    for fname, mult in _pool_inputs(game):
+        fpath = os.path.join(DATA_DIR, fname)
+        h.update(f'|{fname}*{mult}|'.encode())
+        if os.path.exists(fpath):
+            with open(fpath, 'rb') as f:
+                h.update(f.read())
+    return h.hexdigest()
+
+
+def _pool_block(rows: list, n_digits: int) -> dict:
+    """Per-file state: valid row count, latest ISO date, triple/quad hit positions."""
+    entries = [{'winning_numbers': str(r.get('winning_number', '')),
+                'draw_date': r.get('draw_date', '')} for r in rows]
+    dated = _extract_combo_history_dated(entries, n_digits)
+    hits: dict = {}
+    for idx, (combo, iso) in enumerate(dated):
+        if len(set(combo)) == 1:
+            hits.setdefault(combo, []).append([idx, iso])
+    isos = [iso for _, iso in dated if iso]
+    return {'rows': len(dated), 'max_iso': max(isos) if isos else '', 'hits': hits}
+
+
+def _build_pool_state(game: str) -> dict:
     n_digits = 3 if game == 'Cash3' else 4
-    files = (
-        [('cash3_midday.json', 1), ('cash3_evening.json', CASH3_EVENING_WEIGHT), ('cash3_night.json', 1)]
-        if game == 'Cash3' else
-        [('cash4_midday.json', 1), ('cash4_evening.json', 1), ('cash4_night.json', 1)]
-    )
-    raw = []
-    for fname, mult in files:
+    blocks = {}
+    for fname, _ in _pool_inputs(game):
         fpath = os.path.join(DATA_DIR, fname)
-        if not os.path.exists(fpath):
+        rows = []
+        if os.path.exists(fpath):
+            with open(fpath) as f:
+                rows = json.load(f)
+        blocks[fname] = _pool_block(rows, n_digits)
+    return {'blocks': blocks}
+
+
+def _pool_scores_from_state(game: str, state: dict) -> tuple:
+    """
+    Decay-weighted pool scores for all triples (Cash3) or quads (Cash4).
+
+    Equivalent to _build_combo_stats() over the concatenated session files
+    (Cash3 Evening repeated CASH3_EVENING_WEIGHT times; Cash4 followed by
+    the pre-2022 cash4_quads_historical.json hits, which feed pool score
+    frequency only — not gap analysis), restricted to triples/quads.
+    """
+    if not _POOL_ENGINE_AVAILABLE:
+        return {}, 1.0
+    blocks = state['blocks']
+    isos = [b['max_iso'] for b in blocks.values() if b['max_iso']]
+    ref_dt = datetime.strptime(max(isos), '%Y-%m-%d') if isos else datetime.now()
+
+    weighted: dict = {}
+    last_index: dict = {}
+    offset = 0
+    for fname, mult in _pool_inputs(game):
+        block = blocks.get(fname)
+        if not block:
             continue
-        with open(fpath) as f:
-            rows = json.load(f)
-        entries = [{'winning_numbers': str(r.get('winning_number', '')),
-                    'draw_date': r.get('draw_date', '')} for r in rows]
-        raw += entries * mult
-
-    # For Cash4 quads: supplement with all pre-2022 historical quad hits
-    # sourced directly from GA Lottery website (all-time verified hits).
-    # These are not in our 2022-present JSON files but are real GA Cash4 events.
-    # Only used for pool score frequency calculation — not gap analysis.
-    if game == 'Cash4':
-        hist_path = os.path.join(DATA_DIR, 'cash4_quads_historical.json')
-        if os.path.exists(hist_path):
-            with open(hist_path) as f:
-                hist_rows = json.load(f)
-            hist_entries = [{'winning_numbers': str(r.get('winning_number', '')),
-                             'draw_date': r.get('draw_date', '')} for r in hist_rows]
-            raw += hist_entries
-
-    combos = _extract_combo_history(raw, n_digits)
-    dated  = _extract_combo_history_dated(raw, n_digits)
-    decay  = (DECAY_WEIGHT_90D, DECAY_WEIGHT_12MO, DECAY_WEIGHT_OLDER)
-    stats  = _build_combo_stats(combos, combo_dates=dated, decay_weights=decay)
-    triple_scores = {k: v['score'] for k, v in stats.items()
-                     if len(k) == n_digits and len(set(k)) == 1}
+        for _ in range(mult):
+            for combo, occ in block['hits'].items():
+                for idx, iso in occ:
+                    if not iso:
+                        w = DECAY_WEIGHT_OLDER
+                    else:
+                        age_days = (ref_dt - datetime.strptime(iso, '%Y-%m-%d')).days
+                        if age_days <= DECAY_DAYS_RECENT:
+                            w = DECAY_WEIGHT_90D
+                        elif age_days <= DECAY_DAYS_MID:
+                            w = DECAY_WEIGHT_12MO
+                        else:
+                            w = DECAY_WEIGHT_OLDER
+                    weighted[combo] = weighted.get(combo, 0.0) + w
+                    last_index[combo] = offset + idx
+            offset += block['rows']
+
+    total = offset
+    triple_scores = {}
+    for combo, f in weighted.items():
+        gap = total - 1 - last_index[combo]
+        recency_penalty = 0.4 if gap <= 2 else 0.0
+        recency_bonus = 0.4 if 5 <= gap <= 15 else 0.0
+        triple_scores[combo] = float(f) + recency_bonus - recency_penalty
     max_score = max(triple_scores.values()) if triple_scores else 1.0
     return triple_scores, max_score
 
 
-# Precomputed at module load — cached for lifetime of process
-_POOL_SCORES_CASH3, _MAX_POOL_CASH3 = _build_pool_scores('Cash3')
-_POOL_SCORES_CASH4, _MAX_POOL_CASH4 = _build_pool_scores('Cash4')
+def _read_persisted_pool_state(game: str):
+    try:
+        with open(_POOL_CACHE_PATH) as f:
+            return json.load(f).get(game)
+    except (OSError, ValueError):
+        return None
+
+
+def _persist_pool_state(game: str, state: dict) -> None:
+    """Best-effort write of one game's state into the shared cache file."""
+    try:
+        try:
+            with open(_POOL_CACHE_PATH) as f:
+                payload = json.load(f)
+        except (OSError, ValueError):
+            payload = {}
+        payload[game] = state
+        tmp_path = f'{_POOL_CACHE_PATH}.{os.getpid()}.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(payload, f)
+        os.replace(tmp_path, _POOL_CACHE_PATH)
+    except OSError as e:
+        logger.warning(f'[triple_due_signal] pool score cache write failed (non-fatal): {e}')
+
+
+def _get_pool_scores(game: str) -> tuple:
+    """(scores, max_score) for the game's triples/quads, built or loaded on first use."""
+    sig = _pool_stat_signature(game)
+    entry = _POOL_STATE.get(game)
+    if entry and entry['stat'] == sig:
+        return entry['scores'], entry['max']
+
+    digest = _pool_content_hash(game)
+    state = _read_persisted_pool_state(game)
+    if not state or state.get('version') != digest:
+        state = _build_pool_state(game)
+        state['version'] = digest
+        _persist_pool_state(game, state)
+
+    scores, max_score = _pool_scores_from_state(game, state)
+    _POOL_STATE[game] = {'stat': sig, 'state': state, 'scores': scores, 'max': max_score}
+    return scores, max_score
+
+
+def update_pool_scores(game: str, session: str, date_str: str, winning_number: str) -> None:
+    """Fold one newly persisted draw into the pool-score state."""
+    update_pool_scores_batch(game, [(session, date_str, winning_number)])
+
+
+def update_pool_scores_batch(game: str, rows) -> None:
+    """
+    Fold newly persisted draws — (session, date_str, winning_number) rows —
+    into the pool-score state, then re-hash and rewrite the cache file once
+    (called by ingest after each session JSON write).  If no state is loaded
+    yet there is nothing to update — the next _get_pool_scores() call builds
+    it from disk.
+    """
+    entry = _POOL_STATE.get(game)
+    if entry is None:
+        return
+    n_digits = 3 if game == 'Cash3' else 4
+    state = entry['state']
+    for session, date_str, winning_number in rows:
+        fname = f"{game.lower()}_{session.lower()}.json"
+        block = state['blocks'].get(fname)
+        if block is None:
+            _POOL_STATE.pop(game, None)
+            return
+
+        dated = _extract_combo_history_dated(
+            [{'winning_numbers': str(winning_number), 'draw_date': date_str}], n_digits)
+        if dated:
+            combo, iso = dated[0]
+            if len(set(combo)) == 1:
+                block['hits'].setdefault(combo, []).append([block['rows'], iso])
+            block['rows'] += 1
+            if iso > block['max_iso']:
+                block['max_iso'] = iso
+
+    state['version'] = _pool_content_hash(game)
+    _persist_pool_state(game, state)
+    scores, max_score = _pool_scores_from_state(game, state)
+    _POOL_STATE[game] = {'stat': _pool_stat_signature(game), 'state': state,
+                         'scores': scores, 'max': max_score}
+
 
 # GA Lottery payout tables (straight only — triples/quads have one arrangement)
 _PAYOUT = {
@@ -247,6 +416,60 @@ def _load_draws(game: str, extra_draws: list = None) -> list:
     return all_draws
 
 
+# ─────────────────────────────────────────────
+# Data-versioned memoization
+# ─────────────────────────────────────────────
+# compute_due_signal / check_number results are cached per
+# (entry point, game/number, data version, date).  The data version is the
+# (mtime_ns, size) of the game's session files plus a digest of any
+# extra_draws, so a disk write or a new in-memory ingest both produce a new
+# key.  clear_signal_cache() drops everything (called by the ingest route).
+
+_SIGNAL_CACHE: dict = {}
+_SIGNAL_CACHE_MAX = 256
+
+_GAME_FILES = {
+    'Cash3': ['cash3_midday.json', 'cash3_evening.json', 'cash3_night.json'],
+    'Cash4': ['cash4_midday.json', 'cash4_evening.json', 'cash4_night.json'],
+}
+
+
+def _data_version(game: str, extra_draws: list = None) -> tuple:
+    """Cheap fingerprint of the draw data _load_draws(game, extra_draws) would see."""
+    stats = []
+    for fname in _GAME_FILES.get(game, _GAME_FILES['Cash4']):
+        try:
+            st = os.stat(os.path.join(DATA_DIR, fname))
+            stats.append((st.st_mtime_ns, st.st_size))
+        except OSError:
+            stats.append(None)
+    extras = tuple(
+        (str(d.get('draw_date') or d.get('date', '')),
+         str(d.get('winning_numbers') or d.get('winning_number') or ''),
+         str(d.get('session') or ''))
+        for d in (extra_draws or [])
+    )
+    return tuple(stats), extras
+
+
+def _memoized(key: tuple, compute):
+    """Return a private copy of the cached result for key, computing it on a miss."""
+    # Keep the value in a local: clear_signal_cache() may run on another
+    # thread between the insert and the copy.
+    result = _SIGNAL_CACHE.get(key)
+    if result is None:
+        result = compute()
+        if len(_SIGNAL_CACHE) >= _SIGNAL_CACHE_MAX:
+            _SIGNAL_CACHE.clear()
+        _SIGNAL_CACHE[key] = result
+    return copy.deepcopy(result)
+
+
+def clear_signal_cache() -> None:
+    """Drop all memoized due-signal / check-number results."""
+    _SIGNAL_CACHE.clear()
+
+
 # ─────────────────────────────────────────────
 # Core analysis
 # ─────────────────────────────────────────────
@@ -335,6 +558,7 @@ def _build_narrative(num: str, game: str, current_gap: int, avg_gap: float,
 def compute_due_signal(game: str, extra_draws: list = None) -> dict:
     """
     Full Triples & Quads Signal analysis for Cash3 (triples) or Cash4 (quads).
+    Memoized per (game, data version, today's date).
 
     Returns
     -------
@@ -350,6 +574,12 @@ def compute_due_signal(game: str, extra_draws: list = None) -> dict:
       pool_score   — raw decay-weighted frequency score
       pool_tier    — 'HIGH' if pool_score >= 2.0, otherwise omitted (None)
     """
+    key = ('due_signal', game, _data_version(game, extra_draws),
+           datetime.now().strftime('%Y-%m-%d'))
+    return _memoized(key, lambda: _compute_due_signal(game, extra_draws))
+
+
+def _compute_due_signal(game: str, extra_draws: list = None) -> dict:
     draws = _load_draws(game, extra_draws=extra_draws)
     if not draws:
         return {'game': game, 'error': 'No draw data found', 'ranked': []}
@@ -433,9 +663,8 @@ def compute_due_signal(game: str, extra_draws: list = None) -> dict:
             session_counts[draws[h_idx]['session']] += 1
         session_affinity = max(session_counts, key=session_counts.get).capitalize() if session_counts else ''
 
-        # Pool score — decay-weighted frequency, precomputed at module load
-        _pool_dict = _POOL_SCORES_CASH3 if game == 'Cash3' else _POOL_SCORES_CASH4
-        _max_pool  = _MAX_POOL_CASH3    if game == 'Cash3' else _MAX_POOL_CASH4
+        # Pool score — decay-weighted frequency, built lazily per data version
+        _pool_dict, _max_pool = _get_pool_scores(game)
         pool_score_raw = _pool_dict.get(candidate, 0.0)
         # HIGH threshold: relative to game max so quads (max ~1.65) and triples (max ~3.25)
         # use the same proportional bar.  0.60 × max captures the clear top tier:
@@ -989,6 +1218,14 @@ def check_number(number_str: str, today: datetime = None, extra_draws: list = No
             ),
         }
 
+    key = ('check_number', num, _data_version(game, extra_draws),
+           today.strftime('%Y-%m-%d'))
+    return _memoized(key, lambda: _check_number(num, game, n_type, today, extra_draws))
+
+
+def _check_number(num: str, game: str, n_type: str, today: datetime,
+                  extra_draws: list = None) -> dict:
+    """Uncached body of check_number() for an already-validated triple/quad."""
     digit = num[0]
 
     # ── Load draws + locate hits ──────────────────────────────────────
@@ -1079,8 +1316,7 @@ def check_number(number_str: str, today: datetime = None, extra_draws: list = No
     # Primary gate: how often does this number actually appear in draw history?
     # Validated: 444 (2.0) and 999 (3.25) both hit May 15-16 2026.
     # 333 (0.5) missed May 21 2026. Pool score called both outcomes correctly.
-    _pool_dict = _POOL_SCORES_CASH3 if game == 'Cash3' else _POOL_SCORES_CASH4
-    _max_pool  = _MAX_POOL_CASH3    if game == 'Cash3' else _MAX_POOL_CASH4
+    _pool_dict, _max_pool = _get_pool_scores(game)
     pool_score_raw  = _pool_dict.get(num, 0.0)
     pool_normalized = pool_score_raw / _max_pool if _max_pool > 0 else 0.0
 
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Regression test: single-flight and response caches in api_server
+
+Exercises the Flask app through its test client: one engine run per key
+with the leader's error reaching every waiter, 503 + Retry-After when a
+waiter times out, 304 on If-None-Match, cache invalidation on ingest and on
+a shared draw-log sync, and the prediction-secret check running before a
+cached response is served.  The engine itself is replaced by a counting stub,
+and the draw log and metrics go to a temp directory.
+"""
+
+import sys
+import os
+import tempfile
+import threading
+import time
+
+_TMP = tempfile.mkdtemp(prefix="api_cache_test_")
+os.environ.update(
+    STARTUP_WARMUP="lazy",
+    WARM_CACHE_ON_INGEST="false",
+    DRAW_STATE_DB=os.path.join(_TMP, "draw_state.sqlite3"),
+    METRICS_DB=os.path.join(_TMP, "metrics.sqlite3"),
+)
+os.environ.pop("PREDICTIONS_API_SECRET", None)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import api_server as api
+
+_URL = "/api/predictions/generate/cache-test-sub"
+
+
+class _StubBuilder:
+    """Stands in for _build_predictions_body; counts runs, can block or fail."""
+
+    def __init__(self, release=None, error=None):
+        self.calls = 0
+        self.release = release
+        self.error = error
+
+    def __call__(self, subscriber_id, date_str, *args):
+        self.calls += 1
+        if self.release is not None:
+            self.release.wait(5)
+        if self.error is not None:
+            raise self.error
+        return api.jsonify({"success": True, "date": date_str,
+                            "run": self.calls}).get_data()
+
+
+def _with_builder(stub, fn):
+    original = api._build_predictions_body
+    api._build_predictions_body = stub
+    api._invalidate_prediction_cache()
+    try:
+        return fn()
+    finally:
+        api._build_predictions_body = original
+        api._invalidate_prediction_cache()
+
+
+def _post(date_str, headers=None):
+    with api.app.test_client() as client:
+        return client.post(_URL, json={"date": date_str}, headers=headers or {})
+
+
+def _concurrent_posts(n, date_str):
+    out = [None] * n
+
+    def run(i):
+        out[i] = _post(date_str)
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(n)]
+    for t in threads:
+        t.start()
+    return threads, out
+
+
+def _wait_for_waiters(key_prefix, seconds=2.0):
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        with api._INFLIGHT_LOCK:
+            if any(k[:1] == key_prefix for k in api._inflight):
+                break
+        time.sleep(0.01)
+    time.sleep(0.2)     # let the other threads reach the flight's wait()
+
+
+def test_single_flight_error_reaches_every_waiter():
+    release = threading.Event()
+    stub = _StubBuilder(release=release, error=RuntimeError("engine exploded"))
+
+    def run():
+        threads, out = _concurrent_posts(5, "2031-02-01")
+        _wait_for_waiters(("predictions",))
+        release.set()
+        for t in threads:
+            t.join(10)
+        return out
+
+    out = _with_builder(stub, run)
+    assert stub.calls == 1, stub.calls
+    assert [r.status_code for r in out] == [500] * 5, [r.status_code for r in out]
+    assert all("engine exploded" in r.get_json()["error"] for r in out)
+    print("✅ one engine run for 5 concurrent requests; its error reached all 5")
+
+
+def test_waiter_timeout_returns_503_with_retry_after():
+    release = threading.Event()
+    stub = _StubBuilder(release=release)
+    original_timeout = api._SINGLE_FLIGHT_TIMEOUT
+
+    def run():
+        threads, out = _concurrent_posts(1, "2031-02-02")
+        _wait_for_waiters(("predictions",))
+        try:
+            waiter = _post("2031-02-02")
+        finally:
+            release.set()
+            threads[0].join(10)
+        return out[0], waiter
+
+    api._SINGLE_FLIGHT_TIMEOUT = 0.05
+    try:
+        leader, waiter = _with_builder(stub, run)
+    finally:
+        api._SINGLE_FLIGHT_TIMEOUT = original_timeout
+    assert leader.status_code == 200, leader.status_code
+    assert waiter.status_code == 503, waiter.status_code
+    assert waiter.headers.get("Retry-After") == "1", dict(waiter.headers)
+    print("✅ waiter timed out with 503 and Retry-After: 1")
+
+
+def test_if_none_match_returns_304():
+    stub = _StubBuilder()
+
+    def run():
+        first = _post("2031-02-03")
+        etag = first.headers["ETag"]
+        again = _post("2031-02-03", headers={"If-None-Match": etag})
+        return first, again
+
+    first, again = _with_builder(stub, run)
+    assert first.status_code == 200 and first.headers.get("ETag")
+    assert again.status_code == 304 and again.get_data() == b"", again.status_code
+    assert again.headers.get("ETag") == first.headers["ETag"]
+    assert stub.calls == 1, stub.calls
+    print("✅ matching If-None-Match answered 304 from the cache")
+
+
+def test_ingest_invalidates_cached_predictions():
+    stub = _StubBuilder()
+    draw = {"game": "Powerball", "session": "", "date": "2031-02-04",
+            "winning_number": "01 02 03 04 05 06"}
+    original_persist = api._persist_audit_log
+    api._persist_audit_log = lambda: None      # keep data/ingest_audit.json untouched
+
+    def run():
+        _post("2031-02-04")
+        _post("2031-02-04")
+        cached_calls = stub.calls
+        [(body, status)] = api.ingest_draws([draw])
+        assert status == 200, body
+        _post("2031-02-04")
+        return cached_calls
+
+    try:
+        cached_calls = _with_builder(stub, run)
+    finally:
+        api._persist_audit_log = original_persist
+        api._ga_extra_entries["jackpot_powerball"][:] = [
+            e for e in api._ga_extra_entries["jackpot_powerball"]
+            if e["draw_date"] != draw["date"]
+        ]
+    assert cached_calls == 1, cached_calls
+    assert stub.calls == 2, stub.calls
+    print("✅ ingest invalidated the cached response")
+
+
+def test_draw_log_sync_invalidates_cached_predictions():
+    """Another worker's ingest reaches this one through the shared draw log."""
+    stub = _StubBuilder()
+    entry = {"draw_date": "2031-02-05", "winning_numbers": "123", "session": "Evening"}
+    original_interval = api._DRAW_SYNC_INTERVAL
+    api._DRAW_SYNC_INTERVAL = 0
+
+    def run():
+        _post("2031-02-05")
+        _post("2031-02-05")
+        cached_calls = stub.calls
+        # Logged and immediately pruned as already on disk: only the log
+        # sequence moves, which must still count as new data.
+        assert api._append_shared_draws([("cash3_eve", entry)], persisted={"cash3_eve"})
+        _post("2031-02-05")
+        return cached_calls
+
+    try:
+        cached_calls = _with_builder(stub, run)
+    finally:
+        api._DRAW_SYNC_INTERVAL = original_interval
+    assert cached_calls == 1, cached_calls
+    assert stub.calls == 2, stub.calls
+    print("✅ draw-log sync invalidated the cached response")
+
+
+def test_secret_checked_before_shared_cache_lookup():
+    path = "/api/triple-environment/today"
+    original_secret = api._PREDICTION_SECRET
+    api._PREDICTION_SECRET = "s3cret"
+    try:
+        # Seed the shared cache so a lookup would succeed without any work
+        with api._SHARED_CACHE_LOCK:
+            api._shared_responses["scope"] = api._shared_cache_scope()
+            api._shared_responses["entries"][(path, ())] = ("seeded", b'{"success": true}')
+        with api.app.test_client() as client:
+            denied = client.get(path)
+            allowed = client.get(path, headers={"X-Prediction-Secret": "s3cret"})
+    finally:
+        api._PREDICTION_SECRET = original_secret
+        with api._SHARED_CACHE_LOCK:
+            api._shared_responses["entries"].pop((path, ()), None)
+    assert denied.status_code == 403, denied.status_code
+    assert allowed.status_code == 200 and allowed.headers.get("ETag") == '"seeded"'
+    assert "private" in allowed.headers["Cache-Control"]
+    print("✅ cached body served only after the secret check passed")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing api_server single-flight and response caches")
+    print("=" * 50)
+    test_single_flight_error_reaches_every_waiter()
+    test_waiter_timeout_returns_503_with_retry_after()
+    test_if_none_match_returns_304()
+    test_ingest_invalidates_cached_predictions()
+    test_draw_log_sync_invalidates_cached_predictions()
+    test_secret_checked_before_shared_cache_lookup()
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Offline test: conditional + concurrent scraping in fetch_ga_results
+
+Serves the pages under fixtures/lotterypost from a local stub server that
+honours ETag / If-None-Match, then checks that the fetcher parses the pages,
+revalidates with 304s instead of re-downloading, persists its parsed-results
+cache, and bounds concurrent requests.  The fixtures are synthetic: small
+hand-written pages that mirror the lotterypost.com markup the parsers read,
+not captures of the live site.
+"""
+
+import sys
+import os
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import hashlib
+import tempfile
+from contextlib import contextmanager
+import threading
+import time
+from functools import partial
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import fetch_ga_results as fga
+import backfill_ga_results as bga
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "lotterypost")
+
+
+# ---------------------------------------------------------------------------
+# Stub server
+# ---------------------------------------------------------------------------
+class _Stub(BaseHTTPRequestHandler):
+    hits = []            # (path, status)
+    in_flight = 0
+    max_in_flight = 0
+    delay = 0.0
+    lock = threading.Lock()
+
+    def do_GET(self):
+        cls = type(self)
+        with cls.lock:
+            cls.in_flight += 1
+            cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+        try:
+            time.sleep(cls.delay)
+            name = self.path.strip("/").split("?")[0].split("/", 1)[-1]
+            fpath = os.path.join(FIXTURES, name + ".html")
+            if not os.path.exists(fpath):
+                cls.hits.append((self.path, 404))
+                self.send_error(404)
+                return
+            with open(fpath, "rb") as f:
+                body = f.read()
+            etag = '"' + hashlib.md5(body).hexdigest() + '"'
+            if self.headers.get("If-None-Match") == etag:
+                cls.hits.append((self.path, 304))
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                return
+            cls.hits.append((self.path, 200))
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("ETag", etag)
+            self.send_header("Last-Modified", "Tue, 28 Apr 2026 23:40:00 GMT")
+            self.end_headers()
+            self.wfile.write(body)
+        finally:
+            with cls.lock:
+                cls.in_flight -= 1
+
+    def log_message(self, *args):
+        pass
+
+
+_SERVER = None
+_TMP = tempfile.TemporaryDirectory()
+
+
+def _base():
+    """Base URL of the stub server, started on first use (daemon thread)."""
+    global _SERVER
+    if _SERVER is None:
+        _SERVER = ThreadingHTTPServer(("127.0.0.1", 0), _Stub)
+        threading.Thread(target=_SERVER.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{_SERVER.server_address[1]}"
+
+
+@contextmanager
+def _fetcher(name, lp_url=None):
+    """
+    Fresh fetcher state with its parsed-results cache at a new temp path
+    (and optionally _LP_URL pointed at the stub); the module's own settings
+    and page cache are restored on exit.
+    """
+    saved = (fga._CACHE_PATH, fga._LP_URL, dict(fga._PAGE_CACHE), fga._PAGE_CACHE_LOADED)
+    cache_path = os.path.join(_TMP.name, name + ".json")
+    if os.path.exists(cache_path):
+        os.remove(cache_path)
+    fga._CACHE_PATH = cache_path
+    if lp_url is not None:
+        fga._LP_URL = lp_url
+    fga._PAGE_CACHE.clear()
+    fga._PAGE_CACHE_LOADED = False
+    _Stub.hits.clear()
+    _Stub.max_in_flight = 0
+    _Stub.delay = 0.0
+    try:
+        yield
+    finally:
+        fga._CACHE_PATH, fga._LP_URL, page_cache, fga._PAGE_CACHE_LOADED = saved
+        fga._PAGE_CACHE.clear()
+        fga._PAGE_CACHE.update(page_cache)
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+def test_latest_results_conditional():
+    base = _base()
+    with _fetcher("latest", lp_url=base + "/results/ga"):
+        first = fga.fetch_latest_results()
+        assert [r["winning_number"] for r in first["cash3"]] == ["101", "507", "884"], first
+        assert [r["winning_number"] for r in first["cash4"]] == ["2290", "6013", "7745"], first
+        assert all(r["date"] == "2026-04-28" for r in first["cash3"] + first["cash4"])
+
+        second = fga.fetch_latest_results()
+        assert second == first
+        assert [s for _, s in _Stub.hits] == [200, 304], _Stub.hits
+        print("✅ fetch_latest_results parses fixture, second call revalidates with 304")
+
+        # Parsed-results cache persists across processes (simulated by a reset)
+        fga._PAGE_CACHE.clear()
+        fga._PAGE_CACHE_LOADED = False
+        _Stub.hits.clear()
+        assert fga.fetch_latest_results() == first
+        assert [s for _, s in _Stub.hits] == [304], _Stub.hits
+        print("✅ on-disk cache supplies validators + rows after restart")
+
+
+def test_concurrent_pages_bounded():
+    base = _base()
+    with _fetcher("concurrent"):
+        _Stub.delay = 0.2
+        pages = {
+            f"{base}/results/ga?copy={i}": fga._parse_lotterypost for i in range(6)
+        }
+        pages[base + "/results/missing"] = fga._parse_lotterypost
+
+        start = time.time()
+        out = fga.fetch_pages(pages, max_workers=3)
+        elapsed = time.time() - start
+
+        assert out[base + "/results/missing"] is None
+        assert all(len(out[u]) == 6 for u in pages if "copy" in u)
+        assert 1 < _Stub.max_in_flight <= 3, _Stub.max_in_flight
+        assert elapsed < 7 * _Stub.delay, elapsed
+        print(f"✅ 7 pages with max_workers=3: peak in-flight {_Stub.max_in_flight}, {elapsed:.2f}s")
+
+
+def test_backfill_pages():
+    base = _base()
+    with _fetcher("backfill"):
+        pages = {
+            base + "/results/cash3_past": partial(bga._parse_past_results, game="Cash3"),
+            base + "/results/cash4_past": partial(bga._parse_past_results, game="Cash4"),
+        }
+        out = fga.fetch_pages(pages)
+    c3 = out[base + "/results/cash3_past"]
+    c4 = out[base + "/results/cash4_past"]
+    assert len(c3) == 6 and len(c4) == 6, (c3, c4)
+    assert c3[-1] == {"game": "Cash3", "session": "night",
+                      "date": "2026-04-27", "winning_number": "096"}, c3[-1]
+    print("✅ backfill past-results fixtures parsed through the shared fetcher")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing fetch_ga_results against local stub server")
+    print("=" * 50)
+    try:
+        test_latest_results_conditional()
+        test_concurrent_pages_bounded()
+        test_backfill_pages()
+    finally:
+        if _SERVER is not None:
+            _SERVER.shutdown()
+        _TMP.cleanup()
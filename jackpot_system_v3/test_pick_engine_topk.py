@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Regression test: heap-based top-k selection in pick_engine_v3
+
+_pick_top_combos / _generate_signal_family select only the top of the
+stats table instead of sorting it.  Seeded picks must stay bit-for-bit
+identical to the original full-sort implementation, including on ties.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import random
+from itertools import permutations
+
+from core import pick_engine_v3 as pe
+
+
+# ---------------------------------------------------------------------------
+# Reference implementation (full stable sort — pre-heap behaviour)
+# ---------------------------------------------------------------------------
+def _reference_family(primary, stats, top_pool=25, pos_freq=None):
+    ranked = sorted(stats.items(), key=lambda x: x[1]["score"], reverse=True)
+    family, seen = [], set()
+    for combo, _ in ranked[:top_pool]:
+        if combo not in seen:
+            family.append(combo)
+            seen.add(combo)
+    perms = []
+    for perm in permutations(primary):
+        candidate = "".join(perm)
+        if candidate not in seen:
+            perms.append(candidate)
+            seen.add(candidate)
+    if pos_freq is not None and perms:
+        perms.sort(key=lambda c: pe._positional_score(c, pos_freq), reverse=True)
+    family.extend(perms)
+    for pos in range(len(primary)):
+        for delta in (-1, 1):
+            d = (int(primary[pos]) + delta) % 10
+            neighbor = primary[:pos] + str(d) + primary[pos + 1:]
+            if neighbor not in seen:
+                family.append(neighbor)
+                seen.add(neighbor)
+    return family
+
+
+def _reference_pick(stats, k, subscriber_seed, max_family_pool=25, pos_freq=None):
+    if not stats:
+        return []
+    ranked = sorted(stats.items(), key=lambda x: x[1]["score"], reverse=True)
+    primary = ranked[0][0]
+    family = _reference_family(primary, stats, top_pool=max_family_pool, pos_freq=pos_freq)
+    pool_size = min(len(family), max_family_pool + len(primary) * 2)
+    pool = family[:max(pool_size, max_family_pool)]
+    return random.Random(subscriber_seed).sample(pool, min(k, len(pool)))
+
+
+def _synthetic_stats(length, n, rng):
+    """Random stats with heavy score ties (quarter-point grid)."""
+    combos = rng.sample(range(10 ** length), n)
+    return {
+        str(c).zfill(length): {"freq": 0.0, "gap": 0.0,
+                               "score": rng.randint(0, 12) * 0.25}
+        for c in combos
+    }
+
+
+def test_seeded_picks_match_full_sort():
+    rng = random.Random(20260414)
+    checked = 0
+    for length, n in ((3, 1000), (3, 40), (4, 10000), (4, 300), (4, 5)):
+        for _ in range(3):
+            stats = _synthetic_stats(length, n, rng)
+            combos = list(stats)
+            pos_freq = pe._build_positional_freq(combos, length)
+            for seed in rng.sample(range(2 ** 32), 10):
+                for k in (1, 2, 4):
+                    for pf in (None, pos_freq):
+                        got = pe._pick_top_combos(stats, k, subscriber_seed=seed, pos_freq=pf)
+                        want = _reference_pick(stats, k, seed, pos_freq=pf)
+                        assert got == want, (length, n, seed, k)
+                        checked += 1
+    print(f"✅ {checked} seeded selections identical to full-sort reference")
+
+
+def test_family_matches_full_sort_on_history():
+    """Real GA history (the session JSON files the API serves from)."""
+    import json
+    data_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "ga_results")
+    for fname, length in (("cash3_evening.json", 3), ("cash4_night.json", 4)):
+        fpath = os.path.join(data_dir, fname)
+        if not os.path.exists(fpath):
+            print(f"⚠️  {fname} missing, skipped")
+            continue
+        with open(fpath) as f:
+            rows = json.load(f)
+        combos = pe._extract_combo_history(rows, length)
+        stats = pe._build_combo_stats(combos)
+        primary = max(stats.items(), key=lambda x: x[1]["score"])[0]
+        for top_pool in (1, 10, 25, 60):
+            assert pe._generate_signal_family(primary, stats, top_pool=top_pool) == \
+                _reference_family(primary, stats, top_pool=top_pool), (fname, top_pool)
+        for seed in range(50):
+            assert pe._pick_top_combos(stats, 2, subscriber_seed=seed) == \
+                _reference_pick(stats, 2, seed), (fname, seed)
+        print(f"✅ {fname}: signal family + seeded picks identical ({len(stats)} combos)")
+
+
+def test_empty_stats():
+    assert pe._pick_top_combos({}, 3, subscriber_seed=1) == []
+    print("✅ empty stats → []")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing heap-based top-k selection")
+    print("=" * 50)
+    test_seeded_picks_match_full_sort()
+    test_family_matches_full_sort_on_history()
+    test_empty_stats()